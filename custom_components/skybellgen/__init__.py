@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import cast
+from dataclasses import dataclass, field
+import shutil
+import time
+from typing import TYPE_CHECKING, cast
 
-from aioskybellgen import Skybell
+from aioskybellgen import Skybell, SkybellDevice
 from aioskybellgen.exceptions import SkybellAuthenticationException, SkybellException
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
@@ -14,8 +16,27 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_USE_LOCAL_SERVER, DOMAIN
+from .const import (
+    CONF_USE_LOCAL_SERVER,
+    CONF_WARM_LIVESTREAMS,
+    CONF_WARM_START,
+    DEFAULT_WARM_START,
+    DOMAIN,
+)
+from .livestream import SkybellGo2RtcStreams, SkybellLivestreamPool
+from .media_cache import SkybellMediaCache
+from .scheduler import SkybellRequestScheduler
 from .services import async_setup_services
+from .session_store import SkybellSession, SkybellSessionStore
+from .thumbnail import SkybellThumbnailCache
+from .timing import record_phase, time_phase
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .coordinator import (
+        SkybellDeviceDataUpdateCoordinator,
+        SkybellDeviceLocalUpdateCoordinator,
+        SkybellHubDataUpdateCoordinator,
+    )
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -36,15 +57,36 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 @dataclass
-class SkybellData:
+class SkybellData:  # pylint: disable=too-many-instance-attributes
     """The SkyBell data class for a Hub config entity."""
 
     api: Skybell | None = None
-    # Ignore typing errors due to circular imports with the data coordinator
-    hub_coordinator = None  # type: ignore[assignment]
-    device_coordinators = None  # type: ignore[assignment]
+    hub_coordinator: SkybellHubDataUpdateCoordinator | None = None
+    # The devices and their coordinators, indexed by device id
+    devices: dict[str, SkybellDevice] = field(default_factory=dict)
+    data_coordinators: dict[str, SkybellDeviceDataUpdateCoordinator] = field(
+        default_factory=dict
+    )
+    local_coordinators: dict[str, SkybellDeviceLocalUpdateCoordinator] = field(
+        default_factory=dict
+    )
     known_device_ids: set[str] | None = None
     current_device_ids: set[str] | None = None
+    scheduler: SkybellRequestScheduler = field(default_factory=SkybellRequestScheduler)
+    livestream_pool: SkybellLivestreamPool | None = None
+    go2rtc_streams: SkybellGo2RtcStreams | None = None
+    media_cache: SkybellMediaCache | None = None
+    thumbnails: SkybellThumbnailCache | None = None
+    session_store: SkybellSessionStore | None = None
+    # The duration (seconds) of the setup phases
+    setup_timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def device_coordinators(
+        self,
+    ) -> list[SkybellDeviceDataUpdateCoordinator | SkybellDeviceLocalUpdateCoordinator]:
+        """Return the data and local coordinators of the devices."""
+        return [*self.data_coordinators.values(), *self.local_coordinators.values()]
 
 
 type SkybellConfigEntry = ConfigEntry[SkybellData]  # flake8: noqa: E999
@@ -64,50 +106,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: SkybellConfigEntry) -> b
         SkybellHubDataUpdateCoordinator,
     )
 
+    setup_start = time.perf_counter()
+    timings: dict[str, float] = {}
+
     # Sign into the session and get initial devices
     email = entry.data[CONF_EMAIL]
     password = entry.data[CONF_PASSWORD]
     use_local_server = entry.data.get(CONF_USE_LOCAL_SERVER, False)
-    api = Skybell(
+    session_store = SkybellSessionStore(hass, entry.unique_id)
+    with time_phase(timings, "load_session", entry.unique_id):
+        await session_store.async_load()
+    api = SkybellSession(
+        session_store,
         username=email,
         password=password,
-        disable_cache=False,
         get_devices=False,
-        cache_path=hass.config.path(f"./skybellgen_{entry.unique_id}.pickle"),
         session=async_get_clientsession(hass),
         capture_local_events=use_local_server,
     )
     try:
-        await api.async_initialize()
+        with time_phase(timings, "initialize", entry.unique_id):
+            await api.async_initialize()
     except SkybellAuthenticationException as ex:
         await api.async_delete_cache()
         raise ConfigEntryAuthFailed from ex
     except SkybellException as ex:
-        await api.async_delete_cache()
+        # Keep the session, the tokens are still valid
         raise ConfigEntryNotReady(f"Unable to connect to SkyBell service: {ex}") from ex
 
     # Assign the API and initialize the runtime data
-    entry.runtime_data = SkybellData(api=api)
+    entry.runtime_data = SkybellData(
+        api=api, session_store=session_store, setup_timings=timings
+    )
     entry.runtime_data.known_device_ids = set()
     entry.runtime_data.current_device_ids = set()
-    entry.runtime_data.device_coordinators = []  # type: ignore[assignment]
+    entry.runtime_data.livestream_pool = SkybellLivestreamPool(
+        hass, entry.options.get(CONF_WARM_LIVESTREAMS, [])
+    )
+    entry.runtime_data.media_cache = SkybellMediaCache(
+        hass, media_cache_path(hass, entry)
+    )
+    with time_phase(timings, "load_media_cache", entry.unique_id):
+        await entry.runtime_data.media_cache.async_load()
+    entry.runtime_data.thumbnails = SkybellThumbnailCache(hass)
 
     # Setup the hub coordinator
     hub_coordinator: SkybellHubDataUpdateCoordinator = SkybellHubDataUpdateCoordinator(
         hass, entry, str(entry.unique_id)
     )
-    entry.runtime_data.hub_coordinator = hub_coordinator  # type: ignore[assignment]
+    entry.runtime_data.hub_coordinator = hub_coordinator
     await hub_coordinator.async_check_update_interval(api=api)
 
-    # Get the devices and setup the device coordinators
-    await hub_coordinator.async_config_entry_first_refresh()
+    # Get the devices and setup the device coordinators. A warm start uses the
+    # persisted devices and reconciles them with the cloud once set up.
+    warm_start = entry.options.get(CONF_WARM_START, DEFAULT_WARM_START)
+    if warm_start and session_store.devices:
+        with time_phase(timings, "warm_start", entry.unique_id):
+            await hub_coordinator.async_warm_start(session_store.devices)
+    else:
+        with time_phase(timings, "first_refresh", entry.unique_id):
+            await hub_coordinator.async_config_entry_first_refresh()
 
     # Setup the platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
+    with time_phase(timings, "forward_entry_setups", entry.unique_id):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if hub_coordinator.stale:
+        entry.async_create_background_task(
+            hass,
+            hub_coordinator.async_reconcile(),
+            f"{DOMAIN}_reconcile_{entry.unique_id}",
+        )
+
+    # Reload the entry when the options change
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    record_phase(timings, "total", entry.unique_id, setup_start)
     return True
 
 
+def media_cache_path(hass: HomeAssistant, entry: SkybellConfigEntry) -> str:
+    """Return the directory of the cached activity clips and snapshots."""
+    return hass.config.path(f"skybellgen_{entry.unique_id}_media")
+
+
+async def async_update_options(hass: HomeAssistant, entry: SkybellConfigEntry) -> None:
+    """Reload the config entry when the options are updated."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: SkybellConfigEntry,
@@ -128,9 +214,18 @@ async def async_remove_config_entry_device(
 async def async_unload_entry(hass: HomeAssistant, entry: SkybellConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        api = entry.runtime_data.api
-        if api is not None:
-            await api.async_delete_cache()
-            del api
+        if (livestream_pool := entry.runtime_data.livestream_pool) is not None:
+            await livestream_pool.async_shutdown()
+        # Keep the session, so a reload doesn't log in again
+        if (session_store := entry.runtime_data.session_store) is not None:
+            await session_store.async_flush()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: SkybellConfigEntry) -> None:
+    """Remove the session and the cached media of a removed entry."""
+    await SkybellSessionStore(hass, entry.unique_id).async_remove()
+    await hass.async_add_executor_job(
+        shutil.rmtree, media_cache_path(hass, entry), True
+    )
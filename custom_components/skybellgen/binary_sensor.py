@@ -13,7 +13,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import BASIC_MOTION_GET_FUNCTION
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
 
 BINARY_SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
@@ -86,30 +86,24 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up SkyBell binary sensor."""
-    # Known device is are the device ids that have been
-    # provisioned in this instantiation of HA - the set
-    # is not retained across restarts
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in BINARY_SENSOR_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if coordinator.device.device_id not in known_device_ids:
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellBinarySensor(coordinator, entity))
 
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellBinarySensor] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellBinarySensor(coordinator, entity)
+                for entity in BINARY_SENSOR_TYPES
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -124,11 +118,17 @@ class SkybellBinarySensor(SkybellEntity, BinarySensorEntity):
         """Initialize a binary sensor for a SkyBell device."""
         super().__init__(coordinator, description)
 
+    @property
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        key = self.entity_description.key
+        return {BASIC_MOTION_GET_FUNCTION.get(key, key)}
+
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
         key = self.entity_description.key
         if key in BASIC_MOTION_GET_FUNCTION:
             key = BASIC_MOTION_GET_FUNCTION[key]
         value_fn = getattr(self._device, key)
         self._attr_is_on = bool(value_fn)
-        super()._handle_coordinator_update()
@@ -11,13 +11,14 @@ from homeassistant.components.button import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
+from .scheduler import RequestPriority
 
 BUTTON_TYPES: tuple[ButtonEntityDescription, ...] = (
     ButtonEntityDescription(
@@ -39,32 +40,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell entity."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in BUTTON_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if (coordinator.device.device_id not in known_device_ids) and (
-                    (not coordinator.device.is_readonly)
-                    or (
-                        coordinator.device.is_readonly
-                        and entity.key in CONST.ACL_EXCLUSIONS
-                    )
-                ):
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellButton(coordinator, entity))
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellButton] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellButton(coordinator, entity)
+                for entity in BUTTON_TYPES
+                if not coordinator.device.is_readonly
+                or entity.key in CONST.ACL_EXCLUSIONS
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -83,7 +77,8 @@ class SkybellButton(SkybellEntity, ButtonEntity):
         """Handle the button press."""
         if self.entity_description.key == "device_reboot":
             try:
-                await self._device.async_reboot_device()
+                async with self._async_request_slot(RequestPriority.INTERACTIVE):
+                    await self._device.async_reboot_device()
             except SkybellAccessControlException as exc:
                 raise ServiceValidationError(
                     translation_domain=DOMAIN,
@@ -1,25 +1,23 @@
-"""Camera support for the SkyBell Gen Doorbell."""
+"""Camera support for the SkyBell Gen Doorbell.
+
+The go2rtc client, ffmpeg and the AWS signer are imported when a livestream or
+activity stream is first requested, so they don't slow down the setup.
+"""
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+import importlib
 import logging
-from typing import cast
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, cast
 
-from aiohttp import ClientSession, web
+from aiohttp import ClientError, ClientSession, StreamReader, web
 from aioskybellgen.exceptions import SkybellAccessControlException, SkybellException
 from aioskybellgen.helpers import const as CONST
 from aioskybellgen.helpers.models import LiveStreamConnectionData
-from go2rtc_client import Go2RtcRestClient
-from go2rtc_client.ws import (
-    Go2RtcWsClient,
-    ReceiveMessages,
-    WebRTCAnswer,
-    WebRTCCandidate,
-    WebRTCOffer,
-    WsError,
-)
-from haffmpeg.camera import CameraMjpeg
 from homeassistant.components.camera import (
     Camera,
     CameraEntityDescription,
@@ -30,9 +28,8 @@ from homeassistant.components.camera import (
     WebRTCMessage,
     WebRTCSendMessage,
 )
-from homeassistant.components.ffmpeg import get_ffmpeg_manager
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.aiohttp_client import (
     async_aiohttp_proxy_stream,
@@ -40,13 +37,32 @@ from homeassistant.helpers.aiohttp_client import (
 )
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from sqlalchemy import String
+from homeassistant.helpers.event import async_call_later
 from webrtc_models import RTCIceCandidateInit
 
-from .const import DOMAIN
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from . import SkybellConfigEntry
+from .const import (
+    CONF_LIVESTREAM_LINGER,
+    DEFAULT_LIVESTREAM_LINGER,
+    DOMAIN,
+    KVS_RENEWAL_MARGIN,
+    KVS_RENEWAL_MIN_DELAY,
+)
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
+from .image_view import IMAGE_URL, ImageHash, async_register_image_view
 from .kvs import KVSEndpointData, parse_kvs_response
+from .livestream import (
+    SkybellGo2RtcStreams,
+    SkybellLivestreamPool,
+    SkybellLivestreamViewers,
+)
+from .media_cache import MEDIA_CLIP, MEDIA_SNAPSHOT, SkybellMediaCache
+from .scheduler import RequestPriority
+from .transcode import SkybellSharedTranscode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from go2rtc_client.ws import Go2RtcWsClient, ReceiveMessages, WebRTCOffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +84,19 @@ CAMERA_TYPES: tuple[CameraEntityDescription, ...] = (
 # Calls to the communications driver should be serialized
 PARALLEL_UPDATES = 1
 
+# The ffmpeg component of Home Assistant, which imports the ffmpeg wrapper
+FFMPEG_MODULE = "homeassistant.components.ffmpeg"
+
+# The modules that sign the livestream endpoint (see kvs.py)
+KVS_SIGNER_MODULES = ("botocore.auth", "botocore.awsrequest", "botocore.credentials")
+
+
+async def _async_import(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module in the import executor the first time it is used."""
+    if (module := sys.modules.get(name)) is None:
+        module = await hass.async_add_import_executor_job(importlib.import_module, name)
+    return module
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -76,31 +105,28 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell camera."""
 
-    known_device_ids: set[str] = set()
+    async_register_image_view(hass)
 
-    def _check_device() -> None:
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
         entities = []
-        new_device_ids: set[str] = set()
-        for entity in CAMERA_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if coordinator.device.device_id not in known_device_ids:
-                    if entity.key == CONST.SNAPSHOT:
-                        entities.append(SkybellCamera(coordinator, entity))
-                    elif entity.key == CONST.ACTIVITY:
-                        entities.append(SkybellActivityCamera(coordinator, entity))
-                    else:
-                        entities.append(SkybellLiveStreamCamera(coordinator, entity))
-                    new_device_ids.add(coordinator.device.device_id)
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            for entity in CAMERA_TYPES:
+                if entity.key == CONST.SNAPSHOT:
+                    entities.append(SkybellCamera(coordinator, entity))
+                elif entity.key == CONST.ACTIVITY:
+                    entities.append(SkybellActivityCamera(coordinator, entity))
+                else:
+                    entities.append(SkybellLiveStreamCamera(coordinator, entity))
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -115,45 +141,154 @@ class SkybellCamera(SkybellEntity, Camera):
         """Initialize a camera for a SkyBell device."""
         super().__init__(coordinator, description)
         Camera.__init__(self)
+        self._image_hash = ImageHash()
+
+    @property
+    def image_hash(self) -> str:
+        """Return the content hash of the latest camera image."""
+        return self._image_hash.get(
+            self._device.images.get(self.entity_description.key) or b""
+        )
+
+    @property
+    def entity_picture(self) -> str:
+        """Return a link to the camera image, versioned by its content."""
+        if image_hash := self.image_hash:
+            return IMAGE_URL.format(
+                self.entity_id, self.access_tokens[-1], image_hash[:16]
+            )
+        return super().entity_picture
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Get the latest camera image."""
-        return self._device.images.get(self.entity_description.key, b"")
+        image = self._device.images.get(self.entity_description.key, b"")
+        return await self._async_resize(image, width, height)
+
+    async def _async_resize(
+        self, image: bytes | None, width: int | None, height: int | None
+    ) -> bytes | None:
+        """Return the image resized to fit the requested size."""
+        entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+        if (
+            not image
+            or width is None
+            or height is None
+            or (thumbnails := entry.runtime_data.thumbnails) is None
+        ):
+            return image
+        image_hash = None
+        if image is self._device.images.get(self.entity_description.key):
+            image_hash = self.image_hash
+        return await thumbnails.async_resize(
+            self._device.device_id, image, width, height, image_hash
+        )
+
+    @property
+    def _media_cache(self) -> SkybellMediaCache | None:
+        """Return the cache of the activity clips and snapshots."""
+        entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+        return entry.runtime_data.media_cache
 
 
 class SkybellActivityCamera(SkybellCamera):
     """A camera implementation for latest SkyBell activity."""
 
-    async def handle_async_mjpeg_stream(
-        self, request: web.Request
-    ) -> web.StreamResponse | None:
-        """Generate an HTTP MJPEG stream from the latest recorded activity."""
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Get the image of the latest activity, from the cache if needed."""
+        image = self._device.images.get(CONST.ACTIVITY)
+        activity_id = self._device.latest().get(CONST.ACTIVITY_ID)
+        if not image and activity_id and (media_cache := self._media_cache):
+            image = await media_cache.async_read(
+                self._device.device_id, activity_id, MEDIA_SNAPSHOT
+            )
+        return await self._async_resize(image or b"", width, height)
+
+    def __init__(
+        self,
+        coordinator: SkybellDeviceDataUpdateCoordinator,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize a camera for a SkyBell device."""
+        super().__init__(coordinator, description)
+        # The download url of the latest activity video, by video
+        self._video_url: tuple[str, str] | None = None
+        self._transcode: SkybellSharedTranscode | None = None
+
+    async def _async_get_video_url(self, video: str) -> str:
+        """Return the download url of the activity video, resolved once."""
+        if self._video_url is not None and self._video_url[0] == video:
+            return self._video_url[1]
         try:
-            url = await self.coordinator.device.async_get_activity_video_url()
+            async with self._async_request_slot(RequestPriority.INTERACTIVE):
+                url = await self.coordinator.device.async_get_activity_video_url(video)
         except SkybellException:
             url = None
 
         if url is None or not url:
-            url = ""
             _LOGGER.warning(
                 "No video URL for entity %s on device %s",
                 self.entity_id,
                 self._device.device_id,
             )
+            return ""
+        self._video_url = (video, url)
+        return url
 
-        stream = CameraMjpeg(get_ffmpeg_manager(self.hass).binary)
-        await stream.open_camera(url, extra_cmd="-r 210")
+    @callback
+    def _async_get_transcode(self, video: str) -> SkybellSharedTranscode | None:
+        """Return the running transcode of the activity video."""
+        transcode = self._transcode
+        if transcode is None or not transcode.active or transcode.video != video:
+            return None
+        return transcode
+
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Generate an HTTP MJPEG stream from the latest recorded activity.
+
+        The clients of the same activity share the transcode of its video.
+        """
+        ffmpeg = await _async_import(self.hass, FFMPEG_MODULE)
+        activity = self._device.latest()
+        video = activity.get(CONST.VIDEO_URL, "")
+        if (transcode := self._async_get_transcode(video)) is None:
+            haffmpeg_camera = await _async_import(self.hass, "haffmpeg.camera")
+            # Transcode the prefetched clip instead of downloading it again
+            url = None
+            if (activity_id := activity.get(CONST.ACTIVITY_ID)) and (
+                media_cache := self._media_cache
+            ) is not None:
+                url = media_cache.get_path(
+                    self._device.device_id, activity_id, MEDIA_CLIP
+                )
+            url = url or await self._async_get_video_url(video)
+            # Another client may have started the transcode meanwhile
+            if (transcode := self._async_get_transcode(video)) is None:
+                transcode = self._transcode = SkybellSharedTranscode(
+                    self.hass,
+                    video,
+                    haffmpeg_camera.CameraMjpeg(
+                        ffmpeg.get_ffmpeg_manager(self.hass).binary
+                    ),
+                    url,
+                    "-r 210",
+                )
+
+        reader = transcode.subscribe()
         try:
             return await async_aiohttp_proxy_stream(
                 self.hass,
                 request,
-                await stream.get_reader(),
-                get_ffmpeg_manager(self.hass).ffmpeg_stream_content_type,
+                cast(StreamReader, reader),
+                ffmpeg.get_ffmpeg_manager(self.hass).ffmpeg_stream_content_type,
             )
         finally:
-            await stream.close()
+            transcode.unsubscribe(reader)
 
 
 class SkybellLiveStreamCamera(SkybellCamera):
@@ -168,81 +303,177 @@ class SkybellLiveStreamCamera(SkybellCamera):
 
         super().__init__(coordinator, description)
         self._kvs_ep: KVSEndpointData | None = None
+        self._cancel_renewal: CALLBACK_TYPE | None = None
+        # Serialise the starts, so a warm up and a viewer start the livestream once
+        self._start_lock = asyncio.Lock()
         self._sessions: dict[str, Go2RtcWsClient] = {}
+        self._viewers = SkybellLivestreamViewers(
+            coordinator.hass,
+            self._async_register_go2rtc_stream,
+            self._async_release_livestream,
+            cast(SkybellConfigEntry, coordinator.config_entry).options.get(
+                CONF_LIVESTREAM_LINGER, DEFAULT_LIVESTREAM_LINGER
+            ),
+        )
         self._attr_supported_features = CameraEntityFeature.STREAM
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        if (livestream_pool := self._livestream_pool) is not None:
+            self.async_on_remove(
+                livestream_pool.async_register(
+                    self._device.device_id, self._async_warm_up, self._async_cool_down
+                )
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        self._viewers.async_shutdown()
+        self._async_cancel_renewal()
+        # The pool forgets the livestream when its actions are unregistered
+        if self._kvs_ep is not None:
+            try:
+                await self._async_stop_livestream()
+            except ServiceValidationError as exc:
+                _LOGGER.warning(
+                    "Failed to stop the livestream for %s: %s", self.entity_id, exc
+                )
+        await super().async_will_remove_from_hass()
+
+    @property
+    def _livestream_pool(self) -> SkybellLivestreamPool | None:
+        """Return the warm livestream pool of the hub."""
+        entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+        return entry.runtime_data.livestream_pool
+
+    def _is_warm(self) -> bool:
+        """Return True if the livestream is kept warm."""
+        livestream_pool = self._livestream_pool
+        return livestream_pool is not None and livestream_pool.is_warm(
+            self._device.device_id
+        )
+
+    async def _async_warm_up(self) -> None:
+        """Start the livestream and register its producer with go2rtc."""
+        await self._async_register_go2rtc_stream()
+
+    async def _async_cool_down(self) -> None:
+        """Stop the warm livestream unless it is viewed."""
+        if not self._viewers.count and self._kvs_ep is not None:
+            await self._async_stop_livestream()
+
+    async def _async_release_livestream(self) -> None:
+        """Stop the livestream after the last viewer unless it is kept warm."""
+        if not self._viewers.count and not self._is_warm() and self._kvs_ep is not None:
+            await self._async_stop_livestream()
+
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Get the livestream camera image (avatar)."""
 
-        return self._device.images.get(CONST.SNAPSHOT, b"")
+        image = self._device.images.get(CONST.SNAPSHOT, b"")
+        return await self._async_resize(image, width, height)
 
     def get_serverapi_url(self) -> str:
         """Get the server API URL for the livestream."""
         _go2rtc_server_url = self.hass.data["go2rtc"]
-        if not isinstance(_go2rtc_server_url, String) and not isinstance(
-            _go2rtc_server_url, str
-        ):
+        if not isinstance(_go2rtc_server_url, str):
             _go2rtc_server_url = _go2rtc_server_url.url
         return _go2rtc_server_url
 
     def get_serverapi_session(self) -> ClientSession:
         """Get the server API Session for the livestream."""
         _go2rtc_server_session = self.hass.data["go2rtc"]
-        if not isinstance(_go2rtc_server_session, String) and not isinstance(
-            _go2rtc_server_session, str
-        ):
+        if not isinstance(_go2rtc_server_session, str):
             _go2rtc_server_session = _go2rtc_server_session.session
         else:
             _go2rtc_server_session = async_get_clientsession(self.hass)
         return _go2rtc_server_session
 
+    async def _async_get_go2rtc_streams(self) -> SkybellGo2RtcStreams:
+        """Return the go2rtc stream registry shared by the entry."""
+        go2rtc_client = await _async_import(self.hass, "go2rtc_client")
+        entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+        if entry.runtime_data.go2rtc_streams is None:
+            url = self.get_serverapi_url()
+            session = self.get_serverapi_session()
+            entry.runtime_data.go2rtc_streams = SkybellGo2RtcStreams(
+                go2rtc_client.Go2RtcRestClient(session, url), url, session
+            )
+        return entry.runtime_data.go2rtc_streams
+
     async def async_handle_async_webrtc_offer(
         self, offer_sdp: str, session_id: str, send_message: WebRTCSendMessage
     ) -> None:
         """Handle the async WebRTC offer."""
-
-        _go2rtc_server_url = self.get_serverapi_url()
-        _go2rtc_server_session = self.get_serverapi_session()
-        self._sessions[session_id] = ws_client = Go2RtcWsClient(
-            _go2rtc_server_session,
-            _go2rtc_server_url,
+        ws = await _async_import(self.hass, "go2rtc_client.ws")
+        go2rtc_streams = await self._async_get_go2rtc_streams()
+        self._sessions[session_id] = ws_client = ws.Go2RtcWsClient(
+            go2rtc_streams.session,
+            go2rtc_streams.url,
             source=self.entity_id,
         )
-        await self._async_register_go2rtc_stream()
+        await self._viewers.async_attach(session_id)
+        config = self.async_get_webrtc_client_configuration()
+        offer = ws.WebRTCOffer(offer_sdp, config.configuration.ice_servers)
+        retried = False
 
         @callback
         def on_messages(message: ReceiveMessages) -> None:
             """Handle messages."""
+            nonlocal retried
             value: WebRTCMessage
             match message:
-                case WebRTCCandidate():
+                case ws.WebRTCCandidate():
                     value = HAWebRTCCandidate(RTCIceCandidateInit(message.candidate))
-                case WebRTCAnswer():
+                case ws.WebRTCAnswer():
                     value = HAWebRTCAnswer(message.sdp)
-                case WsError():
+                case ws.WsError() if not retried:
+                    # go2rtc may have lost the stream, e.g. it restarted
+                    retried = True
+                    self.hass.async_create_task(
+                        self._async_resend_webrtc_offer(session_id, offer, send_message)
+                    )
+                    return
+                case ws.WsError():
                     value = WebRTCError("go2rtc_webrtc_offer_failed", message.error)
                     self.close_webrtc_session(session_id)
 
             send_message(value)
 
         ws_client.subscribe(on_messages)
-        config = self.async_get_webrtc_client_configuration()
-        await ws_client.send(WebRTCOffer(offer_sdp, config.configuration.ice_servers))
+        await ws_client.send(offer)
+
+    async def _async_resend_webrtc_offer(
+        self, session_id: str, offer: WebRTCOffer, send_message: WebRTCSendMessage
+    ) -> None:
+        """Register the stream in go2rtc again and resend the offer of a session."""
+        entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+        if (go2rtc_streams := entry.runtime_data.go2rtc_streams) is not None:
+            go2rtc_streams.async_invalidate(self.entity_id)
+        try:
+            await self._async_register_go2rtc_stream()
+        except (ClientError, ServiceValidationError) as exc:
+            send_message(WebRTCError("go2rtc_webrtc_offer_failed", str(exc)))
+            self.close_webrtc_session(session_id)
+            return
+        if (ws_client := self._sessions.get(session_id)) is not None:
+            await ws_client.send(offer)
 
     async def async_on_webrtc_candidate(
         self, session_id: str, candidate: RTCIceCandidateInit
     ) -> None:
         """Handle the WebRTC candidate."""
-
+        ws = await _async_import(self.hass, "go2rtc_client.ws")
         if ws_client := self._sessions.get(session_id):
             _LOGGER.debug(
                 "Received candidate: %s for session %s",
                 candidate.candidate,
                 session_id,
             )
-            await ws_client.send(WebRTCCandidate(candidate.candidate))
+            await ws_client.send(ws.WebRTCCandidate(candidate.candidate))
         else:
             _LOGGER.debug("Unknown session %s. Ignoring candidate", session_id)
 
@@ -252,9 +483,10 @@ class SkybellLiveStreamCamera(SkybellCamera):
         ws_client = self._sessions.pop(session_id, None)
         if ws_client is not None:
             self.hass.async_create_task(ws_client.close())
-        if not self._sessions:
-            self.hass.async_create_task(self._async_stop_livestream())
-            _LOGGER.debug("session %s. Created task to stop livestream", session_id)
+        self._viewers.async_detach(session_id)
+        _LOGGER.debug(
+            "session %s closed, %s viewers left", session_id, self._viewers.count
+        )
 
     def _get_go2rtc_url(self) -> str:
         """Get the WS Signed url for kvs in go2rtc format."""
@@ -277,47 +509,41 @@ class SkybellLiveStreamCamera(SkybellCamera):
     async def _async_get_webrtc_signalling(self) -> str:
         """Return the webrtc signalling channel."""
 
-        if self._kvs_ep is None:
-            await self._async_start_livestream()
+        async with self._start_lock:
+            if self._kvs_ep is None:
+                await self._async_start_livestream()
 
-        # if the kvs endpoint is expired, restart the livestream
-        expiration_ts = datetime.fromisoformat(
-            cast(KVSEndpointData, self._kvs_ep).expiration
-        )
-        if expiration_ts < datetime.now(tz=timezone.utc):
-            _LOGGER.info(
-                "Livestream endpoint expired. Restarting livestream for %s",
+            # if the kvs endpoint is expired, restart the livestream
+            expiration_ts = datetime.fromisoformat(
+                cast(KVSEndpointData, self._kvs_ep).expiration
             )
-            await self._async_stop_livestream()
-            await self._async_start_livestream()
+            if expiration_ts < datetime.now(tz=timezone.utc):
+                _LOGGER.info(
+                    "Livestream endpoint expired. Restarting livestream for %s",
+                    self.entity_id,
+                )
+                await self._async_stop_livestream()
+                await self._async_start_livestream()
 
-        ss = self._get_go2rtc_url()
+            ss = self._get_go2rtc_url()
 
         return ss
 
     async def _async_register_go2rtc_stream(self) -> None:
         """Register the stream in go2rtc if it does not already exist."""
 
-        _go2rtc_server_url = self.get_serverapi_url()
-        _go2rtc_server_sssion = self.get_serverapi_session()
-        rest_client = Go2RtcRestClient(_go2rtc_server_sssion, _go2rtc_server_url)
-
         signed_url = await self._async_get_webrtc_signalling()
-
-        streams = await rest_client.streams.list()
-        if (stream := streams.get(self.entity_id)) is None or not any(
-            signed_url == producer.url for producer in stream.producers
-        ):
-            await rest_client.streams.add(
-                self.entity_id,
-                [signed_url],
-            )
+        go2rtc_streams = await self._async_get_go2rtc_streams()
+        await go2rtc_streams.async_register(self.entity_id, signed_url)
 
     async def _async_start_livestream(self) -> None:
         """Handle starting the live stream."""
 
         try:
-            ls: LiveStreamConnectionData = await self._device.async_start_livestream()
+            async with self._async_request_slot(RequestPriority.INTERACTIVE):
+                ls: LiveStreamConnectionData = (
+                    await self._device.async_start_livestream()
+                )
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -335,13 +561,67 @@ class SkybellLiveStreamCamera(SkybellCamera):
                     "error": repr(exc),
                 },
             ) from exc
+        for name in KVS_SIGNER_MODULES:
+            await _async_import(self.hass, name)
         self._kvs_ep = parse_kvs_response(ls, self._device.device_id)
+        self._async_schedule_renewal()
+
+    @callback
+    def _async_schedule_renewal(self) -> None:
+        """Schedule the renewal of the livestream credentials."""
+        self._async_cancel_renewal()
+        # Credentials that expire within the margin don't renew in a loop
+        delay = max(
+            cast(KVSEndpointData, self._kvs_ep).renewal_delay(KVS_RENEWAL_MARGIN),
+            KVS_RENEWAL_MIN_DELAY,
+        )
+        self._cancel_renewal = async_call_later(
+            self.hass, delay, self._async_renew_livestream
+        )
+
+    @callback
+    def _async_cancel_renewal(self) -> None:
+        """Cancel the renewal of the livestream credentials."""
+        if self._cancel_renewal is not None:
+            self._cancel_renewal()
+            self._cancel_renewal = None
+
+    async def _async_renew_livestream(self, _now: datetime) -> None:
+        """Renew the livestream credentials before they expire.
+
+        The producer of the stream in go2rtc is replaced with the new signed
+        endpoint, so a viewer doesn't wait on the renewal. The livestream isn't
+        renewed without viewers unless it is kept warm. When the cloud returns
+        credentials that don't expire later, the livestream is restarted.
+        """
+        self._cancel_renewal = None
+        if not self._viewers.count and not self._is_warm():
+            return
+        expiration = cast(KVSEndpointData, self._kvs_ep).expiration_ts
+        try:
+            async with self._start_lock:
+                await self._async_start_livestream()
+                if cast(KVSEndpointData, self._kvs_ep).expiration_ts <= expiration:
+                    _LOGGER.debug(
+                        "Livestream credentials not extended. "
+                        "Restarting livestream for %s",
+                        self.entity_id,
+                    )
+                    await self._async_stop_livestream()
+                    await self._async_start_livestream()
+            await self._async_register_go2rtc_stream()
+        except (ClientError, ServiceValidationError) as exc:
+            # The livestream is restarted by the next offer once expired
+            _LOGGER.warning(
+                "Failed to renew the livestream for %s: %s", self.entity_id, exc
+            )
 
     async def _async_stop_livestream(self) -> None:
         """Handle stopping the live stream."""
 
         try:
-            await self._device.async_stop_livestream()
+            async with self._async_request_slot():
+                await self._device.async_stop_livestream()
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -360,4 +640,8 @@ class SkybellLiveStreamCamera(SkybellCamera):
                 },
             ) from exc
         finally:
+            self._async_cancel_renewal()
             self._kvs_ep = None
+            entry = cast(SkybellConfigEntry, self.coordinator.config_entry)
+            if (go2rtc_streams := entry.runtime_data.go2rtc_streams) is not None:
+                go2rtc_streams.async_invalidate(self.entity_id)
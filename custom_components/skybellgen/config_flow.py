@@ -4,17 +4,41 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import logging
-import os
 from typing import Any
 
 from aioskybellgen import Skybell
 from aioskybellgen.exceptions import SkybellAuthenticationException, SkybellException
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import voluptuous as vol
 
-from .const import CONF_USE_LOCAL_SERVER, DOMAIN
+from .const import (
+    CONF_ACTIVE_WINDOW,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCHED_REFRESH,
+    CONF_LIVESTREAM_LINGER,
+    CONF_USE_LOCAL_SERVER,
+    CONF_WARM_LIVESTREAMS,
+    CONF_WARM_START,
+    DEFAULT_ACTIVE_WINDOW,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BATCHED_REFRESH,
+    DEFAULT_LIVESTREAM_LINGER,
+    DEFAULT_WARM_START,
+    DOMAIN,
+    MAX_ACTIVE_WINDOW,
+    MAX_LIVESTREAM_LINGER,
+    MIN_ACTIVE_WINDOW,
+)
+from .session_store import SkybellSessionStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +52,14 @@ class SkybellFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     VERSION = 1
     MINOR_VERSION = 0
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> SkybellOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return SkybellOptionsFlowHandler()
+
     async def async_step_reauth(
         self, entry_data: Mapping[str, Any]
     ) -> ConfigFlowResult:
@@ -48,9 +80,9 @@ class SkybellFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             )
             if error is None:
                 entry = self._get_reauth_entry()
-                path = self.hass.config.path(f"./skybellgen_{entry.unique_id}.pickle")
-                if os.path.exists(path):
-                    os.remove(path)  # pragma: no cover
+                await SkybellSessionStore(
+                    self.hass, entry.unique_id
+                ).async_remove_auth()
                 return self.async_update_reload_and_abort(
                     entry, data_updates=user_input
                 )
@@ -82,9 +114,9 @@ class SkybellFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 await self.async_set_unique_id(user_id)
                 self._abort_if_unique_id_mismatch(reason="wrong_account")
                 entry = self._get_reconfigure_entry()
-                path = self.hass.config.path(f"./skybellgen_{entry.unique_id}.pickle")
-                if os.path.exists(path):
-                    os.remove(path)  # pragma: no cover
+                await SkybellSessionStore(
+                    self.hass, entry.unique_id
+                ).async_remove_auth()
                 return self.async_update_reload_and_abort(
                     entry,
                     data_updates=user_input,
@@ -178,3 +210,69 @@ class SkybellFlowHandler(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             msg = "unknown"
         del skybell
         return user_id, msg
+
+
+class SkybellOptionsFlowHandler(OptionsFlow):
+    """Handle the options for a SkyBell hub."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the hub options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        warm_livestreams: list[str] = options.get(CONF_WARM_LIVESTREAMS, [])
+        # The doorbells of the hub, keyed by their SkyBell device id
+        doorbells = dict.fromkeys(warm_livestreams, "")
+        for device_entry in dr.async_entries_for_config_entry(
+            dr.async_get(self.hass), self.config_entry.entry_id
+        ):
+            for identifier in device_entry.identifiers:
+                if identifier[0] == DOMAIN:
+                    doorbells[identifier[1]] = str(
+                        device_entry.name_by_user or device_entry.name
+                    )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_BATCHED_REFRESH,
+                        default=options.get(
+                            CONF_BATCHED_REFRESH, DEFAULT_BATCHED_REFRESH
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ACTIVE_WINDOW,
+                        default=options.get(CONF_ACTIVE_WINDOW, DEFAULT_ACTIVE_WINDOW),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_ACTIVE_WINDOW, max=MAX_ACTIVE_WINDOW),
+                    ),
+                    vol.Required(
+                        CONF_WARM_LIVESTREAMS, default=warm_livestreams
+                    ): cv.multi_select(doorbells),
+                    vol.Required(
+                        CONF_LIVESTREAM_LINGER,
+                        default=options.get(
+                            CONF_LIVESTREAM_LINGER, DEFAULT_LIVESTREAM_LINGER
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_LIVESTREAM_LINGER),
+                    ),
+                    vol.Required(
+                        CONF_WARM_START,
+                        default=options.get(CONF_WARM_START, DEFAULT_WARM_START),
+                    ): bool,
+                }
+            ),
+        )
@@ -10,22 +10,100 @@ from aioskybellgen.helpers.const import (
     BASIC_MOTION_NOTIFY,
     BASIC_MOTION_RECORD,
     IMAGE_QUALITY,
+    LOCATION_LAT,
+    LOCATION_LON,
+    LOCATION_PLACE,
     MOTION_FD_SENSITIVITY,
     MOTION_HMBD_SENSITIVITY,
     MOTION_PIR_SENSITIVITY,
     MOTION_SENSITIVITY,
+    NORMAL_LED,
     OUTDOOR_CHIME_VOLUME,
     SPEAKER_VOLUME,
 )
 
+CONF_ACTIVE_WINDOW = "active_window"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_BATCHED_REFRESH = "batched_refresh"
+CONF_LIVESTREAM_LINGER = "livestream_linger"
 CONF_USE_LOCAL_SERVER = "use_local_server"
+CONF_WARM_LIVESTREAMS = "warm_livestreams"
+CONF_WARM_START = "warm_start"
 DEFAULT_NAME = "SkyBellGen"
 DOMAIN: Final = "skybellgen"
 
 HUB_REFRESH_CYCLE = 3000
 DATA_REFRESH_CYCLE = 600
 LOCAL_REFRESH_CYCLE = 5
+SETTING_CONFIRM_DELAY = 5
 
+# Spread the device refreshes across the data refresh cycle
+REFRESH_JITTER = 30
+
+# Reuse the bulk device rows of the hub for a fraction of the refresh cycle,
+# so the devices refreshed late in the cycle don't merge stale rows
+BATCHED_ROWS_MAX_AGE = DATA_REFRESH_CYCLE // 10
+
+# Cap the cloud requests of a hub, the background requests leave slots free
+MAX_IN_FLIGHT_REQUESTS = 6
+MAX_PARALLEL_REFRESHES = 4
+
+# Pace the cloud requests of a hub and back off when they are throttled
+REQUEST_RATE = 2.0
+REQUEST_BURST = 20
+THROTTLE_BACKOFF = 30
+MAX_THROTTLE_BACKOFF = 900
+THROTTLE_JITTER = 0.2
+
+# Adaptive polling of the device data
+ACTIVE_REFRESH_CYCLE = 30
+IDLE_MAX_REFRESH_CYCLE = 1800
+OFFLINE_MAX_REFRESH_CYCLE = 3600
+MIN_ACTIVE_WINDOW = 30
+MAX_ACTIVE_WINDOW = 3600
+
+DEFAULT_ACTIVE_WINDOW = 300
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_BATCHED_REFRESH = False
+DEFAULT_WARM_START = False
+
+
+# Renew the livestream credentials before they expire, at most once per delay
+KVS_RENEWAL_MARGIN = 60
+KVS_RENEWAL_MIN_DELAY = 30
+
+# Lifetime of the signed livestream endpoint
+KVS_SIGNATURE_EXPIRES = 3600
+
+# Keep the livestreams of designated devices warm after an event
+MAX_WARM_LIVESTREAMS = 2
+WARM_LIVESTREAM_IDLE_TIMEOUT = 120
+
+# Keep the livestream running after the last viewer leaves
+MAX_LIVESTREAM_LINGER = 600
+DEFAULT_LIVESTREAM_LINGER = 30
+
+# Fan out the activity video transcodes to the MJPEG clients
+TRANSCODE_CHUNK_SIZE = 102400
+MAX_TRANSCODE_BACKLOG = 64
+
+# Bound the on-disk cache of the activity clips and snapshots
+MEDIA_CACHE_MAX_SIZE = 256 * 1024 * 1024
+MEDIA_CACHE_MAX_AGE = 7 * 24 * 3600
+# Bound the prefetched activity clips, which are downloaded in chunks
+MEDIA_CLIP_MAX_SIZE = 32 * 1024 * 1024
+MEDIA_CLIP_CHUNK_SIZE = 65536
+
+# Cache the resized camera images
+THUMBNAIL_CACHE_SIZE = 32
+THUMBNAIL_QUALITY = 75
+
+# Refresh the cache of the streams registered in go2rtc
+GO2RTC_STREAMS_TTL = 600
+
+# Persist the session tokens and the device state of the hub
+SESSION_STORAGE_VERSION = 1
+SESSION_SAVE_DELAY = 10
 
 IMAGE_AVATAR = "avatar"
 IMAGE_ACTIVITY = "activity"
@@ -89,6 +167,17 @@ BASIC_MOTION_GET_FUNCTION = {
     BASIC_MOTION_NOTIFY: "basic_motion_notify",
 }
 
+# The device fields of the settings that aren't named like the setting key
+SETTING_FIELDS = {
+    NORMAL_LED: {"normal_led_is_on", "led_color"},
+    LOCATION_LAT: {"location_lat"},
+    LOCATION_LON: {"location_lon"},
+    LOCATION_PLACE: {"location_place"},
+    **{key: {field} for key, field in BASIC_MOTION_GET_FUNCTION.items()},
+}
+
 SERVICE_START_LOCAL_EVENT_SERVER = "start_local_event_server"
 SERVICE_STOP_LOCAL_EVENT_SERVER = "stop_local_event_server"
+SERVICE_APPLY_SETTINGS = "apply_settings"
 SERVICE_CONF_INTERFACE = "interface"
+SERVICE_CONF_SETTINGS = "settings"
@@ -1,34 +1,110 @@
 """Data update coordinator for the SkyBell Gen integration."""
 
 import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+import copy
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import hashlib
 import logging
-from typing import cast
+import random
+from typing import Any, cast
 
-from aioskybellgen import Skybell, SkybellDevice
+from aiohttp import ClientError, ClientPayloadError
+from aioskybellgen import Skybell, SkybellDevice, utils as UTILS
 from aioskybellgen.exceptions import SkybellException
+from aioskybellgen.helpers import const as CONST
+from aioskybellgen.helpers.models import DeviceData
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from . import SkybellConfigEntry
 from .const import (
+    ACTIVE_REFRESH_CYCLE,
+    BATCHED_ROWS_MAX_AGE,
+    CONF_ACTIVE_WINDOW,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCHED_REFRESH,
     CONF_USE_LOCAL_SERVER,
     DATA_REFRESH_CYCLE,
+    DEFAULT_ACTIVE_WINDOW,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BATCHED_REFRESH,
     DOMAIN,
     HUB_REFRESH_CYCLE,
+    IDLE_MAX_REFRESH_CYCLE,
     LOCAL_REFRESH_CYCLE,
+    MEDIA_CLIP_CHUNK_SIZE,
+    MEDIA_CLIP_MAX_SIZE,
+    OFFLINE_MAX_REFRESH_CYCLE,
+    REFRESH_JITTER,
+    SETTING_CONFIRM_DELAY,
+    SETTING_FIELDS,
+    WARM_LIVESTREAM_IDLE_TIMEOUT,
 )
+from .media_cache import MEDIA_CLIP, MEDIA_SNAPSHOT, SkybellMediaCache
+from .ratelimit import SkybellThrottledException
+from .scheduler import RequestPriority
+from .session_store import SkybellSession
+from .timing import time_phase
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks a device field in the snapshot as waiting for confirmation
+UNCONFIRMED = object()
+
+
+def use_batched_refresh(entry: SkybellConfigEntry) -> bool:
+    """Return True if the device data is refreshed in bulk for the hub."""
+    return entry.options.get(CONF_BATCHED_REFRESH, DEFAULT_BATCHED_REFRESH)
+
+
+def use_adaptive_polling(entry: SkybellConfigEntry) -> bool:
+    """Return True if the device data is polled based on the device activity."""
+    return entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+
+
+def refresh_phase(device_id: str, interval: float) -> float:
+    """Return the deterministic phase (seconds) of a device in the interval."""
+    digest = hashlib.sha256(device_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 * interval
+
+
+def setting_fields(settings: Iterable[str]) -> set[str]:
+    """Return the device fields the entities of the settings are built from."""
+    fields: set[str] = set()
+    for key in settings:
+        fields |= SETTING_FIELDS.get(key, {key})
+    return fields
+
+
+def merge_device_row(device: SkybellDevice, row: DeviceData) -> None:
+    """Merge a row from the bulk devices response into the device."""
+    UTILS.update(device._device_json, row)  # pylint: disable=protected-access
+
+
+@dataclass(frozen=True, slots=True)
+class DevicesDelta:
+    """The ids of the devices added to and removed from a hub."""
+
+    added: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
+
 
 class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
-    """Data update coordinator for a SkyBell Hub."""
+    """Data update coordinator for a SkyBell Hub.
+
+    The platforms listen for the devices added to and removed from the hub,
+    so a refresh that doesn't change the devices doesn't touch the entities.
+    """
 
     def __init__(
         self,
@@ -46,6 +122,49 @@ class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
             always_update=True,
         )
         self.data = []  # type: ignore[assignment, var-annotated]
+        self._device_rows: dict[str, DeviceData] = {}
+        self._device_rows_timestamp: datetime | None = None
+        self._device_rows_lock = asyncio.Lock()
+        # True while the devices are the persisted snapshot of a warm start
+        self.stale = False
+        self._devices_listeners: dict[CALLBACK_TYPE, Callable[[DevicesDelta], None]] = (
+            {}
+        )
+
+    @callback
+    def async_add_devices_listener(
+        self, devices_callback: Callable[[DevicesDelta], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the devices added to and removed from the hub.
+
+        The listener is called at once with the current devices as added. It
+        also keeps the hub refreshing, like a data listener.
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        remove_listener = super().async_add_listener(lambda: None)
+
+        @callback
+        def remove_devices_listener() -> None:
+            """Remove the listener."""
+            remove_listener()
+            self._devices_listeners.pop(remove_devices_listener, None)
+
+        self._devices_listeners[remove_devices_listener] = devices_callback
+        devices_callback(
+            DevicesDelta(added=frozenset(entry.runtime_data.data_coordinators))
+        )
+        return remove_devices_listener
+
+    @callback
+    def async_notify_devices(
+        self, added: Iterable[str], removed: Iterable[str] = ()
+    ) -> None:
+        """Notify the listeners of the devices added to and removed from the hub."""
+        delta = DevicesDelta(added=frozenset(added), removed=frozenset(removed))
+        if not delta.added and not delta.removed:
+            return
+        for devices_callback in list(self._devices_listeners.values()):
+            devices_callback(delta)
 
     async def async_check_update_interval(self, api: Skybell) -> None:
         """Check if the update_interval needs adjusted."""
@@ -70,9 +189,13 @@ class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
         ts = api.session_refresh_timestamp
         next_update = datetime.now(timezone.utc) + cast(timedelta, self.update_interval)
         if ts is not None and (next_update >= ts):
+            entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
             try:
-                await api.async_refresh_session()
+                async with entry.runtime_data.scheduler.async_slot(None):
+                    await api.async_refresh_session()
                 _LOGGER.debug("Succesfull refresh session for %s", api.user_id)
+            except SkybellThrottledException:
+                raise
             except SkybellException as exc:
                 raise UpdateFailed(
                     translation_domain=DOMAIN,
@@ -92,32 +215,37 @@ class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
             _LOGGER.warning("SkyBellGen API isn't setup, cannot refresh session")
             return
 
-        # Check if we should refresh the tokens for the session
-        await self._async_refresh_skybell_session(api)
+        try:
+            # Check if we should refresh the tokens for the session
+            await self._async_refresh_skybell_session(api)
 
-        # Check if the update_interval needs adjusted.
-        await self.async_check_update_interval(api=api)
+            # Check if the update_interval needs adjusted.
+            await self.async_check_update_interval(api=api)
 
-        # Get devices
-        try:
-            devices: list[SkybellDevice] = await api.async_get_devices(refresh=True)
-            _LOGGER.debug("Succesfull hub retrieval %s", api.user_id)
-        except SkybellException as exc:
-            raise UpdateFailed(
-                translation_domain=DOMAIN,
-                translation_key="update_failed",
-                translation_placeholders={
-                    "error": repr(exc),
-                },
-            ) from exc
+            # Get devices
+            devices = await self._async_get_devices(entry, api)
+        except SkybellThrottledException as exc:
+            # Keep the devices and retry once the requests are allowed again.
+            # The setup can't continue without the devices.
+            if entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
+                raise UpdateFailed(
+                    translation_domain=DOMAIN,
+                    translation_key="update_failed",
+                    translation_placeholders={
+                        "error": repr(exc),
+                    },
+                ) from exc
+            _LOGGER.debug("Hub update deferred for %s: %s", api.user_id, exc)
+            self.update_interval = timedelta(seconds=exc.retry_after)
+            return
 
-        current_device_ids = set()
-        for device in devices:
-            current_device_ids.add(device.device_id)
+        entry.runtime_data.devices = {device.device_id: device for device in devices}
+        current_device_ids = set(entry.runtime_data.devices)
 
         # Remove any stale devices
         known_device_ids: set[str] = cast(set, entry.runtime_data.known_device_ids)
-        if stale_device_ids := known_device_ids - current_device_ids:
+        stale_device_ids = known_device_ids - current_device_ids
+        if stale_device_ids:
             device_registry = dr.async_get(self.hass)
             for device_id in stale_device_ids:
                 device_entry = device_registry.async_get_device(
@@ -135,23 +263,149 @@ class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
                 self.remove_device_coordinators(device_id)
         entry.runtime_data.current_device_ids = current_device_ids
         self.data = devices  # type: ignore[assignment, var-annotated]
-        await self.async_check_new_devices()
+        self.stale = False
+        if (session_store := entry.runtime_data.session_store) is not None:
+            session_store.async_save_devices(devices)
+        new_device_ids = await self.async_check_new_devices()
+        self.async_notify_devices(new_device_ids, stale_device_ids)
+
+    async def _async_get_devices(
+        self, entry: SkybellConfigEntry, api: Skybell
+    ) -> list[SkybellDevice]:
+        """Get the devices for the hub.
+
+        Exceptions UpdateFailed, SkybellThrottledException.
+        """
+        try:
+            devices: list[SkybellDevice]
+            if use_batched_refresh(entry):
+                devices = await self._async_get_devices_batched(api)
+            else:
+                async with entry.runtime_data.scheduler.async_slot(None):
+                    devices = await api.async_get_devices(refresh=True)
+            _LOGGER.debug("Succesfull hub retrieval %s", api.user_id)
+        except SkybellThrottledException:
+            raise
+        except SkybellException as exc:
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="update_failed",
+                translation_placeholders={
+                    "error": repr(exc),
+                },
+            ) from exc
+        return devices
+
+    async def async_get_device_rows(
+        self, api: Skybell, max_age: timedelta | None = None
+    ) -> dict[str, DeviceData]:
+        """Return the data for all devices from a single bulk request.
+
+        The rows are shared with the device coordinators. A new request is only
+        sent when the rows are older than max_age (or max_age isn't passed).
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        async with self._device_rows_lock:
+            now = datetime.now(timezone.utc)
+            if (
+                max_age is None
+                or self._device_rows_timestamp is None
+                or now - self._device_rows_timestamp >= max_age
+            ):
+                async with entry.runtime_data.scheduler.async_slot(None):
+                    response = await api.async_send_request(CONST.DEVICES_URL)
+                rows: dict[str, DeviceData] = {}
+                if response is not None and response:
+                    for row in response[CONST.RESPONSE_ROWS]:
+                        rows[row[CONST.DEVICE_ID]] = row
+                self._device_rows = rows
+                self._device_rows_timestamp = now
+                _LOGGER.debug("Succesfull bulk device retrieval %s", api.user_id)
+        return self._device_rows
+
+    async def _async_get_devices_batched(self, api: Skybell) -> list[SkybellDevice]:
+        """Get the devices for the hub and merge the bulk device data."""
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        rows = await self.async_get_device_rows(api)
+        # Only let the API build the device list when there are new devices.
+        # A refresh of the API device list issues requests for every device.
+        devices = await api.async_get_devices()
+        if set(rows) - {device.device_id for device in devices}:
+            async with entry.runtime_data.scheduler.async_slot(None):
+                devices = await api.async_get_devices(refresh=True)
+
+        current_devices: list[SkybellDevice] = []
+        for device in devices:
+            if (row := rows.get(device.device_id)) is not None:
+                merge_device_row(device, row)
+                current_devices.append(device)
+        return current_devices
+
+    async def async_apply_settings(
+        self, settings: dict[str, Any], device_ids: set[str]
+    ) -> None:
+        """Apply the settings to the devices.
+
+        The devices are updated concurrently, up to the limit of the request
+        scheduler. The first error is raised once all the devices are done.
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        results = await asyncio.gather(
+            *[
+                coordinator.async_apply_settings(settings)
+                for device_id, coordinator in entry.runtime_data.data_coordinators.items()
+                if device_id in device_ids
+            ],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     def remove_device_coordinators(self, device_id: str) -> None:
         """Remove the coordinator and device info from the Hub Coordinator."""
         entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
         cast(set, entry.runtime_data.known_device_ids).discard(device_id)
-        array_index: list[int] = []
-        for i, dc in enumerate(
-            cast(list, entry.runtime_data.device_coordinators)
-        ):  # type: ignore[var-annotated]
-            if dc.device.device_id == device_id:
-                array_index.append(i)
-        for index in sorted(array_index, reverse=True):
-            del cast(list, entry.runtime_data.device_coordinators)[index]
-
-    async def async_check_new_devices(self) -> None:
-        """Check for new devices and build the associated coordinators and platform entities."""
+        entry.runtime_data.data_coordinators.pop(device_id, None)
+        entry.runtime_data.local_coordinators.pop(device_id, None)
+
+    async def async_warm_start(self, snapshot: dict[str, DeviceData]) -> None:
+        """Build the device coordinators from the persisted device snapshot.
+
+        The devices are marked stale and aren't refreshed, so the setup doesn't
+        wait on the cloud. They are reconciled by async_reconcile.
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        api = cast(SkybellSession, entry.runtime_data.api)
+        devices = api.restore_devices(snapshot)
+        _LOGGER.debug("Warm start of %s with %d devices", api.user_id, len(devices))
+        entry.runtime_data.devices = {device.device_id: device for device in devices}
+        entry.runtime_data.current_device_ids = set(entry.runtime_data.devices)
+        self.data = devices  # type: ignore[assignment, var-annotated]
+        self.stale = True
+        self.async_notify_devices(await self.async_check_new_devices())
+
+    async def async_reconcile(self) -> None:
+        """Reconcile the devices of a warm start with the cloud.
+
+        The hub is refreshed first, adding and removing devices, and then the
+        stale devices are refreshed, up to the limit of the request scheduler.
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        await self.async_refresh()
+        await asyncio.gather(
+            *[
+                coordinator.async_refresh()
+                for coordinator in entry.runtime_data.data_coordinators.values()
+                if coordinator.stale
+            ]
+        )
+
+    async def async_check_new_devices(self) -> set[str]:
+        """Check for new devices and build the associated coordinators.
+
+        Return the ids of the new devices.
+        """
         entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
         known_device_ids: set[str] = cast(set, entry.runtime_data.known_device_ids)
         current_device_ids: set[str] = cast(set, entry.runtime_data.current_device_ids)
@@ -159,44 +413,54 @@ class SkybellHubDataUpdateCoordinator(DataUpdateCoordinator[None]):
         if new_device_ids:
             known_device_ids.update(new_device_ids)
             await self.async_add_coordinators(new_device_ids)
+        return new_device_ids
 
     async def async_add_coordinators(self, new_device_ids: set[str]) -> None:
         """Build the associated device coordinators."""
         entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
-        devices: list[SkybellDevice] = self.data  # type: ignore[assignment, var-annotated]
+        runtime_data = entry.runtime_data
         # Setup the device coordinators
         device_coordinators: list[
             SkybellDeviceDataUpdateCoordinator | SkybellDeviceLocalUpdateCoordinator
         ] = []
         for new_device_id in new_device_ids:
-            for device in devices:
-                if device.device_id == new_device_id:
-                    device_coordinators.append(
-                        SkybellDeviceDataUpdateCoordinator(self.hass, entry, device)
-                    )
-
-                    if entry.data.get(CONF_USE_LOCAL_SERVER, False):
-                        device_coordinators.append(
-                            SkybellDeviceLocalUpdateCoordinator(
-                                self.hass, entry, device
-                            )
-                        )
-
-        cast(list, entry.runtime_data.device_coordinators).extend(
-            device_coordinators
-        )  # type: ignore[assignment]
-
-        if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
-            await asyncio.gather(
-                *[
-                    coordinator.async_config_entry_first_refresh()
-                    for coordinator in device_coordinators
-                ]
+            device = runtime_data.devices[new_device_id]
+            data_coordinator = SkybellDeviceDataUpdateCoordinator(
+                self.hass, entry, device
             )
+            data_coordinator.stale = self.stale
+            runtime_data.data_coordinators[new_device_id] = data_coordinator
+            device_coordinators.append(data_coordinator)
 
+            if entry.data.get(CONF_USE_LOCAL_SERVER, False):
+                local_coordinator = SkybellDeviceLocalUpdateCoordinator(
+                    self.hass, entry, device
+                )
+                runtime_data.local_coordinators[new_device_id] = local_coordinator
+                device_coordinators.append(local_coordinator)
+
+        if entry.state == ConfigEntryState.SETUP_IN_PROGRESS and not self.stale:
+            with time_phase(
+                entry.runtime_data.setup_timings, "device_first_refresh", self.name
+            ):
+                await asyncio.gather(
+                    *[
+                        coordinator.async_config_entry_first_refresh()
+                        for coordinator in device_coordinators
+                    ]
+                )
 
-class SkybellDeviceDataUpdateCoordinator(DataUpdateCoordinator[None]):
-    """Data update coordinator for a SkyBell device."""
+
+class SkybellDeviceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Data update coordinator for a SkyBell device.
+
+    The data of the coordinator is a snapshot of the device fields tracked by
+    the entities. The entities pass the device fields their state is built from
+    as the listener context. An index of the fields to the listeners is used to
+    only call the listeners of the fields that changed.
+    """
+
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(
         self,
@@ -211,14 +475,227 @@ class SkybellDeviceDataUpdateCoordinator(DataUpdateCoordinator[None]):
             config_entry=config_entry,
             name=device.name,
             update_interval=timedelta(seconds=DATA_REFRESH_CYCLE),
+            always_update=False,
+            # Merge the refresh requests of setting changes into one refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=SETTING_CONFIRM_DELAY, immediate=False
+            ),
         )
         self.device = device
+        self.data: dict[str, Any] = {}
+        self.changed_fields: set[str] = set()
+        self._field_listeners: dict[str, set[CALLBACK_TYPE]] = {}
+        self._notified_update_success = self.last_update_success
+        self._phase = refresh_phase(device.device_id, DATA_REFRESH_CYCLE)
+        self._last_activity: datetime | None = None
+        self._idle_cycles = 0
+        self._latest_event_time = self.latest_event_time
+        # None until the first refresh seeds the activity known at startup
+        self._latest_activity_id: str | None = None
+        # True until the device is refreshed after a warm start
+        self.stale = False
 
-    async def _async_update_data(self) -> None:
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates of the device fields passed as context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        fields: frozenset[str] = (
+            context if isinstance(context, frozenset) else frozenset()
+        )
+        new_fields = fields - self._field_listeners.keys()
+        for field in fields:
+            self._field_listeners.setdefault(field, set()).add(update_callback)
+        self.data = {**self.data, **self._snapshot(new_fields)}
+
+        @callback
+        def remove_field_listener() -> None:
+            """Remove the listener."""
+            remove_listener()
+            for field in fields:
+                listeners = self._field_listeners.get(field, set())
+                listeners.discard(update_callback)
+                if not listeners:
+                    self._field_listeners.pop(field, None)
+
+        return remove_field_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the changed device fields.
+
+        All the listeners are updated when the availability changed.
+        """
+        if self._notified_update_success != self.last_update_success:
+            self._notified_update_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        update_callbacks: set[CALLBACK_TYPE] = set()
+        for field in self.changed_fields:
+            update_callbacks |= self._field_listeners.get(field, set())
+        for update_callback in update_callbacks:
+            update_callback()
+
+    async def async_confirm_fields(self, fields: set[str]) -> None:
+        """Confirm the device fields of a setting change with a refresh.
+
+        The refresh is debounced so several setting changes are confirmed by a
+        single refresh. The fields are marked unconfirmed in the snapshot so
+        their listeners are updated by the refresh even if the device doesn't
+        agree with the change, rolling back an optimistic state.
+        """
+        unconfirmed = fields & self.data.keys()
+        self.data = {**self.data, **dict.fromkeys(unconfirmed, UNCONFIRMED)}
+        await self.async_request_refresh()
+
+    async def async_apply_settings(self, settings: dict[str, Any]) -> None:
+        """Apply the settings to the device.
+
+        The driver sends one request per setting, so the settings are applied
+        in turn within a single slot of the request scheduler. A failed setting
+        stops the ones after it. Only the device fields of the settings are
+        confirmed by the refresh.
+
+        Exceptions SkybellException, SkybellAccessControlException.
+        """
+        async with self.async_request_slot(RequestPriority.INTERACTIVE):
+            for key, value in settings.items():
+                await self.device.async_set_setting(key, value)
+        self.note_activity()
+        await self.async_confirm_fields(setting_fields(settings))
+
+    def async_request_slot(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> AbstractAsyncContextManager[None]:
+        """Return a slot of the request scheduler for a request of the device."""
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        return entry.runtime_data.scheduler.async_slot(self.device.device_id, priority)
+
+    def _snapshot(self, fields: Iterable[str]) -> dict[str, Any]:
+        """Return a snapshot of the device fields."""
+        return {field: copy.deepcopy(getattr(self.device, field)) for field in fields}
+
+    @property
+    def latest_activity(self) -> datetime | None:
+        """Return the time of the latest activity for the device."""
+        times = [
+            self._last_activity,
+            self.device.latest_doorbell_event_time,
+            self.device.latest_motion_event_time,
+            self.device.latest_local_doorbell_event_time,
+            self.device.latest_local_motion_event_time,
+        ]
+        return max((ts for ts in times if ts is not None), default=None)
+
+    @property
+    def latest_event_time(self) -> datetime | None:
+        """Return the time of the latest doorbell or motion event in the cloud."""
+        times = [
+            self.device.latest_doorbell_event_time,
+            self.device.latest_motion_event_time,
+        ]
+        return max((ts for ts in times if ts is not None), default=None)
+
+    @property
+    def is_offline(self) -> bool:
+        """Return True if the device disconnected since it was last seen."""
+        last_disconnected = self.device.last_disconnected
+        if last_disconnected is None:
+            return False
+        last_seen = self.device.last_seen
+        return last_seen is None or last_disconnected >= last_seen
+
+    @callback
+    def note_activity(self) -> None:
+        """Note an activity (e.g. event or setting change) for the device.
+
+        With adaptive polling the device is polled faster for the active window.
+        """
+        self._last_activity = datetime.now(timezone.utc)
+        self._idle_cycles = 0
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        if not use_adaptive_polling(entry):
+            return
+        update_interval = self.update_interval  # type: ignore[has-type]
+        if update_interval and update_interval.total_seconds() > ACTIVE_REFRESH_CYCLE:
+            self.update_interval = timedelta(seconds=ACTIVE_REFRESH_CYCLE)
+            self._schedule_refresh()
+
+    def next_refresh_interval(self) -> timedelta:
+        """Return the interval to the device's next slot in the refresh cycle.
+
+        Each device is refreshed at its own phase of the cycle so the devices
+        of a hub don't hit the cloud API at the same time. A bounded jitter
+        keeps devices with close phases from staying in lockstep.
+        """
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        if use_adaptive_polling(entry):
+            return self._adaptive_refresh_interval(entry)
+        delay = self._phased_delay(DATA_REFRESH_CYCLE)
+        delay += random.uniform(-REFRESH_JITTER, REFRESH_JITTER)
+        return timedelta(seconds=delay)
+
+    def _phased_delay(self, cycle: float) -> float:
+        """Return the delay to the device's slot in a refresh cycle.
+
+        The phase of the device is the same fraction of any cycle, so the
+        devices stay spread out when the adaptive polling changes the cycle.
+        """
+        phase = self._phase / DATA_REFRESH_CYCLE * cycle
+        now = datetime.now(timezone.utc).timestamp()
+        delay = cycle - (now - phase) % cycle
+        # Don't refresh again within half a cycle (e.g. after the first refresh)
+        if delay < cycle / 2:
+            delay += cycle
+        return delay
+
+    def _adaptive_refresh_interval(self, entry: SkybellConfigEntry) -> timedelta:
+        """Return the refresh interval based on the device activity.
+
+        The device is polled fast during the active window after an activity.
+        Otherwise the cycle doubles every refresh until it reaches the ceiling
+        for an idle or offline device. The device is refreshed at its phase
+        of the cycle.
+        """
+        active_window = timedelta(
+            seconds=entry.options.get(CONF_ACTIVE_WINDOW, DEFAULT_ACTIVE_WINDOW)
+        )
+        latest_activity = self.latest_activity
+        if (
+            latest_activity is not None
+            and datetime.now(timezone.utc) - latest_activity < active_window
+        ):
+            self._idle_cycles = 0
+            cycle: float = ACTIVE_REFRESH_CYCLE
+        else:
+            ceiling = (
+                OFFLINE_MAX_REFRESH_CYCLE if self.is_offline else IDLE_MAX_REFRESH_CYCLE
+            )
+            cycle = min(DATA_REFRESH_CYCLE * 2**self._idle_cycles, ceiling)
+            if cycle < ceiling:
+                self._idle_cycles += 1
+        jitter = min(REFRESH_JITTER, cycle / 10)
+        delay = self._phased_delay(cycle) + random.uniform(-jitter, jitter)
+        return timedelta(seconds=delay)
+
+    async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        self.changed_fields = set()
+        deferred: timedelta | None = None
         try:
-            await self.device.async_update(refresh=True, get_devices=True)
+            if use_batched_refresh(entry):
+                await self._async_update_batched(entry)
+            else:
+                async with self.async_request_slot():
+                    await self.device.async_update(refresh=True, get_devices=True)
             _LOGGER.debug("Succesfull update for %s", self.device.name)
+        except SkybellThrottledException as exc:
+            # Keep the data (and the entities available) and retry once the
+            # requests are allowed again
+            _LOGGER.debug("Update deferred for %s: %s", self.device.name, exc)
+            deferred = timedelta(seconds=exc.retry_after)
         except SkybellException as exc:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -227,10 +704,123 @@ class SkybellDeviceDataUpdateCoordinator(DataUpdateCoordinator[None]):
                     "error": repr(exc),
                 },
             ) from exc
+        finally:
+            self.update_interval = deferred or self.next_refresh_interval()
+        if deferred is not None:
+            return self.data
+
+        self.stale = False
+        self._check_new_event(entry)
+        self._check_new_activity(entry)
+        data = self._snapshot(self._field_listeners)
+        self.changed_fields = {
+            field
+            for field, value in data.items()
+            if field not in self.data or self.data[field] != value
+        }
+        return data
+
+    def _check_new_event(self, entry: SkybellConfigEntry) -> None:
+        """Warm up the livestream when the refresh found a recent event."""
+        event_time = self.latest_event_time
+        if (
+            event_time is not None
+            and (
+                self._latest_event_time is None or event_time > self._latest_event_time
+            )
+            and datetime.now(timezone.utc) - event_time
+            < timedelta(seconds=WARM_LIVESTREAM_IDLE_TIMEOUT)
+            and (livestream_pool := entry.runtime_data.livestream_pool) is not None
+        ):
+            livestream_pool.async_request_warm(self.device.device_id)
+        self._latest_event_time = event_time
+
+    def _check_new_activity(self, entry: SkybellConfigEntry) -> None:
+        """Prefetch the clip and snapshot of a new activity in the background.
+
+        The first refresh only records the latest activity, so a restart doesn't
+        download the clips of activities that happened while it was down.
+        """
+        activity = self.device.latest()
+        activity_id = activity.get(CONST.ACTIVITY_ID) or ""
+        if (
+            activity_id
+            and self._latest_activity_id is not None
+            and activity_id != self._latest_activity_id
+            and (media_cache := entry.runtime_data.media_cache) is not None
+        ):
+            entry.async_create_background_task(
+                self.hass,
+                self._async_prefetch_activity(
+                    media_cache, activity_id, activity.get(CONST.VIDEO_URL, "")
+                ),
+                f"skybellgen prefetch {activity_id}",
+            )
+        self._latest_activity_id = activity_id
+
+    async def _async_prefetch_activity(
+        self, media_cache: SkybellMediaCache, activity_id: str, video: str
+    ) -> None:
+        """Cache the snapshot and clip of the latest activity.
+
+        The clip is downloaded in chunks and isn't cached when it's larger than
+        MEDIA_CLIP_MAX_SIZE.
+        """
+        device_id = self.device.device_id
+        if (image := self.device.images.get(CONST.ACTIVITY)) and (
+            media_cache.get_path(device_id, activity_id, MEDIA_SNAPSHOT) is None
+        ):
+            await media_cache.async_write(device_id, activity_id, MEDIA_SNAPSHOT, image)
+        if not video or media_cache.get_path(device_id, activity_id, MEDIA_CLIP):
+            return
+        try:
+            async with self.async_request_slot():
+                url = await self.device.async_get_activity_video_url(video)
+            if not url:
+                return
+            session = async_get_clientsession(self.hass)
+            async with session.get(url, raise_for_status=True) as response:
+                if (response.content_length or 0) > MEDIA_CLIP_MAX_SIZE:
+                    raise ClientPayloadError("The clip is too large")
+                clip = bytearray()
+                async for chunk in response.content.iter_chunked(MEDIA_CLIP_CHUNK_SIZE):
+                    clip.extend(chunk)
+                    if len(clip) > MEDIA_CLIP_MAX_SIZE:
+                        raise ClientPayloadError("The clip is too large")
+        except (SkybellException, ClientError) as exc:
+            _LOGGER.debug("Failed to prefetch the activity %s: %s", activity_id, exc)
+            return
+        await media_cache.async_write(device_id, activity_id, MEDIA_CLIP, bytes(clip))
+
+    async def _async_update_batched(self, entry: SkybellConfigEntry) -> None:
+        """Update the device from the hub's bulk device data.
+
+        The device coordinators refreshed within BATCHED_ROWS_MAX_AGE (or the
+        update interval when shorter) of the bulk request reuse its rows, the
+        next one issues a new bulk request. Only the snapshot and activities,
+        which the bulk response lacks, are requested for the device.
+        """
+        hub_coordinator = cast(
+            SkybellHubDataUpdateCoordinator, entry.runtime_data.hub_coordinator
+        )
+        api = cast(Skybell, entry.runtime_data.api)
+        max_age = timedelta(seconds=BATCHED_ROWS_MAX_AGE)
+        update_interval = self.update_interval  # type: ignore[has-type]
+        if update_interval is not None:
+            max_age = min(max_age, update_interval)
+        rows = await hub_coordinator.async_get_device_rows(api, max_age=max_age)
+        if (row := rows.get(self.device.device_id)) is not None:
+            merge_device_row(self.device, row)
+        async with self.async_request_slot():
+            await self.device.async_update(refresh=True)
 
 
 class SkybellDeviceLocalUpdateCoordinator(DataUpdateCoordinator[None]):
-    """Data update coordinator for a SkyBell device local information."""
+    """Data update coordinator for a SkyBell device local information.
+
+    The coordinator isn't polled, the local event server pushes the events
+    for the device into the coordinator.
+    """
 
     def __init__(
         self,
@@ -244,9 +834,48 @@ class SkybellDeviceLocalUpdateCoordinator(DataUpdateCoordinator[None]):
             logger=_LOGGER,
             config_entry=config_entry,
             name=device.name,
-            update_interval=timedelta(seconds=LOCAL_REFRESH_CYCLE),
+            update_interval=None,
         )
         self.device = device
+        self._hook_local_events()
+
+    def _hook_local_events(self) -> None:
+        """Push the local events of the device into the coordinator.
+
+        The local event server runs in its own thread and event loop, so the
+        event is handed over to the Home Assistant event loop.
+        """
+        set_local_event_message = self.device.set_local_event_message
+
+        def _set_local_event_message(message_type: str) -> None:
+            set_local_event_message(message_type)
+            self.hass.loop.call_soon_threadsafe(
+                self.async_handle_local_event, message_type
+            )
+
+        self.device.set_local_event_message = (  # type: ignore[method-assign]
+            _set_local_event_message
+        )
+
+    @callback
+    def async_handle_local_event(self, message_type: str) -> None:
+        """Notify the entities of the device that a local event was received."""
+        _LOGGER.debug("Local event %s for %s", message_type, self.device.name)
+        self.async_set_updated_data(None)
+        entry: SkybellConfigEntry = cast(SkybellConfigEntry, self.config_entry)
+        if message_type in (CONST.BUTTON_PRESSED, CONST.MOTION_DETECTION) and (
+            livestream_pool := entry.runtime_data.livestream_pool
+        ):
+            livestream_pool.async_request_warm(self.device.device_id)
+        if coordinator := entry.runtime_data.data_coordinators.get(
+            self.device.device_id
+        ):
+            coordinator.note_activity()
+
+    async def async_shutdown(self) -> None:
+        """Stop pushing the local events into the coordinator."""
+        await super().async_shutdown()
+        self.device.__dict__.pop("set_local_event_message", None)
 
     async def _async_update_data(self) -> None:
         """Fetch data from API endpoint."""
@@ -72,11 +72,12 @@ async def async_get_config_entry_diagnostics(
     known_devices = config_entry.runtime_data.known_device_ids
     current_devices = config_entry.runtime_data.current_device_ids
     api: Skybell = cast(Skybell, config_entry.runtime_data.api)
-    dcs = config_entry.runtime_data.device_coordinators
+    dcs = config_entry.runtime_data.data_coordinators
 
     info: dict[str, Any] = {}
     info["known_device_ids"] = known_devices
     info["current_device_ids"] = current_devices
+    info["setup_timings"] = config_entry.runtime_data.setup_timings
     api_info: dict[str, Any] = {}
     api_info["session_refresh_timestamp"] = api.session_refresh_timestamp
     api_info["session_refresh_period"] = api.session_refresh_period
@@ -86,9 +87,8 @@ async def async_get_config_entry_diagnostics(
     info["api"] = api_info
 
     devices = {}
-    for dc in cast(list, dcs):
-        device = device_to_dict(dc.device)
-        devices[dc.device.device_id] = device
+    for device_id, dc in dcs.items():
+        devices[device_id] = device_to_dict(dc.device)
 
     diagnostics_data = {
         "info": async_redact_data(info, TO_REDACT_INFO),
@@ -102,21 +102,14 @@ async def async_get_device_diagnostics(
     hass: HomeAssistant, config_entry: SkybellConfigEntry, device: DeviceEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a device."""
-    dcs = config_entry.runtime_data.device_coordinators
-    devices = []
-    for dc in cast(list, dcs):
-        devices.append(dc.device)
+    dcs = config_entry.runtime_data.data_coordinators
 
     # Get the device specific information
     diag_device = None
-    for my_device in devices:
-        for identifier in device.identifiers:
-            if identifier[1] == my_device.device_id:
-                diag_device = my_device
-                break
-
-    if diag_device is not None:
-        diag_device = device_to_dict(cast(SkybellDevice, diag_device))
+    for identifier in device.identifiers:
+        if (dc := dcs.get(identifier[1])) is not None:
+            diag_device = device_to_dict(dc.device)
+            break
     diagnostics_data = {"device": diag_device}
 
     return diagnostics_data
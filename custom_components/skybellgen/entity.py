@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
+from typing import Any, cast
+
 from aioskybellgen import SkybellDevice
 from homeassistant.const import ATTR_CONNECTIONS
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
@@ -14,6 +19,8 @@ from .coordinator import (
     SkybellDeviceDataUpdateCoordinator,
     SkybellDeviceLocalUpdateCoordinator,
 )
+from .ratelimit import SkybellThrottledException
+from .scheduler import RequestPriority
 
 
 class SkybellEntity(
@@ -34,6 +41,8 @@ class SkybellEntity(
         """Initialize a SkyBell entity."""
         super().__init__(coordinator)
         self.entity_description = description
+        # The coordinator only updates the entity when these fields change
+        self.coordinator_context = frozenset(self.device_fields)
         self._attr_unique_id = f"{self._device.device_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
@@ -52,7 +61,50 @@ class SkybellEntity(
         """Return the device."""
         return self.coordinator.device
 
+    @property
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        return set()
+
+    def _async_request_slot(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> AbstractAsyncContextManager[None]:
+        """Return a slot of the request scheduler for a request of the device."""
+        coordinator = cast(SkybellDeviceDataUpdateCoordinator, self.coordinator)
+        return coordinator.async_request_slot(priority)
+
+    async def _async_set_setting(self, key: str, value: Any) -> None:
+        """Change a setting of the device.
+
+        The caller sets the state of the entity optimistically, the change is
+        confirmed by a debounced refresh of the device.
+        """
+        try:
+            async with self._async_request_slot(RequestPriority.INTERACTIVE):
+                await self._device.async_set_setting(key, value)
+        except SkybellThrottledException as exc:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="rate_limited",
+                translation_placeholders={
+                    "retry_after": str(round(exc.retry_after)),
+                },
+            ) from exc
+        coordinator = cast(SkybellDeviceDataUpdateCoordinator, self.coordinator)
+        coordinator.note_activity()
+        await coordinator.async_confirm_fields(self.device_fields)
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
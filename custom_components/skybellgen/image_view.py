@@ -0,0 +1,75 @@
+"""Content-hash validated camera images of the SkyBell Gen Doorbell cameras."""
+
+from __future__ import annotations
+
+import hashlib
+
+from aiohttp import hdrs, web
+from homeassistant.components.camera import Camera, CameraImageView
+from homeassistant.components.camera.const import DATA_COMPONENT
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+IMAGE_URL = "/api/skybellgen/camera_proxy/{0}?token={1}&v={2}"
+IMAGE_VIEW_REGISTERED = f"{DOMAIN}_image_view"
+
+
+class ImageHash:
+    """Content hash of the latest image of a camera.
+
+    The hash is only computed again when the image is replaced, so the hash of
+    an unchanged image is returned without reading its bytes again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hash."""
+        self._image: bytes | None = None
+        self._hash = ""
+
+    def get(self, image: bytes) -> str:
+        """Return the hash of the image."""
+        if image is not self._image:
+            self._image = image
+            self._hash = hashlib.sha256(image).hexdigest() if image else ""
+        return self._hash
+
+
+class SkybellCameraImageView(CameraImageView):
+    """Camera view to serve an image with an ETag of its content.
+
+    The ETag is the content hash of the camera image and the requested size,
+    so a client that sends the ETag back in If-None-Match is answered with
+    304 Not Modified until the image changes.
+    """
+
+    url = "/api/skybellgen/camera_proxy/{entity_id}"
+    name = "api:skybellgen:camera:image"
+
+    async def handle(self, request: web.Request, camera: Camera) -> web.Response:
+        """Serve the camera image, unless the client has the same image."""
+        if not (image_hash := getattr(camera, "image_hash", "")):
+            return await super().handle(request, camera)
+        width = request.query.get("width", "")
+        height = request.query.get("height", "")
+        tag = f"{image_hash}-{width}x{height}"
+        etag = f'"{tag}"'
+        # The tags are compared weakly, any W/ prefix is ignored
+        if any(
+            if_none_match.value in ("*", tag)
+            for if_none_match in request.if_none_match or ()
+        ):
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+        response = await super().handle(request, camera)
+        response.headers[hdrs.ETAG] = etag
+        response.headers[hdrs.CACHE_CONTROL] = "private, no-cache"
+        return response
+
+
+@callback
+def async_register_image_view(hass: HomeAssistant) -> None:
+    """Register the camera image view once."""
+    if hass.data.get(IMAGE_VIEW_REGISTERED):
+        return
+    hass.http.register_view(SkybellCameraImageView(hass.data[DATA_COMPONENT]))
+    hass.data[IMAGE_VIEW_REGISTERED] = True
@@ -1,13 +1,12 @@
 """AWS Kinesis WebRTC support for the SkyBell Gen Doorbell cameras."""
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 import logging
 
-from botocore.auth import SigV4QueryAuth
-from botocore.awsrequest import AWSRequest
-from botocore.credentials import Credentials
+from .const import KVS_SIGNATURE_EXPIRES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,16 +28,43 @@ class KVSEndpointData:  # pylint: disable=too-many-instance-attributes
     session_token: str = ""
     expiration: str = ""
 
+    @property
+    def expiration_ts(self) -> datetime:
+        """Return the expiration of the credentials."""
+        return datetime.fromisoformat(self.expiration)
+
+    def renewal_delay(self, margin: float) -> float:
+        """Return the seconds until the credentials should be renewed.
+
+        The credentials are renewed margin seconds before they expire.
+        """
+        renew_at = self.expiration_ts - timedelta(seconds=margin)
+        return max((renew_at - datetime.now(tz=timezone.utc)).total_seconds(), 0)
+
+
+# The signed endpoints by endpoint and credential set, with their eviction time
+_SIGNED_URL_CACHE: dict[tuple[str, str, str, str], tuple[datetime, str]] = {}
+
 
 def sign_ws_endpoint(kvs_endpoint: KVSEndpointData) -> str:
     """Return the signed websocket endpoint."""
+    # botocore is only imported when a livestream is started
+    # pylint: disable=import-outside-toplevel
+    from botocore.auth import SigV4QueryAuth
+    from botocore.awsrequest import AWSRequest
+    from botocore.credentials import Credentials
 
     auth_credentials = Credentials(
         access_key=kvs_endpoint.access_key,
         secret_key=kvs_endpoint.secret_key,
         token=kvs_endpoint.session_token,
     )
-    sigv4 = SigV4QueryAuth(auth_credentials, kvs_endpoint.service, kvs_endpoint.region)
+    sigv4 = SigV4QueryAuth(
+        auth_credentials,
+        kvs_endpoint.service,
+        kvs_endpoint.region,
+        expires=KVS_SIGNATURE_EXPIRES,
+    )
     aws_request = AWSRequest(
         method="GET",
         url=kvs_endpoint.ws_endpoint,
@@ -56,9 +82,29 @@ def sign_ws_endpoint(kvs_endpoint: KVSEndpointData) -> str:
     return url
 
 
-def parse_kvs_response(data: dict, device: str) -> KVSEndpointData:
-    """Parse the Livestream KVS response into KVSEndpointData."""
+@lru_cache(maxsize=32)
+def parse_channel_arn(channel_arn: str) -> tuple[str, str, str]:
+    """Return the service, channel id and client id of a channel ARN."""
+    arn_parts = channel_arn.split(":")
+    assert arn_parts[0] == "arn"
+    assert arn_parts[1] == "aws"
+    assert arn_parts[2] == "kinesisvideo"
+
+    channel_parts = arn_parts[-1].split("/")
+    assert channel_parts[0] == "channel"
+    return arn_parts[2], channel_parts[1], channel_parts[2]
 
+
+def parse_kvs_response(data: dict, device: str) -> KVSEndpointData:
+    """Parse the Livestream KVS response into KVSEndpointData.
+
+    The signed endpoint is cached for the endpoint and credential set of the
+    response, so a livestream restarted with the same credentials isn't signed
+    again. The rest of the response, e.g. the short-lived TURN credentials of
+    the ICE servers, is always taken from the response. The signed endpoint is
+    evicted when the credentials or signature expire.
+    """
+    credentials = data["credentials"]
     kvs_endpoint = KVSEndpointData()
     kvs_endpoint.region = data["aws_region"]
 
@@ -67,17 +113,11 @@ def parse_kvs_response(data: dict, device: str) -> KVSEndpointData:
     _LOGGER.debug(
         "Livestream Channel ARN for %s is %s", device, kvs_endpoint.channel_arn
     )
-    channel_arn = kvs_endpoint.channel_arn.split(":")
-    assert channel_arn[0] == "arn"
-    assert channel_arn[1] == "aws"
-    assert channel_arn[2] == "kinesisvideo"
-
-    kvs_endpoint.service = channel_arn[2]
-    channel_parts = channel_arn[-1].split("/")
-    assert channel_parts[0] == "channel"
-
-    kvs_endpoint.channel_id = channel_parts[1]
-    kvs_endpoint.client_id = channel_parts[2]
+    (
+        kvs_endpoint.service,
+        kvs_endpoint.channel_id,
+        kvs_endpoint.client_id,
+    ) = parse_channel_arn(kvs_endpoint.channel_arn)
 
     # get the ICE servers
     kvs_endpoint.ice_servers = json.dumps(data["ice"], separators=(",", ":"))
@@ -86,7 +126,6 @@ def parse_kvs_response(data: dict, device: str) -> KVSEndpointData:
     )
 
     # credentials and expiration
-    credentials = data["credentials"]
     kvs_endpoint.expiration = credentials["Expiration"]
     expiration_ts = datetime.fromisoformat(kvs_endpoint.expiration)
     time_offset = expiration_ts - datetime.now(tz=timezone.utc)
@@ -111,9 +150,32 @@ def parse_kvs_response(data: dict, device: str) -> KVSEndpointData:
 
     # get the signed ws endpoint
     kvs_endpoint.signed_ws_endpoint = data["signedWSS"]
-    signed_url = sign_ws_endpoint(kvs_endpoint)
+    signed_url = _get_signed_url(kvs_endpoint, device)
     if signed_url != kvs_endpoint.ws_endpoint:
         _LOGGER.debug("Signed url is different than WSS endpoint. Using signed url")
         kvs_endpoint.signed_ws_endpoint = signed_url
-
     return kvs_endpoint
+
+
+def _get_signed_url(kvs_endpoint: KVSEndpointData, device: str) -> str:
+    """Return the signed websocket endpoint, signing it unless it is cached."""
+    key = (
+        kvs_endpoint.channel_arn,
+        kvs_endpoint.ws_endpoint,
+        kvs_endpoint.access_key,
+        kvs_endpoint.session_token,
+    )
+    now = datetime.now(tz=timezone.utc)
+    for cached_key in [k for k, v in _SIGNED_URL_CACHE.items() if v[0] <= now]:
+        del _SIGNED_URL_CACHE[cached_key]
+    if (cached := _SIGNED_URL_CACHE.get(key)) is not None:
+        _LOGGER.debug("Using the signed livestream endpoint for %s", device)
+        return cached[1]
+
+    signed_url = sign_ws_endpoint(kvs_endpoint)
+    evict_at = min(
+        kvs_endpoint.expiration_ts, now + timedelta(seconds=KVS_SIGNATURE_EXPIRES)
+    )
+    if evict_at > now:
+        _SIGNED_URL_CACHE[key] = (evict_at, signed_url)
+    return signed_url
@@ -15,12 +15,12 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DEFAULT_BRIGHTNESS, DEFAULT_LED_COLOR, DOMAIN
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
 
 LIGHT_TYPES: tuple[LightEntityDescription, ...] = (
@@ -42,32 +42,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell entity."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in LIGHT_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if (coordinator.device.device_id not in known_device_ids) and (
-                    (not coordinator.device.is_readonly)
-                    or (
-                        coordinator.device.is_readonly
-                        and entity.key in CONST.ACL_EXCLUSIONS
-                    )
-                ):
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellLight(coordinator, entity))
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellLight] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellLight(coordinator, entity)
+                for entity in LIGHT_TYPES
+                if not coordinator.device.is_readonly
+                or entity.key in CONST.ACL_EXCLUSIONS
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -107,7 +100,7 @@ class SkybellLight(SkybellEntity, LightEntity):
                 f"#{current_color[0]:02x}{current_color[1]:02x}{current_color[2]:02x}"
             )
         try:
-            await self._device.async_set_setting(CONST.LED_COLOR, rgb_value)
+            await self._async_set_setting(CONST.LED_COLOR, rgb_value)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -125,16 +118,16 @@ class SkybellLight(SkybellEntity, LightEntity):
                     "value": rgb_value,
                 },
             ) from exc
-
-        # To stop bouncing issue a refresh
-        await self.coordinator.async_refresh()
+        self._attr_is_on = bool(rgb_value)
+        self._attr_rgb_color = current_color if rgb_value else None
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         # We need to set the LED Color to a RGB value
         hex_color = ""
         try:
-            await self._device.async_set_setting(CONST.LED_COLOR, hex_color)
+            await self._async_set_setting(CONST.LED_COLOR, hex_color)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -152,24 +145,26 @@ class SkybellLight(SkybellEntity, LightEntity):
                     "value": hex_color,
                 },
             ) from exc
-
-        # To stop bouncing issue a refresh
-        await self.coordinator.async_refresh()
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if device is on."""
-        return self._device.normal_led_is_on
+        self._attr_is_on = False
+        self._attr_rgb_color = None
+        self.async_write_ha_state()
 
     @property
-    def rgb_color(self) -> tuple[int, int, int] | None:
-        """Return the led color value (int, int, int)."""
-        if not self.is_on:
-            return super().rgb_color
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        return {"normal_led_is_on", "led_color"}
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
+        self._attr_is_on = self._device.normal_led_is_on
+        if not self._attr_is_on:
+            self._attr_rgb_color = None
+            return
 
         hex_color = self._device.led_color
         int_array = [int(hex_color[i : i + 2], 16) for i in range(1, len(hex_color), 2)]
-        return cast(tuple[int, int, int], tuple(int_array))
+        self._attr_rgb_color = cast(tuple[int, int, int], tuple(int_array))
 
     @property
     def brightness(self) -> int | None:
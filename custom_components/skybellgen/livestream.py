@@ -0,0 +1,279 @@
+"""Livestream helpers for the SkyBell Gen Doorbell cameras."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine, Iterable
+from datetime import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError, ClientSession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DEFAULT_LIVESTREAM_LINGER,
+    GO2RTC_STREAMS_TTL,
+    MAX_WARM_LIVESTREAMS,
+    WARM_LIVESTREAM_IDLE_TIMEOUT,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from go2rtc_client import Go2RtcRestClient
+
+_LOGGER = logging.getLogger(__name__)
+
+LivestreamAction = Callable[[], Coroutine[Any, Any, None]]
+
+
+class SkybellLivestreamPool:
+    """Keep the livestreams of designated devices warm after an event.
+
+    A warm livestream holds a live KVS endpoint and go2rtc producer so a viewer
+    gets video without waiting for the livestream to start. The livestream
+    cameras register the actions to warm up and cool down their livestream.
+    A livestream cools down when it stays idle for the idle timeout, and the
+    oldest warm livestream cools down when the account reaches the cap.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_ids: Iterable[str],
+        max_warm: int = MAX_WARM_LIVESTREAMS,
+        idle_timeout: float = WARM_LIVESTREAM_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.device_ids = set(device_ids)
+        self._max_warm = max_warm
+        self._idle_timeout = idle_timeout
+        self._actions: dict[str, tuple[LivestreamAction, LivestreamAction]] = {}
+        # The warm devices, oldest first, with the cancel of their idle timer
+        self._warm: dict[str, CALLBACK_TYPE] = {}
+        # Serialise the warm ups, so concurrent warm ups respect the cap
+        self._warm_lock = asyncio.Lock()
+
+    @callback
+    def async_register(
+        self, device_id: str, warm_up: LivestreamAction, cool_down: LivestreamAction
+    ) -> CALLBACK_TYPE:
+        """Register the actions to warm up and cool down a livestream."""
+        self._actions[device_id] = (warm_up, cool_down)
+
+        @callback
+        def unregister() -> None:
+            """Unregister the actions."""
+            self._actions.pop(device_id, None)
+            if (cancel := self._warm.pop(device_id, None)) is not None:
+                cancel()
+
+        return unregister
+
+    def is_warm(self, device_id: str) -> bool:
+        """Return True if the livestream of the device is kept warm."""
+        return device_id in self._warm
+
+    @callback
+    def async_request_warm(self, device_id: str) -> None:
+        """Warm up the livestream of the device after an event."""
+        if device_id in self.device_ids and device_id in self._actions:
+            self.hass.async_create_task(
+                self.async_warm(device_id), f"skybellgen warm livestream {device_id}"
+            )
+
+    async def async_warm(self, device_id: str) -> None:
+        """Warm up the livestream of the device or restart its idle timer."""
+        async with self._warm_lock:
+            if (cancel := self._warm.pop(device_id, None)) is not None:
+                cancel()
+                self._warm[device_id] = self._async_start_idle_timer(device_id)
+                return
+            while len(self._warm) >= self._max_warm:
+                oldest = next(iter(self._warm))
+                _LOGGER.debug("Warm livestream cap reached, cooling down %s", oldest)
+                await self.async_cool(oldest)
+            self._warm[device_id] = self._async_start_idle_timer(device_id)
+            _LOGGER.debug("Warming up the livestream for %s", device_id)
+            try:
+                await self._actions[device_id][0]()
+            except (ClientError, HomeAssistantError) as exc:
+                _LOGGER.warning(
+                    "Failed to warm up the livestream for %s: %s", device_id, exc
+                )
+                if (cancel := self._warm.pop(device_id, None)) is not None:
+                    cancel()
+
+    async def async_cool(self, device_id: str) -> None:
+        """Cool down the warm livestream of the device."""
+        if (cancel := self._warm.pop(device_id, None)) is None:
+            return
+        cancel()
+        _LOGGER.debug("Cooling down the livestream for %s", device_id)
+        try:
+            await self._actions[device_id][1]()
+        except (ClientError, HomeAssistantError) as exc:
+            _LOGGER.warning(
+                "Failed to cool down the livestream for %s: %s", device_id, exc
+            )
+
+    async def async_shutdown(self) -> None:
+        """Cool down the warm livestreams."""
+        for device_id in list(self._warm):
+            await self.async_cool(device_id)
+
+    @callback
+    def _async_start_idle_timer(self, device_id: str) -> CALLBACK_TYPE:
+        """Start the timer to cool down an idle livestream."""
+
+        async def _async_idle(_now: datetime) -> None:
+            await self.async_cool(device_id)
+
+        return async_call_later(self.hass, self._idle_timeout, _async_idle)
+
+
+class SkybellLivestreamViewers:
+    """Reference count the viewers of a livestream.
+
+    The first viewer starts the livestream and the other viewers attach to its
+    go2rtc producer without calling the cloud, or wait for the start of the
+    first viewer. When the last viewer leaves, the livestream lingers before
+    it is released, so a viewer that drops and rejoins doesn't stop and start
+    the livestream.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        start: LivestreamAction,
+        release: LivestreamAction,
+        linger: float = DEFAULT_LIVESTREAM_LINGER,
+    ) -> None:
+        """Initialize the viewers."""
+        self.hass = hass
+        self._start = start
+        self._release = release
+        self._linger = linger
+        self._viewers: set[str] = set()
+        self._starting: asyncio.Task[None] | None = None
+        self._cancel_linger: CALLBACK_TYPE | None = None
+
+    @property
+    def count(self) -> int:
+        """Return the number of viewers."""
+        return len(self._viewers)
+
+    async def async_attach(self, viewer_id: str) -> None:
+        """Attach a viewer, starting the livestream for the first viewer."""
+        self._async_cancel_linger()
+        if not self._viewers:
+            self._starting = self.hass.async_create_task(
+                self._start(), "skybellgen start livestream"
+            )
+        self._viewers.add(viewer_id)
+        if (starting := self._starting) is None:
+            return
+        try:
+            await asyncio.shield(starting)
+        except Exception:
+            self._viewers.discard(viewer_id)
+            raise
+        finally:
+            if self._starting is starting and starting.done():
+                self._starting = None
+
+    @callback
+    def async_detach(self, viewer_id: str) -> None:
+        """Detach a viewer, releasing the livestream after the last viewer."""
+        if viewer_id not in self._viewers:
+            return
+        self._viewers.discard(viewer_id)
+        if self._viewers:
+            return
+        self._async_cancel_linger()
+        self._cancel_linger = async_call_later(
+            self.hass, self._linger, self._async_linger_expired
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the linger of the livestream."""
+        self._async_cancel_linger()
+
+    @callback
+    def _async_cancel_linger(self) -> None:
+        """Cancel the pending release of the livestream."""
+        if self._cancel_linger is not None:
+            self._cancel_linger()
+            self._cancel_linger = None
+
+    async def _async_linger_expired(self, _now: datetime) -> None:
+        """Release the livestream when no viewer rejoined."""
+        self._cancel_linger = None
+        try:
+            await self._release()
+        except (ClientError, HomeAssistantError) as exc:
+            _LOGGER.warning("Failed to release the livestream: %s", exc)
+
+
+class SkybellGo2RtcStreams:
+    """Registry of the livestream producers in go2rtc.
+
+    The livestream cameras of the entry share one go2rtc REST client. The
+    producers of the streams are cached, so registering a producer that is
+    already known doesn't call go2rtc. The streams are only listed from go2rtc
+    when the cache is older than the ttl.
+    """
+
+    def __init__(
+        self,
+        rest_client: Go2RtcRestClient,
+        url: str,
+        session: ClientSession,
+        ttl: float = GO2RTC_STREAMS_TTL,
+    ) -> None:
+        """Initialize the registry."""
+        self.rest_client = rest_client
+        self.url = url
+        self.session = session
+        self._ttl = ttl
+        self._producers: dict[str, set[str]] = {}
+        self._listed: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_register(self, name: str, producer_url: str) -> None:
+        """Register the producer of the stream if it isn't already.
+
+        A failed lookup or registration drops the cached producers of the
+        stream and is retried once with the streams listed again from go2rtc.
+        """
+        async with self._lock:
+            try:
+                await self._async_register(name, producer_url)
+            except ClientError as exc:
+                _LOGGER.debug("Failed to register the stream %s: %s", name, exc)
+                self._producers.pop(name, None)
+                self._listed = None
+                await self._async_register(name, producer_url)
+
+    async def _async_register(self, name: str, producer_url: str) -> None:
+        """Register the producer of the stream unless the cache knows it."""
+        if self._listed is None or time.monotonic() - self._listed > self._ttl:
+            streams = await self.rest_client.streams.list()
+            self._producers = {
+                stream_name: {producer.url for producer in stream.producers}
+                for stream_name, stream in streams.items()
+            }
+            self._listed = time.monotonic()
+        if producer_url in self._producers.get(name, set()):
+            return
+        await self.rest_client.streams.add(name, [producer_url])
+        self._producers[name] = {producer_url}
+
+    @callback
+    def async_invalidate(self, name: str) -> None:
+        """Forget the producers of a stream (e.g. the livestream stopped)."""
+        self._producers.pop(name, None)
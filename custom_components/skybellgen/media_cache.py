@@ -0,0 +1,149 @@
+"""On-disk cache of the SkyBell Gen Doorbell activity clips and snapshots."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import os
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import MEDIA_CACHE_MAX_AGE, MEDIA_CACHE_MAX_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+# The kinds of media, used as the suffix of the cached files
+MEDIA_CLIP = "mp4"
+MEDIA_SNAPSHOT = "jpg"
+
+
+class SkybellMediaCache:
+    """Bounded on-disk LRU cache of the activity clips and snapshots.
+
+    The files are named by the device, activity id and kind of the media. A
+    file is evicted once it is older than max_age, and the least recently used
+    files are evicted while the cache is larger than max_size. The index of
+    the files is kept in memory, and the files are read and written in the
+    executor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_size: int = MEDIA_CACHE_MAX_SIZE,
+        max_age: float = MEDIA_CACHE_MAX_AGE,
+    ) -> None:
+        """Initialize the cache in the directory."""
+        self.hass = hass
+        self.path = path
+        self._max_size = max_size
+        self._max_age = max_age
+        # The size and modification time of the files, least recently used first
+        self._index: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Return the size of the cached files."""
+        return sum(size for size, _ in self._index.values())
+
+    async def async_load(self) -> None:
+        """Index the cached files, evicting the expired and excess files."""
+        files = await self.hass.async_add_executor_job(self._scan)
+        self._index = OrderedDict(sorted(files.items(), key=lambda item: item[1][1]))
+        await self._async_evict()
+
+    def get_path(self, device_id: str, activity_id: str, kind: str) -> str | None:
+        """Return the path of a cached file and mark it as recently used."""
+        name = f"{device_id}_{activity_id}.{kind}"
+        if (entry := self._index.get(name)) is None:
+            return None
+        if time.time() - entry[1] > self._max_age:
+            return None
+        self._index.move_to_end(name)
+        return os.path.join(self.path, name)
+
+    async def async_read(
+        self, device_id: str, activity_id: str, kind: str
+    ) -> bytes | None:
+        """Return the bytes of a cached file."""
+        if (path := self.get_path(device_id, activity_id, kind)) is None:
+            return None
+        try:
+            return await self.hass.async_add_executor_job(self._read, path)
+        except OSError as exc:
+            _LOGGER.debug("Failed to read the cached media %s: %s", path, exc)
+            self._index.pop(os.path.basename(path), None)
+            return None
+
+    async def async_write(
+        self, device_id: str, activity_id: str, kind: str, data: bytes
+    ) -> None:
+        """Cache the bytes of the media and evict the expired and excess files."""
+        name = f"{device_id}_{activity_id}.{kind}"
+        try:
+            await self.hass.async_add_executor_job(self._write, name, data)
+        except OSError as exc:
+            _LOGGER.warning("Failed to cache the media %s: %s", name, exc)
+            return
+        self._index[name] = (len(data), time.time())
+        self._index.move_to_end(name)
+        await self._async_evict()
+
+    async def _async_evict(self) -> None:
+        """Evict the expired files and the least recently used excess files."""
+        expired_before = time.time() - self._max_age
+        evicted = [
+            name for name, (_, mtime) in self._index.items() if mtime < expired_before
+        ]
+        for name in evicted:
+            del self._index[name]
+        size = self.size
+        while size > self._max_size:
+            name, (file_size, _) = self._index.popitem(last=False)
+            evicted.append(name)
+            size -= file_size
+        if evicted:
+            _LOGGER.debug("Evicting %d cached media files", len(evicted))
+            await self.hass.async_add_executor_job(self._remove, evicted)
+
+    def _scan(self) -> dict[str, tuple[int, float]]:
+        """Return the size and modification time of the cached files."""
+        if not os.path.isdir(self.path):
+            return {}
+        files = {}
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime)
+        return files
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        """Read a cached file."""
+        with open(path, "rb") as file:
+            return file.read()
+
+    def _write(self, name: str, data: bytes) -> None:
+        """Write a cached file atomically."""
+        os.makedirs(self.path, exist_ok=True)
+        # A unique temporary file, so concurrent writes of a media don't collide
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=f"{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, os.path.join(self.path, name))
+        except OSError:
+            os.remove(tmp_path)
+            raise
+
+    def _remove(self, names: list[str]) -> None:
+        """Remove cached files."""
+        for name in names:
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,118 @@
+"""Rate limiter for the SkyBell cloud requests of a config entry."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+import random
+
+from aiohttp import ClientResponseError
+from aioskybellgen.exceptions import SkybellException
+
+from .const import (
+    MAX_THROTTLE_BACKOFF,
+    REQUEST_BURST,
+    REQUEST_RATE,
+    THROTTLE_BACKOFF,
+    THROTTLE_JITTER,
+)
+
+
+class SkybellThrottledException(SkybellException):
+    """Class to throw when the requests are deferred by throttling."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize the exception with the seconds until a retry."""
+        super().__init__(f"Requests deferred for {retry_after:.0f} seconds")
+        self.retry_after = retry_after
+
+
+def throttle_retry_after(exc: BaseException) -> float | None:
+    """Return the Retry-After seconds if the exception is from a throttled request.
+
+    The driver raises a SkybellException from the response error, so the
+    chain of the exception is searched. A throttled response without a
+    Retry-After header returns 0.
+    """
+    seen: set[int] = set()
+    cause: BaseException | None = exc
+    while cause is not None and id(cause) not in seen:
+        seen.add(id(cause))
+        if (
+            isinstance(cause, ClientResponseError)
+            and cause.status == HTTPStatus.TOO_MANY_REQUESTS
+        ):
+            return parse_retry_after(
+                cause.headers.get("Retry-After") if cause.headers else None
+            )
+        cause = cause.__cause__ or cause.__context__
+    return None
+
+
+def parse_retry_after(value: str | None) -> float:
+    """Return the seconds of a Retry-After header (delay seconds or HTTP date)."""
+    if not value:
+        return 0
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class SkybellRateLimiter:
+    """Token bucket limiter of the cloud requests with throttling backoff.
+
+    The bucket holds up to burst tokens and refills at rate tokens per second.
+    A request reserves a token and waits until the token is available. When
+    the cloud throttles a request, the requests are blocked for the larger of
+    the Retry-After delay and an exponential backoff, with jitter so the
+    retries of the entry aren't synchronized.
+    """
+
+    def __init__(self, rate: float = REQUEST_RATE, burst: int = REQUEST_BURST) -> None:
+        """Initialize the limiter."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated: float | None = None
+        self._blocked_until = 0.0
+        self._throttles = 0
+
+    def blocked_for(self, now: float) -> float:
+        """Return the seconds the requests are blocked by a throttling backoff."""
+        return max(self._blocked_until - now, 0)
+
+    def reserve(self, now: float) -> float:
+        """Reserve a token and return the seconds to wait for it."""
+        if self._updated is not None:
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+        self._updated = now
+        self._tokens -= 1
+        return max(-self._tokens / self._rate, 0)
+
+    def throttled(self, now: float, retry_after: float) -> float:
+        """Back off the requests after a throttled request.
+
+        Returns the seconds until the requests are allowed again.
+        """
+        backoff = min(THROTTLE_BACKOFF * 2**self._throttles, MAX_THROTTLE_BACKOFF)
+        self._throttles += 1
+        delay = max(retry_after, backoff)
+        delay += random.uniform(0, delay * THROTTLE_JITTER)
+        self._blocked_until = max(self._blocked_until, now + delay)
+        self._tokens = min(self._tokens, 0)
+        return self.blocked_for(now)
+
+    def succeeded(self) -> None:
+        """Reset the backoff after a request that wasn't throttled."""
+        self._throttles = 0
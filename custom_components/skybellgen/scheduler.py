@@ -0,0 +1,160 @@
+"""Request scheduler for the SkyBell cloud requests of a config entry."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+import itertools
+import time
+
+from aioskybellgen.exceptions import SkybellException
+
+from .const import MAX_IN_FLIGHT_REQUESTS, MAX_PARALLEL_REFRESHES
+from .ratelimit import (
+    SkybellRateLimiter,
+    SkybellThrottledException,
+    throttle_retry_after,
+)
+
+
+class RequestPriority(IntEnum):
+    """Priority classes of the requests, the lowest value runs first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass(order=True)
+class _Request:
+    """A request waiting for a slot."""
+
+    priority: RequestPriority
+    sequence: int
+    device_id: str | None = field(compare=False)
+    granted: asyncio.Future[None] = field(compare=False)
+
+
+class SkybellRequestScheduler:
+    """Schedule the SkyBell cloud requests of a config entry.
+
+    At most max_in_flight requests run at the same time and the background
+    requests (e.g. polls) leave slots free for the interactive requests (e.g.
+    setting changes and livestreams). The requests of a device, or of the
+    account when the device_id is None, run one at a time in the order they
+    were made. When a slot frees up, the waiting request of the highest
+    priority class, oldest first, runs next.
+
+    The requests are paced by the rate limiter. While the cloud throttles the
+    requests, they are deferred by raising SkybellThrottledException instead
+    of being sent.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = MAX_IN_FLIGHT_REQUESTS,
+        max_background: int = MAX_PARALLEL_REFRESHES,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._max_in_flight = max_in_flight
+        self._max_background = min(max_background, max_in_flight)
+        self._queues: dict[str | None, deque[_Request]] = {}
+        self._in_flight: dict[str | None, RequestPriority] = {}
+        self._sequence = itertools.count()
+        self.limiter = SkybellRateLimiter()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests that are running."""
+        return len(self._in_flight)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests that are waiting for a slot."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def async_slot(
+        self,
+        device_id: str | None,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+    ) -> AsyncIterator[None]:
+        """Wait for a slot to run a request for the device."""
+        request = _Request(
+            priority,
+            next(self._sequence),
+            device_id,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._queues.setdefault(device_id, deque()).append(request)
+        self._dispatch()
+        try:
+            await request.granted
+        except asyncio.CancelledError:
+            if request.granted.cancelled():
+                self._remove(request)
+            else:
+                # The slot was granted as the waiter was cancelled
+                self._release(device_id)
+            raise
+        try:
+            now = time.monotonic()
+            if blocked := self.limiter.blocked_for(now):
+                raise SkybellThrottledException(blocked)
+            if delay := self.limiter.reserve(now):
+                await asyncio.sleep(delay)
+            yield
+        except SkybellThrottledException:
+            raise
+        except SkybellException as exc:
+            if (retry_after := throttle_retry_after(exc)) is not None:
+                retry_after = self.limiter.throttled(time.monotonic(), retry_after)
+                raise SkybellThrottledException(retry_after) from exc
+            raise
+        else:
+            self.limiter.succeeded()
+        finally:
+            self._release(device_id)
+
+    def _dispatch(self) -> None:
+        """Grant the free slots to the waiting requests."""
+        while len(self._in_flight) < self._max_in_flight:
+            background = sum(
+                priority is RequestPriority.BACKGROUND
+                for priority in self._in_flight.values()
+            )
+            candidates = [
+                queue[0]
+                for device_id, queue in self._queues.items()
+                if device_id not in self._in_flight
+                and (
+                    background < self._max_background
+                    or queue[0].priority is RequestPriority.INTERACTIVE
+                )
+            ]
+            if not candidates:
+                return
+            request = min(candidates)
+            self._pop(request)
+            self._in_flight[request.device_id] = request.priority
+            request.granted.set_result(None)
+
+    def _pop(self, request: _Request) -> None:
+        """Remove the request from the queue of its device."""
+        queue = self._queues[request.device_id]
+        queue.remove(request)
+        if not queue:
+            del self._queues[request.device_id]
+
+    def _remove(self, request: _Request) -> None:
+        """Remove a cancelled request that is waiting for a slot."""
+        self._pop(request)
+        self._dispatch()
+
+    def _release(self, device_id: str | None) -> None:
+        """Release the slot of the device."""
+        del self._in_flight[device_id]
+        self._dispatch()
@@ -7,12 +7,12 @@ from aioskybellgen.helpers import const as CONST
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN, IMAGE_FIELDS, IMAGE_OPTIONS, VOLUME_FIELDS, VOLUME_OPTIONS
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
 
 SELECT_TYPES: tuple[SelectEntityDescription, ...] = (
@@ -47,32 +47,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell entity."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in SELECT_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if (coordinator.device.device_id not in known_device_ids) and (
-                    (not coordinator.device.is_readonly)
-                    or (
-                        coordinator.device.is_readonly
-                        and entity.key in CONST.ACL_EXCLUSIONS
-                    )
-                ):
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellSelect(coordinator, entity))
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellSelect] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellSelect(coordinator, entity)
+                for entity in SELECT_TYPES
+                if not coordinator.device.is_readonly
+                or entity.key in CONST.ACL_EXCLUSIONS
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -116,7 +109,7 @@ class SkybellSelect(SkybellEntity, SelectEntity):
             ) from exc  # pragma: no cover
 
         try:
-            await self._device.async_set_setting(self.entity_description.key, value)
+            await self._async_set_setting(self.entity_description.key, value)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -134,8 +127,17 @@ class SkybellSelect(SkybellEntity, SelectEntity):
                     "value": str(value),
                 },
             ) from exc
+        self._attr_current_option = option
+        self.async_write_ha_state()
+
+    @property
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        return {self.entity_description.key}
 
-    def _handle_coordinator_update(self) -> None:
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
         value_fn = getattr(self._device, self.entity_description.key)
         index = value_fn
         array_options = None
@@ -165,4 +167,3 @@ class SkybellSelect(SkybellEntity, SelectEntity):
             ) from exc
 
         self._attr_current_option = value
-        super()._handle_coordinator_update()
@@ -16,13 +16,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import (
-    CONF_USE_LOCAL_SERVER,
     IMAGE_FIELDS,
     IMAGE_OPTIONS,
     SENTSITIVTY_ADJ,
@@ -31,7 +30,7 @@ from .const import (
     VOLUME_FIELDS,
     VOLUME_OPTIONS,
 )
-from .coordinator import SkybellDeviceLocalUpdateCoordinator
+from .coordinator import DevicesDelta
 from .entity import DOMAIN, SkybellEntity
 
 LAST_LOCAL_BUTTON_EVENT = "last_local_button_event"
@@ -46,6 +45,7 @@ LOCAL_SENSORS = [
 class SkybellSensorEntityDescription(SensorEntityDescription):
     """Class to describe a SkyBell sensor."""
 
+    field: str
     value_fn: Callable[[SkybellDevice], StateType | datetime]
 
 
@@ -54,30 +54,35 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         key="last_button_event",
         translation_key="last_button_event",
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="latest_doorbell_event_time",
         value_fn=lambda device: device.latest_doorbell_event_time,
     ),
     SkybellSensorEntityDescription(
         key="last_motion_event",
         translation_key="last_motion_event",
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="latest_motion_event_time",
         value_fn=lambda device: device.latest_motion_event_time,
     ),
     SkybellSensorEntityDescription(
         key=LAST_LOCAL_BUTTON_EVENT,
         translation_key=LAST_LOCAL_BUTTON_EVENT,
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="latest_local_doorbell_event_time",
         value_fn=lambda device: device.latest_local_doorbell_event_time,
     ),
     SkybellSensorEntityDescription(
         key=LAST_LOCAL_MOTION_EVENT,
         translation_key=LAST_LOCAL_MOTION_EVENT,
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="latest_local_motion_event_time",
         value_fn=lambda device: device.latest_local_motion_event_time,
     ),
     SkybellSensorEntityDescription(
         key="last_livestream_event",
         translation_key="last_livestream_event",
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="latest_livestream_event_time",
         value_fn=lambda device: device.latest_livestream_event_time,
     ),
     SkybellSensorEntityDescription(
@@ -86,6 +91,7 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="last_seen",
         value_fn=lambda device: device.last_seen,
     ),
     SkybellSensorEntityDescription(
@@ -94,6 +100,7 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="last_connected",
         value_fn=lambda device: device.last_connected,
     ),
     SkybellSensorEntityDescription(
@@ -102,6 +109,7 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="last_disconnected",
         value_fn=lambda device: device.last_disconnected,
     ),
     SkybellSensorEntityDescription(
@@ -109,6 +117,7 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         translation_key="wifi_ssid",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="wifi_ssid",
         value_fn=lambda device: device.wifi_ssid,
     ),
     SkybellSensorEntityDescription(
@@ -116,72 +125,84 @@ SENSOR_TYPES: tuple[SkybellSensorEntityDescription, ...] = (
         translation_key="wifi_link_quality",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="wifi_link_quality",
         value_fn=lambda device: device.wifi_link_quality,
     ),
     SkybellSensorEntityDescription(
         key=CONST.OUTDOOR_CHIME_VOLUME,
         translation_key=CONST.OUTDOOR_CHIME_VOLUME,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="outdoor_chime_volume",
         value_fn=lambda device: device.outdoor_chime_volume,
     ),
     SkybellSensorEntityDescription(
         key=CONST.SPEAKER_VOLUME,
         translation_key=CONST.SPEAKER_VOLUME,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="speaker_volume",
         value_fn=lambda device: device.speaker_volume,
     ),
     SkybellSensorEntityDescription(
         key=CONST.IMAGE_QUALITY,
         translation_key=CONST.IMAGE_QUALITY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="image_quality",
         value_fn=lambda device: device.image_quality,
     ),
     SkybellSensorEntityDescription(
         key=CONST.MOTION_SENSITIVITY,
         translation_key=CONST.MOTION_SENSITIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="motion_sensitivity",
         value_fn=lambda device: device.motion_sensitivity,
     ),
     SkybellSensorEntityDescription(
         key=CONST.MOTION_HMBD_SENSITIVITY,
         translation_key=CONST.MOTION_HMBD_SENSITIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="hmbd_sensitivity",
         value_fn=lambda device: device.hmbd_sensitivity,
     ),
     SkybellSensorEntityDescription(
         key=CONST.MOTION_FD_SENSITIVITY,
         translation_key=CONST.MOTION_FD_SENSITIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="fd_sensitivity",
         value_fn=lambda device: device.fd_sensitivity,
     ),
     SkybellSensorEntityDescription(
         key=CONST.MOTION_PIR_SENSITIVITY,
         translation_key=CONST.MOTION_PIR_SENSITIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="pir_sensitivity",
         value_fn=lambda device: device.pir_sensitivity,
     ),
     SkybellSensorEntityDescription(
         key=CONST.LOCATION_LAT,
         translation_key="location_lat",
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="location_lat",
         value_fn=lambda device: device.location_lat,
     ),
     SkybellSensorEntityDescription(
         key=CONST.LOCATION_LON,
         translation_key="location_lon",
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="location_lon",
         value_fn=lambda device: device.location_lon,
     ),
     SkybellSensorEntityDescription(
         key=CONST.LOCATION_PLACE,
         translation_key="location_place",
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="location_place",
         value_fn=lambda device: device.location_place,
     ),
     SkybellSensorEntityDescription(
         key=CONST.NAME,
         translation_key=CONST.NAME,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="name",
         value_fn=lambda device: device.name,
     ),
 )
@@ -194,34 +215,27 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell sensor."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
         entities = []
-        new_device_ids: set[str] = set()
-        for entity in SENSOR_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if coordinator.device.device_id not in known_device_ids:
-                    new_device_ids.add(coordinator.device.device_id)
-                    if (entry.data.get(CONF_USE_LOCAL_SERVER, False)) and (
-                        entity.key in LOCAL_SENSORS
-                    ):
-                        if isinstance(coordinator, SkybellDeviceLocalUpdateCoordinator):
-                            entities.append(
-                                SkybellSensor(coordinator, entity)  # type: ignore[arg-type]
-                            )
-                    elif not isinstance(
-                        coordinator, SkybellDeviceLocalUpdateCoordinator
-                    ):
-                        entities.append(SkybellSensor(coordinator, entity))
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            local_coordinator = entry.runtime_data.local_coordinators.get(device_id)
+            for entity in SENSOR_TYPES:
+                if local_coordinator is not None and entity.key in LOCAL_SENSORS:
+                    entities.append(
+                        SkybellSensor(local_coordinator, entity)  # type: ignore[arg-type]
+                    )
+                else:
+                    entities.append(SkybellSensor(coordinator, entity))
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -230,6 +244,14 @@ class SkybellSensor(SkybellEntity, SensorEntity):
 
     entity_description: SkybellSensorEntityDescription
 
+    @property
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        fields = {self.entity_description.field}
+        if self.entity_description.key in USE_MOTION_VALUE:
+            fields.add(CONST.MOTION_SENSITIVITY)
+        return fields
+
     @property
     def native_value(self) -> StateType | datetime:
         """Return the state of the sensor."""
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
+
 from aioskybellgen import Skybell
+from aioskybellgen.exceptions import SkybellAccessControlException, SkybellException
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
 from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 import voluptuous as vol
 
 from .const import (
     DOMAIN,
+    SERVICE_APPLY_SETTINGS,
     SERVICE_CONF_INTERFACE,
+    SERVICE_CONF_SETTINGS,
     SERVICE_START_LOCAL_EVENT_SERVER,
     SERVICE_STOP_LOCAL_EVENT_SERVER,
 )
+from .ratelimit import SkybellThrottledException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import SkybellConfigEntry
+    from .coordinator import SkybellHubDataUpdateCoordinator
 
 SERVICE_START_LOCAL_EVENT_SERVER_SCHEMA = vol.Schema(
     {
@@ -20,6 +34,13 @@ SERVICE_START_LOCAL_EVENT_SERVER_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_APPLY_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(SERVICE_CONF_SETTINGS): vol.All(dict, vol.Length(min=1)),
+    }
+)
+
 
 async def _start_local_event_server(call: ServiceCall) -> None:
     """Call Skybell to start the local event server."""
@@ -35,6 +56,106 @@ async def _stop_local_event_server(call: ServiceCall) -> None:
     Skybell.shutdown_local_event_server()
 
 
+def _get_entry_devices(
+    hass: HomeAssistant, ha_device_ids: list[str]
+) -> dict[str, set[str]]:
+    """Return the SkyBell devices grouped by their hub config entry."""
+    device_registry = dr.async_get(hass)
+    entry_devices: dict[str, set[str]] = {}
+    for ha_device_id in ha_device_ids:
+        skybell_device_id = None
+        entry_id = None
+        if device_entry := device_registry.async_get(ha_device_id):
+            for identifier in device_entry.identifiers:
+                if identifier[0] == DOMAIN:
+                    skybell_device_id = identifier[1]
+            for config_entry_id in device_entry.config_entries:
+                config_entry = hass.config_entries.async_get_entry(config_entry_id)
+                if (
+                    config_entry is not None
+                    and config_entry.domain == DOMAIN
+                    and config_entry.state is ConfigEntryState.LOADED
+                ):
+                    entry_id = config_entry_id
+        if skybell_device_id is None or entry_id is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_device",
+                translation_placeholders={"device_id": ha_device_id},
+            )
+        entry_devices.setdefault(entry_id, set()).add(skybell_device_id)
+    return entry_devices
+
+
+async def _async_apply_entry_settings(
+    entry: SkybellConfigEntry, settings: dict[str, Any], device_ids: set[str]
+) -> None:
+    """Apply the settings to the devices of a hub config entry."""
+    hub_coordinator = cast(
+        "SkybellHubDataUpdateCoordinator", entry.runtime_data.hub_coordinator
+    )
+    try:
+        await hub_coordinator.async_apply_settings(settings, device_ids)
+    except SkybellThrottledException as exc:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="rate_limited",
+            translation_placeholders={
+                "retry_after": str(round(exc.retry_after)),
+            },
+        ) from exc
+    except SkybellAccessControlException as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_permissions",
+            translation_placeholders={"key": ", ".join(settings)},
+        ) from exc
+    except SkybellException as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_setting",
+            translation_placeholders={
+                "key": ", ".join(settings),
+                "value": ", ".join(str(value) for value in settings.values()),
+            },
+        ) from exc
+
+
+async def _apply_settings(call: ServiceCall) -> None:
+    """Apply the settings to the devices.
+
+    The hub config entries are updated concurrently. The error of a single
+    failed entry is raised as is, the errors of several are aggregated.
+    """
+    hass = call.hass
+    settings: dict[str, Any] = call.data[SERVICE_CONF_SETTINGS]
+    entry_devices = _get_entry_devices(hass, call.data[ATTR_DEVICE_ID])
+    results = await asyncio.gather(
+        *(
+            _async_apply_entry_settings(
+                cast(
+                    "SkybellConfigEntry", hass.config_entries.async_get_entry(entry_id)
+                ),
+                settings,
+                device_ids,
+            )
+            for entry_id, device_ids in entry_devices.items()
+        ),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="apply_settings_failed",
+            translation_placeholders={
+                "errors": "; ".join(str(error) for error in errors),
+            },
+        ) from errors[0]
+
+
 @callback
 def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for the Blink integration."""
@@ -51,3 +172,10 @@ def async_setup_services(hass: HomeAssistant) -> None:
         SERVICE_STOP_LOCAL_EVENT_SERVER,
         _stop_local_event_server,
     )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        _apply_settings,
+        SERVICE_APPLY_SETTINGS_SCHEMA,
+    )
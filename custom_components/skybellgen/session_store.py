@@ -0,0 +1,161 @@
+"""Persisted session of the SkyBell Gen hub.
+
+The auth tokens and the device state are kept in separate stores in the Home
+Assistant storage directory. The stores are written atomically (temp file and
+rename) in the executor.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+from typing import Any, cast
+
+from aioskybellgen import Skybell, SkybellDevice
+from aioskybellgen.helpers import const as CONST
+from aioskybellgen.helpers.models import DeviceData
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SESSION_SAVE_DELAY, SESSION_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def legacy_cache_path(hass: HomeAssistant, unique_id: str | None) -> str:
+    """Return the path of the pickled session cache of earlier versions."""
+    return hass.config.path(f"./skybellgen_{unique_id}.pickle")
+
+
+def remove_legacy_cache(path: str) -> None:
+    """Remove the pickled session cache of earlier versions."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SkybellSessionStore:
+    """The auth tokens and device state of a hub, in separate stores.
+
+    The auth tokens are saved when they change. The device state is saved
+    after a delay, and only when it changed, so a burst of refreshes is
+    written once. The device state survives unloads, so a reload doesn't
+    start from scratch.
+    """
+
+    def __init__(self, hass: HomeAssistant, unique_id: str | None) -> None:
+        """Initialize the stores of the hub."""
+        self.hass = hass
+        self._unique_id = unique_id
+        self._auth_store: Store[dict[str, Any]] = Store(
+            hass,
+            SESSION_STORAGE_VERSION,
+            f"{DOMAIN}.{unique_id}.auth",
+            private=True,
+            atomic_writes=True,
+        )
+        self._devices_store: Store[dict[str, DeviceData]] = Store(
+            hass,
+            SESSION_STORAGE_VERSION,
+            f"{DOMAIN}.{unique_id}.devices",
+            private=True,
+            atomic_writes=True,
+        )
+        self.auth: dict[str, Any] = {}
+        self.devices: dict[str, DeviceData] = {}
+        self._devices_pending = False
+
+    async def async_load(self) -> None:
+        """Load the auth tokens and the device state."""
+        auth = await self._auth_store.async_load() or {}
+        if isinstance(expiration := auth.get(CONST.EXPIRATION_DATE), str):
+            auth[CONST.EXPIRATION_DATE] = dt_util.parse_datetime(expiration)
+        self.auth = auth
+        self.devices = await self._devices_store.async_load() or {}
+        # Drop the pickled session cache of earlier versions
+        await self.hass.async_add_executor_job(
+            remove_legacy_cache, legacy_cache_path(self.hass, self._unique_id)
+        )
+
+    async def async_save_auth(self, auth: dict[str, Any]) -> None:
+        """Save the auth tokens."""
+        self.auth = copy.deepcopy(auth)
+        await self._auth_store.async_save(self.auth)
+
+    async def async_remove_auth(self) -> None:
+        """Remove the auth tokens, the next session logs in again."""
+        self.auth = {}
+        await self._auth_store.async_remove()
+
+    @callback
+    def async_save_devices(self, devices: list[SkybellDevice]) -> None:
+        """Save the state of the devices, if it changed."""
+        state = {
+            device.device_id: device._device_json  # pylint: disable=protected-access
+            for device in devices
+        }
+        if state == self.devices:
+            return
+        self.devices = copy.deepcopy(state)
+        self._devices_pending = True
+        self._devices_store.async_delay_save(self._data_to_save, SESSION_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, DeviceData]:
+        """Return the device state to save."""
+        self._devices_pending = False
+        return self.devices
+
+    async def async_flush(self) -> None:
+        """Save the pending device state now."""
+        if self._devices_pending:
+            self._devices_pending = False
+            await self._devices_store.async_save(self.devices)
+
+    async def async_remove(self) -> None:
+        """Remove the auth tokens and the device state."""
+        await self.async_remove_auth()
+        self.devices = {}
+        self._devices_pending = False
+        await self._devices_store.async_remove()
+
+
+class SkybellSession(Skybell):
+    """The SkyBell API with its session cache kept in the session store.
+
+    The API's own pickled cache is disabled; the auth tokens are loaded from
+    and saved to the session store instead.
+    """
+
+    def __init__(self, store: SkybellSessionStore, **kwargs: Any) -> None:
+        """Initialize the API with the auth tokens of the store."""
+        super().__init__(disable_cache=True, **kwargs)
+        self._store = store
+        self._cache[CONST.AUTHENTICATION_RESULT] = copy.deepcopy(store.auth)
+
+    def restore_devices(self, snapshot: dict[str, DeviceData]) -> list[SkybellDevice]:
+        """Return the devices built from their persisted state, without requests.
+
+        The devices are registered with the API, so the next refresh of the
+        devices updates them in place.
+        """
+        for device_id, device_json in snapshot.items():
+            if device_id not in self._devices:
+                self._devices[device_id] = SkybellDevice(
+                    copy.deepcopy(device_json), self
+                )
+        return list(self._devices.values())
+
+    async def _async_save_cache(self) -> None:
+        """Save the auth tokens to the session store."""
+        await self._store.async_save_auth(
+            cast(dict[str, Any], self.cache(CONST.AUTHENTICATION_RESULT))
+        )
+
+    async def async_delete_cache(self) -> None:
+        """Remove the auth tokens from the session store."""
+        self._cache[CONST.AUTHENTICATION_RESULT] = {}
+        await self._store.async_remove_auth()
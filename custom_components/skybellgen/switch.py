@@ -9,12 +9,12 @@ from aioskybellgen.helpers import const as CONST
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import BASIC_MOTION_GET_FUNCTION, DOMAIN
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
 
 SWITCH_TYPES: tuple[SwitchEntityDescription, ...] = (
@@ -91,32 +91,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up the SkyBell switch."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in SWITCH_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if (coordinator.device.device_id not in known_device_ids) and (
-                    (not coordinator.device.is_readonly)
-                    or (
-                        coordinator.device.is_readonly
-                        and entity.key in CONST.ACL_EXCLUSIONS
-                    )
-                ):
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellSwitch(coordinator, entity))
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellSwitch] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellSwitch(coordinator, entity)
+                for entity in SWITCH_TYPES
+                if not coordinator.device.is_readonly
+                or entity.key in CONST.ACL_EXCLUSIONS
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -134,7 +127,7 @@ class SkybellSwitch(SkybellEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         try:
-            await self._device.async_set_setting(self.entity_description.key, True)
+            await self._async_set_setting(self.entity_description.key, True)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -152,13 +145,13 @@ class SkybellSwitch(SkybellEntity, SwitchEntity):
                     "value": str(True),
                 },
             ) from exc
-        # To stop bouncing issue a refresh
-        await self.coordinator.async_refresh()
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         try:
-            await self._device.async_set_setting(self.entity_description.key, False)
+            await self._async_set_setting(self.entity_description.key, False)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -176,14 +169,19 @@ class SkybellSwitch(SkybellEntity, SwitchEntity):
                     "value": str(False),
                 },
             ) from exc
-
-        # To stop bouncing issue a refresh
-        await self.coordinator.async_refresh()
+        self._attr_is_on = False
+        self.async_write_ha_state()
 
     @property
-    def is_on(self) -> bool:
-        """Return true if entity is on."""
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        key = self.entity_description.key
+        return {BASIC_MOTION_GET_FUNCTION.get(key, key)}
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
         key = self.entity_description.key
         if key in BASIC_MOTION_GET_FUNCTION:
             key = BASIC_MOTION_GET_FUNCTION[key]
-        return cast(bool, getattr(self._device, key))
+        self._attr_is_on = cast(bool, getattr(self._device, key))
@@ -7,12 +7,12 @@ from aioskybellgen.helpers import const as CONST
 from homeassistant.components.text import TextEntity, TextEntityDescription, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import SkybellDeviceDataUpdateCoordinator
+from .coordinator import DevicesDelta, SkybellDeviceDataUpdateCoordinator
 from .entity import SkybellEntity
 
 TEXT_TYPES: tuple[TextEntityDescription, ...] = (
@@ -45,32 +45,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up SkyBell entity."""
 
-    known_device_ids: set[str] = set()
-
-    def _check_device() -> None:
-        entities = []
-        new_device_ids: set[str] = set()
-        for entity in TEXT_TYPES:
-            for coordinator in entry.runtime_data.device_coordinators:
-                if not isinstance(coordinator, SkybellDeviceDataUpdateCoordinator):
-                    continue
-                if (coordinator.device.device_id not in known_device_ids) and (
-                    (not coordinator.device.is_readonly)
-                    or (
-                        coordinator.device.is_readonly
-                        and entity.key in CONST.ACL_EXCLUSIONS
-                    )
-                ):
-                    new_device_ids.add(coordinator.device.device_id)
-                    entities.append(SkybellText(coordinator, entity))
+    @callback
+    def _async_add_devices(delta: DevicesDelta) -> None:
+        """Add the entities of the devices added to the hub."""
+        entities: list[SkybellText] = []
+        for device_id in delta.added:
+            coordinator = entry.runtime_data.data_coordinators[device_id]
+            entities.extend(
+                SkybellText(coordinator, entity)
+                for entity in TEXT_TYPES
+                if not coordinator.device.is_readonly
+                or entity.key in CONST.ACL_EXCLUSIONS
+            )
         if entities:
-            known_device_ids.update(new_device_ids)
             async_add_entities(entities)
 
-    _check_device()
-
     entry.async_on_unload(
-        entry.runtime_data.hub_coordinator.async_add_listener(_check_device)
+        entry.runtime_data.hub_coordinator.async_add_devices_listener(
+            _async_add_devices
+        )
     )
 
 
@@ -91,7 +84,7 @@ class SkybellText(SkybellEntity, TextEntity):
         if key == "location_place":
             key = CONST.LOCATION_PLACE
         try:
-            await self._device.async_set_setting(key, value)
+            await self._async_set_setting(key, value)
         except SkybellAccessControlException as exc:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
@@ -110,8 +103,15 @@ class SkybellText(SkybellEntity, TextEntity):
                 },
             ) from exc
         self._attr_native_value = value
+        self.async_write_ha_state()
+
+    @property
+    def device_fields(self) -> set[str]:
+        """Return the device fields the state of the entity is built from."""
+        return {self.entity_description.key}
 
-    def _handle_coordinator_update(self) -> None:
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes of the entity from the device."""
         value_fn = getattr(self._device, self.entity_description.key)
         self._attr_native_value = str(value_fn)
-        super()._handle_coordinator_update()
@@ -0,0 +1,83 @@
+"""Resized camera images of the SkyBell Gen Doorbell cameras."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import io
+
+from homeassistant.core import HomeAssistant
+
+from .const import THUMBNAIL_CACHE_SIZE, THUMBNAIL_QUALITY
+
+# The device, image hash, width and height of a resized image
+ThumbnailKey = tuple[str, str, int, int]
+
+
+def resize_image(image: bytes, width: int, height: int) -> bytes:
+    """Return the image resized to fit the size, as a JPEG.
+
+    The image is returned unchanged when it already fits the size.
+    """
+    # Pillow is only imported when a resized image is first requested
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    with Image.open(io.BytesIO(image)) as decoded:
+        if decoded.width <= width and decoded.height <= height:
+            return image
+        decoded.thumbnail((width, height))
+        output = io.BytesIO()
+        decoded.convert("RGB").save(output, format="JPEG", quality=THUMBNAIL_QUALITY)
+    return output.getvalue()
+
+
+class SkybellThumbnailCache:
+    """LRU cache of the resized camera images of the entry.
+
+    The resized images are keyed by the device, the hash of the image and the
+    requested size, so a changed image is resized again. The images are
+    resized in the executor, and concurrent requests for the same resized
+    image share the resize.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size: int = THUMBNAIL_CACHE_SIZE):
+        """Initialize the cache."""
+        self.hass = hass
+        self._max_size = max_size
+        self._images: OrderedDict[ThumbnailKey, bytes] = OrderedDict()
+        self._pending: dict[ThumbnailKey, asyncio.Future[bytes]] = {}
+
+    async def async_resize(
+        self,
+        device_id: str,
+        image: bytes,
+        width: int,
+        height: int,
+        image_hash: str | None = None,
+    ) -> bytes:
+        """Return the image resized to fit the size.
+
+        The content hash of the image is computed unless it is passed.
+        """
+        if image_hash is None:
+            image_hash = hashlib.sha256(image).hexdigest()
+        key = (device_id, image_hash, width, height)
+        if (cached := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+            return cached
+        try:
+            if (pending := self._pending.get(key)) is None:
+                pending = self._pending[key] = self.hass.async_add_executor_job(
+                    resize_image, image, width, height
+                )
+            resized: bytes = await asyncio.shield(pending)
+        except (OSError, ValueError):
+            # Not an image that can be decoded, serve it as is
+            return image
+        finally:
+            self._pending.pop(key, None)
+        self._images[key] = resized
+        while len(self._images) > self._max_size:
+            self._images.popitem(last=False)
+        return resized
@@ -0,0 +1,34 @@
+"""Timing of the setup phases of the SkyBell Gen integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def record_phase(
+    timings: dict[str, float], phase: str, name: str | None, start: float
+) -> None:
+    """Record the duration (seconds) of a setup phase started at start."""
+    timings[phase] = round(time.perf_counter() - start, 6)
+    _LOGGER.debug("Setup of hub %s: %s took %.3f s", name, phase, timings[phase])
+
+
+@contextmanager
+def time_phase(
+    timings: dict[str, float], phase: str, name: str | None
+) -> Iterator[None]:
+    """Record the duration of the setup phase run in the context.
+
+    The duration is recorded when the phase fails as well, so a slow failure
+    can be told apart from a fast one.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(timings, phase, name, start)
@@ -0,0 +1,121 @@
+"""Shared MJPEG transcodes of the SkyBell Gen Doorbell activity videos."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import MAX_TRANSCODE_BACKLOG, TRANSCODE_CHUNK_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkybellTranscodeReader:
+    """The output of a shared transcode for one client.
+
+    The reader has the read method of the stream reader that is proxied to the
+    client. An empty chunk ends the stream.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reader."""
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def read(self, _size: int = -1) -> bytes:
+        """Return the next chunk of the transcode."""
+        return await self._queue.get()
+
+    @callback
+    def feed(self, chunk: bytes) -> bool:
+        """Queue a chunk, returning False if the client fell behind."""
+        if self._queue.qsize() >= MAX_TRANSCODE_BACKLOG:
+            return False
+        self._queue.put_nowait(chunk)
+        return True
+
+    @callback
+    def feed_eof(self) -> None:
+        """End the stream of the client."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(b"")
+
+
+class SkybellSharedTranscode:  # pylint: disable=too-many-instance-attributes
+    """A transcode of an activity video shared by the MJPEG clients.
+
+    The ffmpeg transcode starts with the first client and its output is fanned
+    out to the readers of all the clients of the activity. A client that joins
+    late starts at the current position of the transcode; the MJPEG parts
+    before its first boundary are ignored by the client. A client that falls
+    behind is disconnected instead of buffering the transcode. The transcode
+    is closed when it ends or its last client leaves.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, video: str, stream: Any, url: str, extra_cmd: str
+    ) -> None:
+        """Initialize the transcode of the stream (a haffmpeg CameraMjpeg)."""
+        self.hass = hass
+        self.video = video
+        self._stream = stream
+        self._url = url
+        self._extra_cmd = extra_cmd
+        self._readers: set[SkybellTranscodeReader] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._done = False
+
+    @property
+    def active(self) -> bool:
+        """Return True until the transcode ends."""
+        return not self._done
+
+    @property
+    def clients(self) -> int:
+        """Return the number of clients of the transcode."""
+        return len(self._readers)
+
+    @callback
+    def subscribe(self) -> SkybellTranscodeReader:
+        """Add a client, starting the transcode for the first client."""
+        reader = SkybellTranscodeReader()
+        if self._done:
+            reader.feed_eof()
+            return reader
+        self._readers.add(reader)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_transcode(), f"skybellgen transcode {self.video}"
+            )
+        return reader
+
+    @callback
+    def unsubscribe(self, reader: SkybellTranscodeReader) -> None:
+        """Remove a client, closing the transcode after the last client."""
+        self._readers.discard(reader)
+        if not self._readers and self._task is not None:
+            self._done = True
+            self._task.cancel()
+
+    async def _async_transcode(self) -> None:
+        """Run the transcode and fan out its output to the readers."""
+        try:
+            if not await self._stream.open_camera(self._url, extra_cmd=self._extra_cmd):
+                _LOGGER.warning("Failed to transcode the activity video %s", self.video)
+                return
+            stream_reader = await self._stream.get_reader()
+            while chunk := await stream_reader.read(TRANSCODE_CHUNK_SIZE):
+                for reader in list(self._readers):
+                    if not reader.feed(chunk):
+                        _LOGGER.debug("Disconnecting a slow client of %s", self.video)
+                        self._readers.discard(reader)
+                        reader.feed_eof()
+        finally:
+            self._done = True
+            for reader in self._readers:
+                reader.feed_eof()
+            self._readers.clear()
+            await self._stream.close()
@@ -5,8 +5,9 @@
 import copy
 import json
 from os import path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from aiohttp import ClientResponseError
 from aioskybellgen import SkybellDevice
 from aioskybellgen.exceptions import (
     SkybellAccessControlException,
@@ -37,6 +38,16 @@ def get_livestream(nows: bool = False) -> LiveStreamConnectionData:
     return data
 
 
+def get_throttled_exception(retry_after: str | None = None) -> SkybellException:
+    """Return the exception of the driver for a throttled (429) request."""
+    headers = {"Retry-After": retry_after} if retry_after is not None else None
+    exc = SkybellException()
+    exc.__cause__ = ClientResponseError(
+        Mock(), (), status=429, message="Too Many Requests", headers=headers
+    )
+    return exc
+
+
 def get_two_devices() -> list[SkybellDevice]:
     """Return two SkyBell devices."""
     devices: list[SkybellDevice] = []
@@ -238,10 +249,11 @@ def error_initialize_exception_fixture():
         yield
 
 
-# Patch the Platform to remove platforms that cant be tested.
+# Patch the Platform to remove the camera platform, which needs the http
+# component. The camera platform is set up by the camera tests.
 @pytest.fixture(name="remove_platforms")
 def remove_camera_platform_fixture():
-    """Remove the platforms that cannot be tested from the SkyBellGen integration."""
+    """Remove the camera platform from the SkyBellGen integration."""
     with patch("custom_components.skybellgen.PLATFORMS", MOCK_PLATFORMS):
         yield
 
@@ -334,19 +346,23 @@ def error_update_exc_fixture():
 
 
 # This function is used to create a mock config entry for the SkyBellGen integration.
-def create_entry(hass) -> MockConfigEntry:
+def create_entry(hass, options: dict | None = None) -> MockConfigEntry:
     """Create fixture for adding config entry in Home Assistant."""
     entry = MockConfigEntry(
-        domain=DOMAIN, entry_id=USER_ID, unique_id=USER_ID, data=MOCK_CONFIG
+        domain=DOMAIN,
+        entry_id=USER_ID,
+        unique_id=USER_ID,
+        data=MOCK_CONFIG,
+        options=options or {},
     )
     entry.add_to_hass(hass)
     return entry
 
 
 # This function initializes the SkyBellGen integration in Home Assistant.
-async def async_init_integration(hass) -> MockConfigEntry:
+async def async_init_integration(hass, options: dict | None = None) -> MockConfigEntry:
     """Set up the skybellgen integration in Home Assistant."""
-    config_entry = create_entry(hass)
+    config_entry = create_entry(hass, options)
 
     await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
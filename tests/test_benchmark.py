@@ -0,0 +1,82 @@
+"""Benchmark the setup of the SkyBellGen integration for growing accounts."""
+
+# pylint: disable=protected-access
+
+import copy
+import json
+from os import path
+from unittest.mock import AsyncMock, patch
+
+from aioskybellgen import SkybellDevice
+import aioskybellgen.helpers.const as CONST
+from homeassistant.config_entries import ConfigEntryState
+import pytest
+
+from custom_components.skybellgen.const import CONF_WARM_START
+from custom_components.skybellgen.ratelimit import SkybellRateLimiter
+
+from .conftest import create_entry
+
+DEVICE_COUNTS = [1, 10, 50, 200]
+
+
+def get_devices(count: int) -> list[SkybellDevice]:
+    """Return synthetic SkyBell devices with unique ids."""
+    basepath = path.dirname(__file__)
+    filepath = path.abspath(path.join(basepath, "data/device.json"))
+    with open(filepath, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    devices: list[SkybellDevice] = []
+    for index in range(count):
+        device_data = copy.deepcopy(data)
+        device_data[CONST.DEVICE_ID] = f"{index:024x}"
+        device_data[CONST.NAME] = f"device {index}"
+        device_data["serial"] = f"sernum{index}"
+        device_data[CONST.DEVICE_SETTINGS][CONST.SERIAL_NUM] = f"sernum{index}"
+        device_data[CONST.DEVICE_SETTINGS][
+            CONST.MAC_ADDRESS
+        ] = f"02:00:00:00:{index >> 8:02x}:{index & 0xFF:02x}"
+        device = SkybellDevice(device_json=device_data, skybell=None)
+        devices.append(device)
+    return devices
+
+
+@pytest.mark.parametrize("warm_start", [False, True], ids=["cold", "warm"])
+@pytest.mark.parametrize("device_count", DEVICE_COUNTS)
+def test_setup_benchmark(hass, remove_platforms, benchmark, device_count, warm_start):
+    """Benchmark the setup of a hub with the devices of the account."""
+    devices = get_devices(device_count)
+    entry = create_entry(hass, {CONF_WARM_START: warm_start})
+
+    def unload() -> None:
+        """Unload the entry so the next round sets it up again."""
+        if entry.state is ConfigEntryState.LOADED:
+            hass.loop.run_until_complete(
+                hass.config_entries.async_unload(entry.entry_id)
+            )
+            hass.loop.run_until_complete(hass.async_block_till_done())
+
+    def setup() -> None:
+        """Set up the entry."""
+        hass.loop.run_until_complete(hass.config_entries.async_setup(entry.entry_id))
+
+    with (
+        patch(
+            "custom_components.skybellgen.Skybell.async_get_devices",
+            return_value=devices,
+        ),
+        patch.object(SkybellDevice, "async_update", AsyncMock()),
+        # The requests aren't paced, only the integration is measured
+        patch.object(SkybellRateLimiter, "reserve", return_value=0),
+        # The reconciliation of a warm start isn't part of the setup
+        patch(
+            "custom_components.skybellgen.coordinator."
+            "SkybellHubDataUpdateCoordinator.async_reconcile",
+            AsyncMock(),
+        ),
+    ):
+        benchmark.pedantic(setup, setup=unload, rounds=5, warmup_rounds=1)
+        assert entry.state is ConfigEntryState.LOADED
+        assert len(entry.runtime_data.current_device_ids) == device_count
+        benchmark.extra_info.update(entry.runtime_data.setup_timings)
+        unload()
@@ -1,13 +1,158 @@
 """Test SkyBellGen camera."""
 
-# Note that the camera entity cannot be tested because of
-# the import error with turbojpeg in the test environment.
+# pylint: disable=protected-access
 
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import sys
+from types import ModuleType
+from unittest.mock import AsyncMock, Mock, patch
+
+from aiohttp import ClientError, web
+from aiohttp.test_utils import make_mocked_request
+from aioskybellgen import SkybellDevice
+from aioskybellgen.exceptions import SkybellAccessControlException, SkybellException
+import aioskybellgen.helpers.const as CONST
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.camera import (
+    WebRTCAnswer as HAWebRTCAnswer,
+    WebRTCCandidate as HAWebRTCCandidate,
+    WebRTCError,
+)
+from homeassistant.components.camera.const import DATA_COMPONENT
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.exceptions import ServiceValidationError
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from webrtc_models import RTCIceCandidateInit
 
+from custom_components.skybellgen import camera as skybell_camera, kvs
+from custom_components.skybellgen.const import (
+    CONF_LIVESTREAM_LINGER,
+    CONF_WARM_LIVESTREAMS,
+    KVS_RENEWAL_MIN_DELAY,
+)
 from custom_components.skybellgen.kvs import KVSEndpointData, parse_kvs_response
+from custom_components.skybellgen.media_cache import MEDIA_CLIP, MEDIA_SNAPSHOT
+from custom_components.skybellgen.transcode import SkybellSharedTranscode
+
+from .conftest import async_init_integration, get_livestream, get_one_device
+from .const import DEVICE_ID
+
+SNAPSHOT_CAMERA = "camera.frontdoor_snapshot"
+ACTIVITY_CAMERA = "camera.frontdoor_last_activity"
+LIVESTREAM_CAMERA = "camera.frontdoor_livestream"
+ACTIVITY_ID = "bdc15f68-4c7b-41e2-8c54-adfb800898a9"
+
+
+@dataclass
+class WebRTCCandidate:
+    """A candidate message of the go2rtc websocket client."""
+
+    candidate: str
+
+
+@dataclass
+class WebRTCAnswer:
+    """An answer message of the go2rtc websocket client."""
+
+    sdp: str
+
+
+@dataclass
+class WsError:
+    """An error message of the go2rtc websocket client."""
+
+    error: str
+
+
+@dataclass
+class WebRTCOffer:
+    """An offer message of the go2rtc websocket client."""
+
+    offer: str
+    ice_servers: list
+
 
-from .conftest import get_livestream
+@pytest.fixture(name="go2rtc_client")
+def go2rtc_client_fixture():
+    """Provide the go2rtc client, which isn't installed in the tests."""
+    rest_client = Mock()
+    rest_client.streams.list = AsyncMock(return_value={})
+    rest_client.streams.add = AsyncMock()
+    ws_client = Mock(send=AsyncMock(), close=AsyncMock())
+    client = ModuleType("go2rtc_client")
+    setattr(client, "Go2RtcRestClient", Mock(return_value=rest_client))
+    ws = ModuleType("go2rtc_client.ws")
+    setattr(ws, "Go2RtcWsClient", Mock(return_value=ws_client))
+    for message in (WebRTCCandidate, WebRTCAnswer, WsError, WebRTCOffer):
+        setattr(ws, message.__name__, message)
+    with patch.dict(sys.modules, {"go2rtc_client": client, "go2rtc_client.ws": ws}):
+        yield rest_client, ws_client
+
+
+@pytest.fixture(name="camera_mjpeg")
+def camera_mjpeg_fixture(mocker):
+    """Transcode the activity videos with a stream that runs until closed."""
+    mocker.patch(
+        "homeassistant.components.ffmpeg.get_ffmpeg_manager",
+        return_value=Mock(binary="ffmpeg", ffmpeg_stream_content_type="mjpeg"),
+    )
+    camera_mjpeg = mocker.patch("haffmpeg.camera.CameraMjpeg")
+    stream = camera_mjpeg.return_value
+    stream.open_camera = AsyncMock(return_value=True)
+    stream.close = AsyncMock()
+    reader = Mock(read=lambda _size: asyncio.Event().wait())
+    stream.get_reader = AsyncMock(return_value=reader)
+    return camera_mjpeg
+
+
+@pytest.fixture(name="livestream")
+def livestream_fixture(hass):
+    """Start and stop the livestream of the device."""
+    data = get_livestream()
+    data["credentials"]["Expiration"] = (
+        datetime.now(tz=timezone.utc) + timedelta(seconds=600)
+    ).isoformat()
+    kvs._SIGNED_URL_CACHE.clear()
+    hass.data["go2rtc"] = "http://localhost:11984/"
+    with (
+        patch.object(
+            SkybellDevice, "async_start_livestream", return_value=data
+        ) as start,
+        patch.object(SkybellDevice, "async_stop_livestream") as stop,
+    ):
+        yield start, stop
+    kvs._SIGNED_URL_CACHE.clear()
+
+
+@pytest.fixture(name="media_path", autouse=True)
+def media_path_fixture(tmp_path):
+    """Keep the cached media of the tests in a temporary directory."""
+    with patch(
+        "custom_components.skybellgen.media_cache_path", return_value=str(tmp_path)
+    ):
+        yield tmp_path
+
+
+async def async_init_camera(hass, options: dict | None = None):
+    """Set up the camera platform of the integration."""
+    hass.http = Mock()
+    with patch("custom_components.skybellgen.PLATFORMS", [Platform.CAMERA]):
+        entry = await async_init_integration(hass, options)
+    assert entry.state is ConfigEntryState.LOADED
+    return entry
+
+
+def get_camera(hass, entity_id: str, activity: bool = False):
+    """Return the camera entity, with the latest activity of its device."""
+    camera = hass.data[DATA_COMPONENT].get_entity(entity_id)
+    if activity:
+        latest = get_one_device()[0]._activities[0]
+        camera._device._events = {latest[CONST.EVENT_TYPE]: latest}
+    return camera
 
 
 async def test_kvs(
@@ -37,6 +182,23 @@ async def test_kvs(
     assert kvs_ep.expiration.startswith("2025-07-")
 
 
+async def test_kvs_renewal(
+    hass,
+):
+    """Test the renewal delay of the kvs credentials."""
+    data = get_livestream()
+    kvs_ep: KVSEndpointData = parse_kvs_response(data, "frontdoor")
+    assert kvs_ep.expiration_ts.tzinfo is not None
+
+    # Expired credentials are renewed immediately
+    assert kvs_ep.renewal_delay(60) == 0
+
+    kvs_ep.expiration = (
+        datetime.now(tz=timezone.utc) + timedelta(seconds=600)
+    ).isoformat()
+    assert 530 < kvs_ep.renewal_delay(60) <= 540
+
+
 async def test_kvs_exc(
     hass,
 ):
@@ -45,3 +207,420 @@ async def test_kvs_exc(
 
     with pytest.raises(ValueError):
         assert parse_kvs_response(data, "frontdoor")
+
+
+async def test_kvs_cache(hass, mocker, freezer: FrozenDateTimeFactory):
+    """Test the signed url is cached until the credentials expire."""
+    data = get_livestream()
+    data["credentials"]["Expiration"] = (
+        datetime.now(tz=timezone.utc) + timedelta(seconds=600)
+    ).isoformat()
+    sign = mocker.patch.object(kvs, "sign_ws_endpoint", wraps=kvs.sign_ws_endpoint)
+
+    kvs_ep = parse_kvs_response(data, "frontdoor")
+    data["ice"][1]["credential"] = "newpassword"
+    cached_ep = parse_kvs_response(data, "frontdoor")
+    assert sign.call_count == 1
+    assert cached_ep.signed_ws_endpoint == kvs_ep.signed_ws_endpoint
+
+    # The ICE servers are always taken from the response
+    assert "newpassword" in cached_ep.ice_servers
+    assert "newpassword" not in kvs_ep.ice_servers
+
+    # New credentials are signed
+    data["credentials"]["SessionToken"] = "othertoken"
+    parse_kvs_response(data, "frontdoor")
+    assert sign.call_count == 2
+
+    # Expired credentials are evicted
+    freezer.tick(timedelta(seconds=601))
+    parse_kvs_response(data, "frontdoor")
+    assert sign.call_count == 3
+    assert not kvs._SIGNED_URL_CACHE  # pylint: disable=protected-access
+
+
+async def test_camera_image(hass, bypass_get_devices, mocker):
+    """Test the camera images are served, resized and versioned by content."""
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, SNAPSHOT_CAMERA)
+    device = camera._device
+
+    # Without an image the picture is served by the camera proxy
+    device.images[CONST.SNAPSHOT] = None
+    assert camera.entity_picture.startswith(f"/api/camera_proxy/{SNAPSHOT_CAMERA}")
+    assert not await camera.async_camera_image()
+
+    # The picture of an image is versioned by its content
+    device.images[CONST.SNAPSHOT] = b"image"
+    image_hash = camera.image_hash
+    assert camera.entity_picture == (
+        f"/api/skybellgen/camera_proxy/{SNAPSHOT_CAMERA}"
+        f"?token={camera.access_tokens[-1]}&v={image_hash[:16]}"
+    )
+    assert await camera.async_camera_image() == b"image"
+
+    # The image is resized with its content hash
+    resize = mocker.patch.object(
+        entry.runtime_data.thumbnails, "async_resize", return_value=b"small"
+    )
+    assert await camera.async_camera_image(64, 48) == b"small"
+    resize.assert_awaited_once_with(DEVICE_ID, b"image", 64, 48, image_hash)
+
+    # The livestream camera shows the snapshot
+    livestream_camera = get_camera(hass, LIVESTREAM_CAMERA)
+    resize.reset_mock()
+    assert await livestream_camera.async_camera_image(64, 48) == b"small"
+    resize.assert_awaited_once_with(DEVICE_ID, b"image", 64, 48, None)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_activity_camera_image(hass, bypass_get_devices):
+    """Test the activity image is read from the media cache."""
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, ACTIVITY_CAMERA, activity=True)
+    camera._device.images[CONST.ACTIVITY] = None
+    assert await camera.async_camera_image() == b""
+
+    await entry.runtime_data.media_cache.async_write(
+        DEVICE_ID, ACTIVITY_ID, MEDIA_SNAPSHOT, b"cached"
+    )
+    assert await camera.async_camera_image() == b"cached"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_activity_camera_stream(hass, bypass_get_devices, camera_mjpeg, mocker):
+    """Test the clients of an activity share the transcode of its video."""
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, ACTIVITY_CAMERA, activity=True)
+    device = camera._device
+    stream = camera_mjpeg.return_value
+    video_url = mocker.patch.object(
+        device, "async_get_activity_video_url", return_value="https://video"
+    )
+    proxying = asyncio.Event()
+    release = asyncio.Event()
+
+    async def proxy_stream(hass, request, reader, content_type):
+        """Proxy the stream until released."""
+        assert content_type == "mjpeg"
+        proxying.set()
+        await release.wait()
+        return web.Response()
+
+    mocker.patch.object(skybell_camera, "async_aiohttp_proxy_stream", proxy_stream)
+    request = make_mocked_request("GET", "/")
+
+    # The first client starts the transcode, the second one shares it
+    first = hass.async_create_task(camera.handle_async_mjpeg_stream(request))
+    await proxying.wait()
+    proxying.clear()
+    second = hass.async_create_task(camera.handle_async_mjpeg_stream(request))
+    await proxying.wait()
+    camera_mjpeg.assert_called_once()
+    video_url.assert_awaited_once_with(device.latest()[CONST.VIDEO_URL])
+    while not stream.get_reader.await_count:
+        await asyncio.sleep(0)
+    stream.open_camera.assert_awaited_once_with("https://video", extra_cmd="-r 210")
+    release.set()
+    await first
+    await second
+    await hass.async_block_till_done()
+    stream.close.assert_awaited_once()
+
+    # The video url is resolved once, and the cached clip is used
+    await entry.runtime_data.media_cache.async_write(
+        DEVICE_ID, ACTIVITY_ID, MEDIA_CLIP, b"clip"
+    )
+    await camera.handle_async_mjpeg_stream(request)
+    await hass.async_block_till_done()
+    assert camera_mjpeg.call_count == 2
+    assert camera._transcode._url == entry.runtime_data.media_cache.get_path(
+        DEVICE_ID, ACTIVITY_ID, MEDIA_CLIP
+    )
+    assert await camera._async_get_video_url(device.latest()[CONST.VIDEO_URL])
+    video_url.assert_awaited_once()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_activity_camera_video_url(
+    hass, bypass_get_devices, camera_mjpeg, mocker
+):
+    """Test the activity video url and the transcode started meanwhile."""
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, ACTIVITY_CAMERA, activity=True)
+    device = camera._device
+    video = device.latest()[CONST.VIDEO_URL]
+
+    # A failed resolution isn't kept
+    video_url = mocker.patch.object(
+        device, "async_get_activity_video_url", side_effect=SkybellException
+    )
+    assert await camera._async_get_video_url(video) == ""
+    video_url.side_effect = None
+    video_url.return_value = ""
+    assert await camera._async_get_video_url(video) == ""
+    assert video_url.await_count == 2
+
+    # The transcode of another client started while resolving the url is shared
+    transcode = SkybellSharedTranscode(hass, video, Mock(), "url", "")
+    mocker.patch.object(transcode, "subscribe")
+    mocker.patch.object(transcode, "unsubscribe")
+
+    async def resolve(_video):
+        camera._transcode = transcode
+        return "https://video"
+
+    video_url.side_effect = resolve
+    proxy_stream = mocker.patch.object(
+        skybell_camera, "async_aiohttp_proxy_stream", return_value=web.Response()
+    )
+    await camera.handle_async_mjpeg_stream(make_mocked_request("GET", "/"))
+    camera_mjpeg.assert_not_called()
+    transcode.subscribe.assert_called_once()
+    proxy_stream.assert_awaited_once()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_livestream_camera_webrtc(
+    hass, bypass_get_devices, go2rtc_client, livestream, freezer: FrozenDateTimeFactory
+):
+    """Test the viewers of the livestream share it through go2rtc."""
+    rest_client, ws_client = go2rtc_client
+    start, stop = livestream
+    entry = await async_init_camera(hass, {CONF_LIVESTREAM_LINGER: 30})
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+    send_message = Mock()
+
+    # The first viewer starts the livestream and registers it with go2rtc
+    await camera.async_handle_async_webrtc_offer("offer", "first", send_message)
+    start.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once_with(
+        LIVESTREAM_CAMERA, [camera._get_go2rtc_url()]
+    )
+    assert camera._get_go2rtc_url().startswith("webrtc:wss://")
+    assert ws_client.send.await_args.args[0].offer == "offer"
+
+    # The messages of go2rtc are sent to the viewer
+    on_messages = ws_client.subscribe.call_args.args[0]
+    on_messages(WebRTCCandidate("candidate"))
+    send_message.assert_called_with(HAWebRTCCandidate(RTCIceCandidateInit("candidate")))
+    on_messages(WebRTCAnswer("answer"))
+    send_message.assert_called_with(HAWebRTCAnswer("answer"))
+
+    # The candidates of the viewer are sent to go2rtc
+    await camera.async_on_webrtc_candidate("first", RTCIceCandidateInit("mine"))
+    assert ws_client.send.await_args.args[0] == WebRTCCandidate("mine")
+    ws_client.send.reset_mock()
+    await camera.async_on_webrtc_candidate("unknown", RTCIceCandidateInit("mine"))
+    ws_client.send.assert_not_awaited()
+
+    # Another viewer attaches to the running livestream
+    await camera.async_handle_async_webrtc_offer("offer", "second", send_message)
+    start.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once()
+    assert camera._viewers.count == 2
+
+    # A closed viewer leaves the livestream to the others
+    camera.close_webrtc_session("second")
+    assert camera._viewers.count == 1
+
+    # The livestream is stopped once the last viewer left and the linger expired
+    camera.close_webrtc_session("first")
+    camera.close_webrtc_session("first")
+    await hass.async_block_till_done()
+    stop.assert_not_awaited()
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stop.assert_awaited_once()
+    assert camera._kvs_ep is None
+
+    # The next viewer registers the new livestream with go2rtc
+    await camera.async_handle_async_webrtc_offer("offer", "third", send_message)
+    assert start.await_count == 2
+    assert rest_client.streams.add.await_count == 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_livestream_camera_go2rtc_error(
+    hass, bypass_get_devices, go2rtc_client, livestream
+):
+    """Test a go2rtc error registers the stream again and resends the offer."""
+    rest_client, ws_client = go2rtc_client
+    entry = await async_init_camera(hass, {})
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+    send_message = Mock()
+    await camera.async_handle_async_webrtc_offer("offer", "first", send_message)
+    rest_client.streams.add.assert_awaited_once()
+
+    # The first error registers the stream again and resends the offer
+    on_messages = ws_client.subscribe.call_args.args[0]
+    on_messages(WsError("error"))
+    await hass.async_block_till_done()
+    send_message.assert_not_called()
+    assert rest_client.streams.add.await_count == 2
+    assert ws_client.send.await_count == 2
+    assert ws_client.send.await_args.args[0].offer == "offer"
+
+    # Another error closes the session of the viewer
+    on_messages(WsError("error"))
+    assert isinstance(send_message.call_args.args[0], WebRTCError)
+    assert camera._viewers.count == 0
+
+    # A viewer whose stream can't be registered again is closed
+    await camera.async_handle_async_webrtc_offer("offer", "second", send_message)
+    send_message.reset_mock()
+    rest_client.streams.add.side_effect = ClientError("boom")
+    ws_client.subscribe.call_args.args[0](WsError("error"))
+    await hass.async_block_till_done()
+    assert isinstance(send_message.call_args.args[0], WebRTCError)
+    assert camera._viewers.count == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_livestream_camera_signalling(
+    hass, bypass_get_devices, go2rtc_client, livestream
+):
+    """Test an expired livestream is restarted and the go2rtc server."""
+    start, stop = livestream
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+
+    await camera._async_get_webrtc_signalling()
+    camera._kvs_ep.expiration = (
+        datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+    ).isoformat()
+    kvs._SIGNED_URL_CACHE.clear()
+    await camera._async_get_webrtc_signalling()
+    stop.assert_awaited_once()
+    assert start.await_count == 2
+
+    # The go2rtc server of the go2rtc integration
+    assert camera.get_serverapi_url() == "http://localhost:11984/"
+    session = Mock()
+    hass.data["go2rtc"] = Mock(url="http://go2rtc:1984/", session=session)
+    assert camera.get_serverapi_url() == "http://go2rtc:1984/"
+    assert camera.get_serverapi_session() is session
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_livestream_camera_errors(hass, bypass_get_devices, livestream):
+    """Test the livestream errors are raised as validation errors."""
+    start, stop = livestream
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+
+    for exc in (SkybellAccessControlException, SkybellException):
+        start.side_effect = exc
+        with pytest.raises(ServiceValidationError):
+            await camera._async_start_livestream()
+        stop.side_effect = exc
+        with pytest.raises(ServiceValidationError):
+            await camera._async_stop_livestream()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_livestream_camera_warm(
+    hass, bypass_get_devices, go2rtc_client, livestream, freezer: FrozenDateTimeFactory
+):
+    """Test a warm livestream is kept after its viewers left."""
+    rest_client, _ws_client = go2rtc_client
+    start, stop = livestream
+    entry = await async_init_camera(hass, {CONF_WARM_LIVESTREAMS: [DEVICE_ID]})
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+    livestream_pool = entry.runtime_data.livestream_pool
+
+    # The warm up and a concurrent first viewer start the livestream once
+    await asyncio.gather(
+        livestream_pool.async_warm(DEVICE_ID),
+        camera.async_handle_async_webrtc_offer("offer", "viewer", Mock()),
+    )
+    start.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once()
+
+    # The warm livestream isn't released after its viewers
+    camera.close_webrtc_session("viewer")
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stop.assert_not_awaited()
+
+    # The livestream is stopped when it cools down
+    await livestream_pool.async_cool(DEVICE_ID)
+    stop.assert_awaited_once()
+
+    # A warm livestream is stopped on unload, and a failure is logged
+    await livestream_pool.async_warm(DEVICE_ID)
+    stop.side_effect = SkybellException
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert stop.await_count == 2
+    assert not livestream_pool.is_warm(DEVICE_ID)
+
+
+async def test_livestream_camera_renewal(
+    hass, bypass_get_devices, go2rtc_client, livestream, freezer: FrozenDateTimeFactory
+):
+    """Test the credentials of a viewed livestream are renewed."""
+    rest_client, _ws_client = go2rtc_client
+    start, stop = livestream
+    entry = await async_init_camera(hass)
+    camera = get_camera(hass, LIVESTREAM_CAMERA)
+
+    # The livestream is renewed before the credentials expire
+    await camera.async_handle_async_webrtc_offer("offer", "viewer", Mock())
+    start.return_value = renewed = get_livestream()
+    renewed["credentials"]["Expiration"] = (
+        datetime.now(tz=timezone.utc) + timedelta(seconds=1200)
+    ).isoformat()
+    renewed["credentials"]["SessionToken"] = "renewedtoken"
+    freezer.tick(timedelta(seconds=541))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert start.await_count == 2
+    assert rest_client.streams.add.await_count == 2
+    assert camera._kvs_ep.session_token == "renewedtoken"
+
+    # Credentials that aren't extended restart the livestream
+    freezer.tick(timedelta(seconds=600))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stop.assert_awaited_once()
+    assert start.await_count == 4
+    assert rest_client.streams.add.await_count == 3
+
+    # Credentials within the margin aren't renewed in a loop
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert start.await_count == 4
+
+    # A failed renewal is left to the next viewer
+    start.side_effect = SkybellException
+    freezer.tick(timedelta(seconds=KVS_RENEWAL_MIN_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert start.await_count == 5
+
+    # The livestream isn't renewed without viewers
+    camera.close_webrtc_session("viewer")
+    await camera._async_renew_livestream(datetime.now(tz=timezone.utc))
+    assert start.await_count == 5
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_import(hass):
+    """Test a module is imported on first use."""
+    with patch.dict(sys.modules):
+        sys.modules.pop("json.tool", None)
+        module = await skybell_camera._async_import(hass, "json.tool")
+        assert sys.modules["json.tool"] is module
+        assert await skybell_camera._async_import(hass, "json.tool") is module
@@ -6,12 +6,19 @@ from aioskybellgen import Skybell
 from aioskybellgen.exceptions import SkybellAuthenticationException
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import CONF_PASSWORD
+from homeassistant.helpers import device_registry as dr
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.skybellgen.const import DOMAIN
+from custom_components.skybellgen.const import (
+    CONF_BATCHED_REFRESH,
+    CONF_LIVESTREAM_LINGER,
+    CONF_WARM_LIVESTREAMS,
+    CONF_WARM_START,
+    DOMAIN,
+)
 
-from .const import MOCK_CONFIG, PASSWORD, USER_ID
+from .const import DEVICE_ID, MOCK_CONFIG, PASSWORD, USER_ID
 
 
 # This fixture bypasses the actual setup of the integration
@@ -257,3 +264,35 @@ async def test_step_reconfigure_auth_failure(
 
     assert result["type"] is data_entry_flow.FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
+
+
+async def test_options_flow(hass) -> None:
+    """Test the options flow updates the hub options."""
+    entry = MockConfigEntry(domain=DOMAIN, unique_id=USER_ID, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, DEVICE_ID)},
+        name="Front door",
+    )
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    assert result["type"] is data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_BATCHED_REFRESH: True,
+            CONF_WARM_LIVESTREAMS: [DEVICE_ID],
+            CONF_LIVESTREAM_LINGER: 0,
+            CONF_WARM_START: True,
+        },
+    )
+
+    assert result["type"] is data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_BATCHED_REFRESH] is True
+    assert entry.options[CONF_WARM_LIVESTREAMS] == [DEVICE_ID]
+    assert entry.options[CONF_LIVESTREAM_LINGER] == 0
+    assert entry.options[CONF_WARM_START] is True
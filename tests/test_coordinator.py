@@ -2,9 +2,12 @@
 
 # pylint: disable=protected-access
 
+import copy
 from datetime import datetime, timedelta, timezone
 
 from aioskybellgen import Skybell
+from aioskybellgen.exceptions import SkybellException
+import aioskybellgen.helpers.const as CONST
 from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -12,9 +15,33 @@ from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
 
-from custom_components.skybellgen.const import DOMAIN
-
-from .conftest import async_init_integration, get_one_device, get_two_devices
+from custom_components.skybellgen.const import (
+    ACTIVE_REFRESH_CYCLE,
+    BATCHED_ROWS_MAX_AGE,
+    CONF_ACTIVE_WINDOW,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCHED_REFRESH,
+    DATA_REFRESH_CYCLE,
+    DOMAIN,
+    IDLE_MAX_REFRESH_CYCLE,
+    MAX_PARALLEL_REFRESHES,
+    OFFLINE_MAX_REFRESH_CYCLE,
+    REFRESH_JITTER,
+)
+from custom_components.skybellgen.coordinator import (
+    DevicesDelta,
+    SkybellDeviceDataUpdateCoordinator,
+    SkybellDeviceLocalUpdateCoordinator,
+    refresh_phase,
+)
+from custom_components.skybellgen.entity import SkybellEntity
+
+from .conftest import (
+    async_init_integration,
+    get_one_device,
+    get_throttled_exception,
+    get_two_devices,
+)
 from .const import DEVICE_ID
 
 
@@ -51,6 +78,10 @@ async def test_hub_coord_stale(hass, remove_platforms, mocker):
     assert isinstance(config_entry.runtime_data.api, Skybell)
     device_id = "second_device"
     assert device_id in config_entry.runtime_data.known_device_ids
+    # The device and its coordinator are indexed
+    runtime_data = config_entry.runtime_data
+    assert runtime_data.devices[device_id].device_id == device_id
+    assert runtime_data.data_coordinators[device_id].device.device_id == device_id
     # device should be in the device and entity registries
     device_registry = dr.async_get(hass)
     device_entry = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
@@ -71,6 +102,10 @@ async def test_hub_coord_stale(hass, remove_platforms, mocker):
     await hc.async_refresh()
     device_id = "second_device"
     assert device_id not in config_entry.runtime_data.known_device_ids
+    assert device_id not in runtime_data.devices
+    assert device_id not in runtime_data.data_coordinators
+    assert len(runtime_data.data_coordinators) == 1
+    assert device_id not in runtime_data.local_coordinators
     # device should not be in the device and entity registries
     device_registry = dr.async_get(hass)
     device_entry = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
@@ -269,3 +304,346 @@ async def test_hub_coord_no_api(
         assert True
     except UpdateFailed:  # pragma no cover
         pytest.fail("Unexpected Update failed")  # pragma no cover
+
+
+async def test_hub_devices_listener(hass, remove_platforms, mocker):
+    """Test the hub publishes the devices added and removed."""
+    # In this case we are testing the platforms only build the entities of the
+    # devices added to the hub, and an unchanged hub doesn't notify them.
+    get_devices = mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=get_one_device(),
+    )
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    hc = config_entry.runtime_data.hub_coordinator
+
+    # The listener is called with the current devices
+    listener = mocker.Mock()
+    remove_listener = hc.async_add_devices_listener(listener)
+    listener.assert_called_once_with(DevicesDelta(added=frozenset({DEVICE_ID})))
+
+    # An unchanged hub doesn't notify the listener
+    listener.reset_mock()
+    await hc.async_refresh()
+    listener.assert_not_called()
+
+    # A new device is added with its entities
+    get_devices.return_value = get_two_devices()
+    await hc.async_refresh()
+    await hass.async_block_till_done()
+    listener.assert_called_once_with(DevicesDelta(added=frozenset({"second_device"})))
+    device_registry = dr.async_get(hass)
+    device_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "second_device")}
+    )
+    entity_registry = er.async_get(hass)
+    assert er.async_entries_for_device(entity_registry, device_entry.id)
+
+    # A stale device is removed
+    listener.reset_mock()
+    get_devices.return_value = get_one_device()
+    await hc.async_refresh()
+    listener.assert_called_once_with(DevicesDelta(removed=frozenset({"second_device"})))
+
+    # A removed listener isn't notified
+    listener.reset_mock()
+    remove_listener()
+    get_devices.return_value = get_two_devices()
+    await hc.async_refresh()
+    listener.assert_not_called()
+
+
+async def test_batched_refresh(
+    hass, remove_platforms, mocker, freezer: FrozenDateTimeFactory
+):
+    """Test the device data is refreshed in bulk for the hub."""
+    # In this case we are testing the logic where the hub and device
+    # coordinators share a single request for the data of all devices.
+    devices = get_two_devices()
+    mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=devices,
+    )
+    row = copy.deepcopy(devices[0]._device_json)
+    row[CONST.NAME] = "bulk name"
+    send_request = mocker.patch(
+        "custom_components.skybellgen.coordinator.Skybell.async_send_request",
+        return_value={CONST.RESPONSE_ROWS: [row]},
+    )
+    config_entry = await async_init_integration(
+        hass, options={CONF_BATCHED_REFRESH: True}
+    )
+    assert config_entry.state is ConfigEntryState.LOADED
+
+    # The hub and both device coordinators reuse a single bulk request
+    send_request.assert_called_once()
+    # The bulk data is merged into the device
+    assert devices[0].name == "bulk name"
+    # Devices missing from the bulk data are stale
+    assert "second_device" not in config_entry.runtime_data.known_device_ids
+
+    # A new device in the bulk data refreshes the device list
+    row2 = copy.deepcopy(devices[1]._device_json)
+    row2[CONST.DEVICE_ID] = "third_device"
+    send_request.return_value = {CONST.RESPONSE_ROWS: [row, row2]}
+    hc = config_entry.runtime_data.hub_coordinator
+    await hc.async_refresh()
+    assert send_request.call_count == 2
+
+    # The device coordinator reuses the hub rows while they are current
+    dc = config_entry.runtime_data.device_coordinators[0]
+    await dc.async_refresh()
+    assert send_request.call_count == 2
+
+    # Older rows are requested again
+    freezer.tick(timedelta(seconds=BATCHED_ROWS_MAX_AGE))
+    await dc.async_refresh()
+    assert send_request.call_count == 3
+
+
+async def test_device_coord_staggered(
+    hass, remove_platforms, mocker, freezer: FrozenDateTimeFactory
+):
+    """Test the device refreshes are spread across the refresh cycle."""
+    freezer.move_to("2023-03-30 13:33:00+00:00")
+    mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=get_two_devices(),
+    )
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+
+    # The phase of a device is deterministic and within the cycle
+    phase = refresh_phase(DEVICE_ID, DATA_REFRESH_CYCLE)
+    assert phase == refresh_phase(DEVICE_ID, DATA_REFRESH_CYCLE)
+    assert 0 <= phase < DATA_REFRESH_CYCLE
+    assert phase != refresh_phase("second_device", DATA_REFRESH_CYCLE)
+
+    # Without jitter, each device is scheduled at its own phase of the cycle
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.random.uniform", return_value=0
+    )
+    now = datetime.now(timezone.utc).timestamp()
+    device_coordinators = [
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceDataUpdateCoordinator)
+    ]
+    assert len(device_coordinators) == 2
+    for dc in device_coordinators:
+        await dc.async_refresh()
+        delay = dc.update_interval.total_seconds()
+        assert DATA_REFRESH_CYCLE / 2 <= delay <= DATA_REFRESH_CYCLE * 1.5
+        slot = round(now + delay - dc._phase, 3) % DATA_REFRESH_CYCLE
+        assert slot == pytest.approx(0, abs=1e-2)
+
+    # The jitter is bounded
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.random.uniform",
+        return_value=REFRESH_JITTER,
+    )
+    dc = device_coordinators[0]
+    await dc.async_refresh()
+    delay = dc.update_interval.total_seconds()
+    assert delay <= DATA_REFRESH_CYCLE * 1.5 + REFRESH_JITTER
+
+    # The refreshes run through the request scheduler of the entry
+    scheduler = config_entry.runtime_data.scheduler
+    assert scheduler._max_background == MAX_PARALLEL_REFRESHES
+    assert scheduler.in_flight == 0
+
+
+def assert_phased_interval(
+    dc: SkybellDeviceDataUpdateCoordinator, cycle: float
+) -> None:
+    """Assert the device is refreshed at its phase of the cycle."""
+    delay = dc.update_interval.total_seconds()
+    assert cycle / 2 <= delay <= cycle * 1.5
+    phase = dc._phase / DATA_REFRESH_CYCLE * cycle
+    now = datetime.now(timezone.utc).timestamp()
+    offset = (now + delay - phase + cycle / 2) % cycle - cycle / 2
+    assert offset == pytest.approx(0, abs=1e-2)
+
+
+async def test_device_coord_adaptive(
+    hass, remove_platforms, mocker, freezer: FrozenDateTimeFactory
+):
+    """Test the device refresh interval adapts to the device activity."""
+    freezer.move_to("2023-03-30 13:33:00+00:00")
+    mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=get_two_devices(),
+    )
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.random.uniform", return_value=0
+    )
+    config_entry = await async_init_integration(
+        hass, options={CONF_ADAPTIVE_POLLING: True, CONF_ACTIVE_WINDOW: 300}
+    )
+    assert config_entry.state is ConfigEntryState.LOADED
+    dc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceDataUpdateCoordinator)
+    )
+
+    # An idle device backs off toward the idle ceiling at its phase
+    for cycle in (1200, IDLE_MAX_REFRESH_CYCLE, IDLE_MAX_REFRESH_CYCLE):
+        await dc.async_refresh()
+        assert_phased_interval(dc, cycle)
+
+    # An activity polls the device faster during the active window
+    dc.note_activity()
+    assert dc.update_interval.total_seconds() == ACTIVE_REFRESH_CYCLE
+    await dc.async_refresh()
+    assert_phased_interval(dc, ACTIVE_REFRESH_CYCLE)
+
+    # After the active window the device backs off again
+    freezer.tick(timedelta(seconds=301))
+    await dc.async_refresh()
+    assert_phased_interval(dc, DATA_REFRESH_CYCLE)
+
+    # An offline device backs off toward the offline ceiling
+    dc.device._device_json[CONST.LAST_DISCONNECTED] = "2023-03-30T13:00:00+00:00"
+    assert dc.is_offline
+    for _ in range(4):
+        await dc.async_refresh()
+    assert_phased_interval(dc, OFFLINE_MAX_REFRESH_CYCLE)
+
+    # A device that never disconnected isn't offline
+    dc.device._device_json.pop(CONST.LAST_DISCONNECTED)
+    assert not dc.is_offline
+
+
+async def test_local_coord_push(hass, remove_platforms, bypass_get_devices):
+    """Test the local events are pushed into the local coordinator."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    lc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceLocalUpdateCoordinator)
+    )
+    dc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceDataUpdateCoordinator)
+    )
+    # The local coordinator isn't polled
+    assert lc.update_interval is None
+
+    entity_id = "sensor.frontdoor_last_local_button_event"
+    assert hass.states.get(entity_id).state == "unknown"
+
+    # A local event from the event server notifies the device entities
+    lc.device.set_local_event_message(CONST.BUTTON_PRESSED)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state != "unknown"
+    assert dc.latest_activity >= lc.device.latest_local_doorbell_event_time
+
+    # The local events are no longer pushed once the entry is unloaded
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert "set_local_event_message" not in lc.device.__dict__
+
+
+async def test_device_coord_change_detection(
+    hass, remove_platforms, bypass_get_devices, mocker
+):
+    """Test only the entities whose device fields changed are updated."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    dc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceDataUpdateCoordinator)
+    )
+    write_state = mocker.spy(SkybellEntity, "async_write_ha_state")
+
+    # An unchanged device doesn't update the entities
+    await dc.async_refresh()
+    assert dc.changed_fields == set()
+    write_state.assert_not_called()
+
+    # A changed field only updates the entities built from the field
+    dc.device._device_json[CONST.SETTINGS][CONST.OUTDOOR_CHIME_VOLUME] = 0
+    await dc.async_refresh()
+    assert dc.changed_fields == {CONST.OUTDOOR_CHIME_VOLUME}
+    assert write_state.call_count == 2
+    state = hass.states.get("sensor.frontdoor_outdoor_chime_volume")
+    assert state.state == "Low"
+
+    # A failed update updates all the entities of the device
+    write_state.reset_mock()
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.SkybellDevice.async_update",
+        side_effect=SkybellException,
+    )
+    await dc.async_refresh()
+    assert not dc.last_update_success
+    assert write_state.call_count == len(dc._listeners)
+
+    # The field index is emptied when the entities are removed
+    assert dc._field_listeners
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert not dc._field_listeners
+
+
+async def test_coord_throttled(
+    hass, remove_platforms, mocker, freezer: FrozenDateTimeFactory
+):
+    """Test the updates are deferred when the requests are throttled."""
+    freezer.move_to("2023-03-30 13:33:00+00:00")
+    get_devices = mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        side_effect=get_throttled_exception("60"),
+    )
+
+    # The setup is retried when the devices can't be fetched
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+    get_devices.side_effect = None
+    get_devices.return_value = get_one_device()
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    hc = config_entry.runtime_data.hub_coordinator
+    dc = next(
+        coordinator
+        for coordinator in config_entry.runtime_data.device_coordinators
+        if isinstance(coordinator, SkybellDeviceDataUpdateCoordinator)
+    )
+    limiter = config_entry.runtime_data.scheduler.limiter
+    get_devices.reset_mock()
+
+    # A throttled device update keeps the data and is retried after the backoff
+    data = dc.data
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.SkybellDevice.async_update",
+        side_effect=get_throttled_exception("60"),
+    )
+    await dc.async_refresh()
+    assert dc.last_update_success
+    assert dc.data is data
+    assert dc.update_interval.total_seconds() >= 60
+
+    # The other requests are deferred without being sent
+    await hc.async_refresh()
+    assert hc.last_update_success
+    assert hc.update_interval.total_seconds() > 50
+    get_devices.assert_not_called()
+
+    # The session refresh is deferred too
+    api = config_entry.runtime_data.api
+    api._cache["AuthenticationResult"]["ExpirationDate"] = datetime.now(timezone.utc)
+    refresh_session = mocker.patch(
+        "custom_components.skybellgen.coordinator.Skybell.async_refresh_session"
+    )
+    await hc.async_refresh()
+    assert hc.last_update_success
+    refresh_session.assert_not_called()
+    assert limiter.blocked_for(0) > 0
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
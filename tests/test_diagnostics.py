@@ -25,6 +25,16 @@ async def test_diagnostic_config(hass, remove_platforms, bypass_get_devices):
     dd = data[DEVICE_ID]
     device = dd["data"]
     assert "REDACTED" in device["account_id"]
+    timings = retval["info"]["setup_timings"]
+    assert {
+        "load_session",
+        "initialize",
+        "first_refresh",
+        "device_first_refresh",
+        "forward_entry_setups",
+        "total",
+    } <= timings.keys()
+    assert timings["total"] >= timings["first_refresh"]
 
 
 async def test_diagnostic_device(hass, remove_platforms, bypass_get_devices):
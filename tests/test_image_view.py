@@ -0,0 +1,96 @@
+"""Test SkyBellGen content-hash validated camera images."""
+
+# pylint: disable=protected-access
+
+from unittest.mock import AsyncMock, Mock
+
+from aiohttp import hdrs
+from aiohttp.test_utils import make_mocked_request
+
+from custom_components.skybellgen.image_view import (
+    IMAGE_VIEW_REGISTERED,
+    ImageHash,
+    SkybellCameraImageView,
+    async_register_image_view,
+)
+
+
+def get_camera(image_hash: str | None) -> Mock:
+    """Return a camera serving an image."""
+    camera = Mock(spec=["async_camera_image", "content_type", "use_stream_for_stills"])
+    if image_hash is not None:
+        camera.image_hash = image_hash
+    camera.async_camera_image = AsyncMock(return_value=b"image")
+    camera.content_type = "image/jpeg"
+    camera.use_stream_for_stills = False
+    return camera
+
+
+def test_image_hash():
+    """Test the hash is only computed again for a changed image."""
+    image_hash = ImageHash()
+    image = b"image"
+    first = image_hash.get(image)
+    assert first and image_hash.get(image) == first
+    assert image_hash.get(b"other") != first
+    assert not image_hash.get(b"")
+
+
+async def test_image_view(hass):
+    """Test the image is served with an ETag and validated."""
+    view = SkybellCameraImageView(Mock())
+    camera = get_camera("abc")
+
+    request = make_mocked_request("GET", "/?width=10&height=5")
+    response = await view.handle(request, camera)
+    assert response.body == b"image"
+    etag = response.headers[hdrs.ETAG]
+    assert etag == '"abc-10x5"'
+
+    # A client with the same image isn't sent it again
+    request = make_mocked_request(
+        "GET", "/?width=10&height=5", headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    camera.async_camera_image.reset_mock()
+    response = await view.handle(request, camera)
+    assert response.status == 304
+    assert response.headers[hdrs.ETAG] == etag
+    camera.async_camera_image.assert_not_awaited()
+
+    # The tags are compared whole and weakly
+    for if_none_match, status in (
+        ('"xabc-10x50"', 200),
+        ('"abc-10x5', 200),
+        (f'"other", W/{etag}', 304),
+        ("*", 304),
+    ):
+        response = await view.handle(
+            make_mocked_request(
+                "GET",
+                "/?width=10&height=5",
+                headers={hdrs.IF_NONE_MATCH: if_none_match},
+            ),
+            camera,
+        )
+        assert response.status == status
+
+    # A changed image is sent again
+    camera.image_hash = "def"
+    response = await view.handle(request, camera)
+    assert response.status == 200
+    assert response.headers[hdrs.ETAG] == '"def-10x5"'
+
+    # An image without a hash is served without an ETag
+    response = await view.handle(make_mocked_request("GET", "/"), get_camera(None))
+    assert response.body == b"image"
+    assert hdrs.ETAG not in response.headers
+
+
+async def test_register_image_view(hass):
+    """Test the view is only registered once."""
+    hass.http = Mock()
+    hass.data["camera"] = Mock()
+    async_register_image_view(hass)
+    async_register_image_view(hass)
+    hass.http.register_view.assert_called_once()
+    assert hass.data[IMAGE_VIEW_REGISTERED]
@@ -1,13 +1,20 @@
 """Test SkyBellGen setup process."""
 
+import subprocess
+import sys
+
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.skybellgen import async_setup_entry, async_unload_entry
-from custom_components.skybellgen.const import DOMAIN
+from custom_components.skybellgen import (
+    PLATFORMS,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.skybellgen.const import CONF_BATCHED_REFRESH, DOMAIN
 from custom_components.skybellgen.coordinator import (
     SkybellDeviceDataUpdateCoordinator,
     SkybellHubDataUpdateCoordinator,
@@ -16,6 +23,29 @@ from custom_components.skybellgen.coordinator import (
 from .conftest import async_init_integration
 from .const import MOCK_CONFIG
 
+# The dependencies the integration only imports when they are first used
+HEAVY_MODULES = (
+    "PIL.Image",
+    "botocore.auth",
+    "botocore.awsrequest",
+    "botocore.credentials",
+    "go2rtc_client",
+    "haffmpeg",
+    "homeassistant.components.ffmpeg",
+)
+
+# Imports the integration after the components Home Assistant always loads,
+# and prints the heavy modules it imported
+IMPORT_SCRIPT = """
+import importlib, sys
+import homeassistant.components.camera, homeassistant.components.http
+heavy = tuple(sys.argv[1].split(","))
+loaded = {name for name in sys.modules if name.startswith(heavy)}
+for module in sys.argv[2].split(","):
+    importlib.import_module(f"custom_components.skybellgen.{module}")
+print(",".join(sorted({n for n in sys.modules if n.startswith(heavy)} - loaded)))
+"""
+
 
 async def test_setup_and_unload_entry(
     hass,
@@ -72,3 +102,40 @@ async def test_setup_entry_auth_exception(hass, error_initialize_auth):
     # an error.
     with pytest.raises(ConfigEntryAuthFailed):
         assert await async_setup_entry(hass, config_entry)
+
+
+async def test_update_options_reload(
+    hass,
+    remove_platforms,
+    bypass_get_devices,
+):
+    """Test the entry is reloaded when the options change."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    hc = config_entry.runtime_data.hub_coordinator
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_BATCHED_REFRESH: False}
+    )
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert config_entry.runtime_data.hub_coordinator is not hc
+
+
+def test_import_heavy_modules():
+    """Test importing the integration doesn't import its heavy dependencies."""
+    modules = [*PLATFORMS, "config_flow", "diagnostics"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            IMPORT_SCRIPT,
+            ",".join(HEAVY_MODULES),
+            ",".join(modules),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,297 @@
+"""Test SkyBellGen warm livestream pool and go2rtc stream registry."""
+
+# pylint: disable=protected-access
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, PropertyMock
+
+from aiohttp import ClientError
+from aioskybellgen import SkybellDevice
+import aioskybellgen.helpers.const as CONST
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.skybellgen.const import (
+    CONF_WARM_LIVESTREAMS,
+    WARM_LIVESTREAM_IDLE_TIMEOUT,
+)
+from custom_components.skybellgen.coordinator import (
+    SkybellDeviceDataUpdateCoordinator,
+    SkybellDeviceLocalUpdateCoordinator,
+)
+from custom_components.skybellgen.livestream import (
+    SkybellGo2RtcStreams,
+    SkybellLivestreamPool,
+    SkybellLivestreamViewers,
+)
+
+from .conftest import async_init_integration
+from .const import DEVICE_ID
+
+
+async def test_livestream_pool(hass, freezer: FrozenDateTimeFactory):
+    """Test the livestreams are warmed up within the cap and cool down."""
+    pool = SkybellLivestreamPool(hass, ["a", "b", "c"], max_warm=2)
+    actions = {
+        device_id: (AsyncMock(), AsyncMock()) for device_id in ("a", "b", "c", "d")
+    }
+    unregister = {
+        device_id: pool.async_register(device_id, *device_actions)
+        for device_id, device_actions in actions.items()
+    }
+
+    # Only the designated devices are warmed up
+    pool.async_request_warm("d")
+    pool.async_request_warm("a")
+    await hass.async_block_till_done()
+    actions["d"][0].assert_not_called()
+    actions["a"][0].assert_awaited_once()
+    assert pool.is_warm("a")
+
+    # A warm livestream only restarts its idle timer
+    freezer.tick(timedelta(seconds=WARM_LIVESTREAM_IDLE_TIMEOUT / 2))
+    await pool.async_warm("a")
+    actions["a"][0].assert_awaited_once()
+
+    # The oldest livestream cools down when the cap is reached
+    await pool.async_warm("b")
+    await pool.async_warm("c")
+    actions["a"][1].assert_awaited_once()
+    assert not pool.is_warm("a")
+    assert pool.is_warm("b")
+    assert pool.is_warm("c")
+
+    # The idle livestreams cool down
+    freezer.tick(timedelta(seconds=WARM_LIVESTREAM_IDLE_TIMEOUT + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    actions["b"][1].assert_awaited_once()
+    actions["c"][1].assert_awaited_once()
+    assert not pool.is_warm("b")
+
+    # Failures are logged and a failed warm up isn't kept warm
+    actions["b"][0].side_effect = HomeAssistantError
+    await pool.async_warm("b")
+    assert not pool.is_warm("b")
+    actions["c"][1].side_effect = HomeAssistantError
+    await pool.async_warm("c")
+    await pool.async_cool("c")
+    await pool.async_cool("c")
+    assert actions["c"][1].await_count == 2
+
+    # An unregistered livestream is forgotten and the rest cool down on shutdown
+    await pool.async_warm("a")
+    await pool.async_warm("c")
+    unregister["a"]()
+    assert not pool.is_warm("a")
+    await pool.async_shutdown()
+    assert not pool.is_warm("c")
+    assert actions["c"][1].await_count == 3
+    unregister["c"]()
+
+
+async def test_livestream_pool_concurrent_warm(hass):
+    """Test concurrent warm ups don't exceed the cap."""
+    pool = SkybellLivestreamPool(hass, ["a", "b", "c"], max_warm=1)
+    cooling = asyncio.Event()
+
+    async def _async_cool_down() -> None:
+        await cooling.wait()
+
+    for device_id in ("a", "b", "c"):
+        pool.async_register(device_id, AsyncMock(), _async_cool_down)
+    await pool.async_warm("a")
+
+    # The second warm up waits for the first one to cool down the oldest
+    warms = [
+        hass.async_create_task(pool.async_warm(device_id)) for device_id in ("b", "c")
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    cooling.set()
+    await asyncio.gather(*warms)
+    assert [pool.is_warm(device_id) for device_id in ("a", "b", "c")] == [
+        False,
+        False,
+        True,
+    ]
+    await pool.async_shutdown()
+
+
+async def test_livestream_pool_events(
+    hass, remove_platforms, bypass_get_devices, mocker
+):
+    """Test the livestream is warmed up by the events of the device."""
+    config_entry = await async_init_integration(
+        hass, options={CONF_WARM_LIVESTREAMS: [DEVICE_ID]}
+    )
+    assert config_entry.state is ConfigEntryState.LOADED
+    pool = config_entry.runtime_data.livestream_pool
+    warm = mocker.patch.object(pool, "async_warm")
+    pool.async_register(DEVICE_ID, AsyncMock(), AsyncMock())
+    lc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceLocalUpdateCoordinator)
+    )
+    dc = next(
+        dc
+        for dc in config_entry.runtime_data.device_coordinators
+        if isinstance(dc, SkybellDeviceDataUpdateCoordinator)
+    )
+
+    # A local button press warms up the livestream
+    lc.device.set_local_event_message(CONST.BUTTON_PRESSED)
+    await hass.async_block_till_done()
+    warm.assert_called_once_with(DEVICE_ID)
+
+    # A recent event found by a refresh warms up the livestream
+    warm.reset_mock()
+    mocker.patch.object(
+        SkybellDevice,
+        "latest_motion_event_time",
+        new_callable=PropertyMock,
+        return_value=datetime.now(timezone.utc),
+    )
+    await dc.async_refresh()
+    await hass.async_block_till_done()
+    warm.assert_called_once_with(DEVICE_ID)
+
+    # The same event doesn't warm up the livestream again
+    await dc.async_refresh()
+    await hass.async_block_till_done()
+    warm.assert_called_once_with(DEVICE_ID)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_go2rtc_streams():
+    """Test the go2rtc producers are cached by the stream registry."""
+    rest_client = Mock()
+    rest_client.streams.list = AsyncMock(
+        return_value={"camera.other": Mock(producers=[Mock(url="webrtc:other")])}
+    )
+    rest_client.streams.add = AsyncMock()
+    go2rtc_streams = SkybellGo2RtcStreams(rest_client, "http://go2rtc", Mock())
+
+    # The first producer lists the streams and adds the producer
+    await go2rtc_streams.async_register("camera.live", "webrtc:a")
+    rest_client.streams.list.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once_with("camera.live", ["webrtc:a"])
+
+    # A registered producer doesn't call go2rtc
+    await go2rtc_streams.async_register("camera.live", "webrtc:a")
+    await go2rtc_streams.async_register("camera.other", "webrtc:other")
+    rest_client.streams.list.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once()
+
+    # A new producer replaces the producer without listing the streams
+    await go2rtc_streams.async_register("camera.live", "webrtc:b")
+    rest_client.streams.list.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_with("camera.live", ["webrtc:b"])
+
+    # An invalidated stream is added again
+    rest_client.streams.add.reset_mock()
+    go2rtc_streams.async_invalidate("camera.live")
+    await go2rtc_streams.async_register("camera.live", "webrtc:b")
+    rest_client.streams.list.assert_awaited_once()
+    rest_client.streams.add.assert_awaited_once_with("camera.live", ["webrtc:b"])
+
+    # A failed registration lists the streams again and is retried once
+    rest_client.streams.add.side_effect = [ClientError("boom"), None]
+    await go2rtc_streams.async_register("camera.live", "webrtc:c")
+    assert rest_client.streams.list.await_count == 2
+    assert rest_client.streams.add.await_count == 3
+    rest_client.streams.add.side_effect = ClientError("boom")
+    with pytest.raises(ClientError):
+        await go2rtc_streams.async_register("camera.live", "webrtc:d")
+    rest_client.streams.add.side_effect = None
+
+    # A stale cache is refreshed from go2rtc
+    go2rtc_streams = SkybellGo2RtcStreams(rest_client, "http://go2rtc", Mock(), ttl=-1)
+    await go2rtc_streams.async_register("camera.other", "webrtc:other")
+    await go2rtc_streams.async_register("camera.other", "webrtc:other")
+    assert rest_client.streams.list.await_count == 5
+
+
+async def test_livestream_viewers(hass, freezer: FrozenDateTimeFactory):
+    """Test the viewers share the livestream and it lingers after the last."""
+    start = AsyncMock()
+    release = AsyncMock()
+    viewers = SkybellLivestreamViewers(hass, start, release, linger=30)
+
+    # Only the first viewer starts the livestream
+    await viewers.async_attach("a")
+    await viewers.async_attach("b")
+    assert viewers.count == 2
+    start.assert_awaited_once()
+
+    # The livestream lingers after the last viewer
+    viewers.async_detach("a")
+    viewers.async_detach("a")
+    viewers.async_detach("b")
+    assert viewers.count == 0
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    release.assert_not_awaited()
+
+    # A viewer that rejoins keeps the livestream
+    await viewers.async_attach("a")
+    assert start.await_count == 2
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    release.assert_not_awaited()
+
+    # The livestream is released once the linger expires
+    viewers.async_detach("a")
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    release.assert_awaited_once()
+
+    # A failed release is logged
+    release.side_effect = HomeAssistantError("boom")
+    await viewers.async_attach("a")
+    viewers.async_detach("a")
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert release.await_count == 2
+
+    # A pending linger is cancelled on shutdown
+    await viewers.async_attach("a")
+    viewers.async_detach("a")
+    viewers.async_shutdown()
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert release.await_count == 2
+
+
+async def test_livestream_viewers_failed_start(hass):
+    """Test the viewers joining a pending start leave when it fails."""
+    start = AsyncMock()
+    viewers = SkybellLivestreamViewers(hass, start, AsyncMock(), linger=30)
+    started = asyncio.Event()
+
+    async def _start() -> None:
+        await started.wait()
+        raise HomeAssistantError("boom")
+
+    start.side_effect = _start
+    first = hass.async_create_task(viewers.async_attach("a"))
+    second = hass.async_create_task(viewers.async_attach("b"))
+    await asyncio.sleep(0)
+    assert viewers.count == 2
+    started.set()
+    for task in (first, second):
+        with pytest.raises(HomeAssistantError):
+            await task
+    assert viewers.count == 0
+    start.assert_awaited_once()
@@ -0,0 +1,188 @@
+"""Test SkyBellGen on-disk media cache."""
+
+# pylint: disable=protected-access
+
+import asyncio
+import os
+from unittest.mock import patch
+
+from aiohttp import ClientError
+from aioskybellgen import SkybellDevice
+from aioskybellgen.exceptions import SkybellException
+import aioskybellgen.helpers.const as CONST
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.skybellgen import async_remove_entry, media_cache_path
+from custom_components.skybellgen.coordinator import SkybellDeviceDataUpdateCoordinator
+from custom_components.skybellgen.media_cache import (
+    MEDIA_CLIP,
+    MEDIA_SNAPSHOT,
+    SkybellMediaCache,
+)
+
+from .conftest import async_init_integration
+from .const import DEVICE_ID
+
+
+async def _chunks(*chunks: bytes):
+    """Yield the chunks of a response."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_media_cache(
+    hass, remove_platforms, bypass_get_devices, tmp_path, freezer: FrozenDateTimeFactory
+):
+    """Test the media is cached with size and age eviction."""
+    media_cache = SkybellMediaCache(hass, str(tmp_path), max_size=10, max_age=60)
+    await media_cache.async_load()
+    assert media_cache.size == 0
+
+    await media_cache.async_write("dev", "a", MEDIA_CLIP, b"aaaa")
+    await media_cache.async_write("dev", "b", MEDIA_CLIP, b"bbbb")
+    assert await media_cache.async_read("dev", "a", MEDIA_CLIP) == b"aaaa"
+    assert media_cache.get_path("dev", "a", MEDIA_CLIP) == str(tmp_path / "dev_a.mp4")
+    assert await media_cache.async_read("dev", "a", MEDIA_SNAPSHOT) is None
+
+    # The least recently used file is evicted from a full cache
+    await media_cache.async_write("dev", "c", MEDIA_SNAPSHOT, b"cccc")
+    assert media_cache.get_path("dev", "b", MEDIA_CLIP) is None
+    assert not os.path.exists(tmp_path / "dev_b.mp4")
+    assert media_cache.size == 8
+
+    # The cache is indexed from the files
+    media_cache = SkybellMediaCache(hass, str(tmp_path), max_size=10, max_age=60)
+    await media_cache.async_load()
+    assert await media_cache.async_read("dev", "c", MEDIA_SNAPSHOT) == b"cccc"
+
+    # A missing file is dropped from the index
+    os.remove(tmp_path / "dev_c.jpg")
+    assert await media_cache.async_read("dev", "c", MEDIA_SNAPSHOT) is None
+    assert media_cache.size == 4
+
+    # A file removed from the disk is evicted
+    os.remove(tmp_path / "dev_a.mp4")
+    await media_cache.async_write("dev", "e", MEDIA_CLIP, b"e" * 10)
+    assert media_cache.get_path("dev", "a", MEDIA_CLIP) is None
+    assert media_cache.size == 10
+
+    # Expired files aren't served and are evicted
+    freezer.tick(61)
+    assert media_cache.get_path("dev", "e", MEDIA_CLIP) is None
+    await media_cache.async_load()
+    assert media_cache.size == 0
+    assert not os.listdir(tmp_path)
+
+    # A failed write isn't cached
+    with patch.object(media_cache, "_write", side_effect=OSError("full")):
+        await media_cache.async_write("dev", "d", MEDIA_CLIP, b"dddd")
+    assert media_cache.get_path("dev", "d", MEDIA_CLIP) is None
+
+    # The files of a removed entry are deleted
+    entry = await async_init_integration(hass)
+    assert entry.state is ConfigEntryState.LOADED
+    os.makedirs(media_cache_path(hass, entry), exist_ok=True)
+    await async_remove_entry(hass, entry)
+    assert not os.path.exists(media_cache_path(hass, entry))
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_media_cache_write(hass, tmp_path):
+    """Test concurrent writes of a media don't collide and failures clean up."""
+    media_cache = SkybellMediaCache(hass, str(tmp_path))
+    await asyncio.gather(
+        media_cache.async_write("dev", "a", MEDIA_CLIP, b"aaaa"),
+        media_cache.async_write("dev", "a", MEDIA_CLIP, b"bbbb"),
+    )
+    assert os.listdir(tmp_path) == ["dev_a.mp4"]
+    assert await media_cache.async_read("dev", "a", MEDIA_CLIP) in (b"aaaa", b"bbbb")
+
+    # The temporary file of a failed write is removed
+    with patch(
+        "custom_components.skybellgen.media_cache.os.replace",
+        side_effect=OSError("full"),
+    ):
+        await media_cache.async_write("dev", "b", MEDIA_CLIP, b"bb")
+    assert media_cache.get_path("dev", "b", MEDIA_CLIP) is None
+    assert os.listdir(tmp_path) == ["dev_a.mp4"]
+
+
+async def test_media_prefetch(
+    hass, remove_platforms, bypass_get_devices, tmp_path, mocker
+):
+    """Test the clip and snapshot of a new activity are prefetched."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    media_cache = SkybellMediaCache(hass, str(tmp_path))
+    config_entry.runtime_data.media_cache = media_cache
+    dc = next(
+        coordinator
+        for coordinator in config_entry.runtime_data.device_coordinators
+        if isinstance(coordinator, SkybellDeviceDataUpdateCoordinator)
+    )
+    activity = {CONST.ACTIVITY_ID: "act0", CONST.VIDEO_URL: "video1"}
+    mocker.patch.object(SkybellDevice, "latest", return_value=activity)
+    get_url = mocker.patch.object(
+        SkybellDevice, "async_get_activity_video_url", return_value="http://clip/1"
+    )
+    session = mocker.patch(
+        "custom_components.skybellgen.coordinator.async_get_clientsession"
+    ).return_value
+    session.get.return_value.__aenter__.return_value.configure_mock(
+        content_length=None, **{"content.iter_chunked": lambda _: _chunks(b"cl", b"ip")}
+    )
+    dc.device.images[CONST.ACTIVITY] = b"image"
+
+    async def async_refresh(activity_id: str) -> None:
+        activity[CONST.ACTIVITY_ID] = activity_id
+        await dc.async_refresh()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # The activity known at startup isn't prefetched
+    dc._latest_activity_id = None
+    await async_refresh("act0")
+    get_url.assert_not_awaited()
+    assert media_cache.size == 0
+
+    await async_refresh("act1")
+    get_url.assert_awaited_once_with("video1")
+    session.get.assert_called_once_with("http://clip/1", raise_for_status=True)
+    assert await media_cache.async_read(DEVICE_ID, "act1", MEDIA_CLIP) == b"clip"
+    assert await media_cache.async_read(DEVICE_ID, "act1", MEDIA_SNAPSHOT) == b"image"
+
+    # A known activity isn't prefetched again
+    await async_refresh("act1")
+    get_url.assert_awaited_once()
+
+    # Failed prefetches aren't cached
+    for side_effect, act_id in (
+        (SkybellException("boom"), "act2"),
+        (ClientError("boom"), "act3"),
+        ("", "act4"),
+    ):
+        if isinstance(side_effect, str):
+            get_url.side_effect = None
+            get_url.return_value = side_effect
+        else:
+            get_url.side_effect = side_effect
+        await async_refresh(act_id)
+        assert media_cache.get_path(DEVICE_ID, act_id, MEDIA_CLIP) is None
+
+    # Clips larger than the limit aren't cached
+    mocker.patch("custom_components.skybellgen.coordinator.MEDIA_CLIP_MAX_SIZE", 3)
+    get_url.side_effect = None
+    get_url.return_value = "http://clip/6"
+    for content_length, act_id in ((4, "act6"), (None, "act7")):
+        session.get.return_value.__aenter__.return_value.content_length = content_length
+        await async_refresh(act_id)
+        assert media_cache.get_path(DEVICE_ID, act_id, MEDIA_CLIP) is None
+
+    # An activity without a clip only caches the snapshot
+    get_url.reset_mock()
+    activity[CONST.VIDEO_URL] = ""
+    await async_refresh("act5")
+    get_url.assert_not_awaited()
+    assert media_cache.get_path(DEVICE_ID, "act5", MEDIA_SNAPSHOT) is not None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,66 @@
+"""Test SkyBellGen rate limiter."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from aioskybellgen.exceptions import SkybellException
+
+from custom_components.skybellgen.const import (
+    MAX_THROTTLE_BACKOFF,
+    REQUEST_BURST,
+    REQUEST_RATE,
+    THROTTLE_BACKOFF,
+)
+from custom_components.skybellgen.ratelimit import (
+    SkybellRateLimiter,
+    parse_retry_after,
+    throttle_retry_after,
+)
+
+from .conftest import get_throttled_exception
+
+
+def test_throttle_retry_after():
+    """Test the throttled requests are found in the exception chain."""
+    assert throttle_retry_after(get_throttled_exception("12")) == 12
+    assert throttle_retry_after(get_throttled_exception()) == 0
+    assert throttle_retry_after(SkybellException()) is None
+
+    # Other response errors aren't throttling
+    exc = get_throttled_exception()
+    exc.__cause__.status = 500
+    assert throttle_retry_after(exc) is None
+
+
+def test_parse_retry_after():
+    """Test the Retry-After header as delay seconds or an HTTP date."""
+    assert parse_retry_after(None) == 0
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("not a date") == 0
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert 100 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 120
+    assert 100 < parse_retry_after(format_datetime(retry_at.replace(tzinfo=None)))
+
+
+def test_rate_limiter(mocker):
+    """Test the token bucket and the throttling backoff."""
+    mocker.patch(
+        "custom_components.skybellgen.ratelimit.random.uniform", return_value=0
+    )
+    limiter = SkybellRateLimiter()
+
+    # A burst of requests runs without waiting, then the requests are paced
+    for _ in range(REQUEST_BURST):
+        assert limiter.reserve(100) == 0
+    assert limiter.reserve(100) == 1 / REQUEST_RATE
+    assert limiter.reserve(100 + 2 / REQUEST_RATE) == 0
+
+    # The backoff doubles for each throttled request until it is reset
+    assert limiter.throttled(200, 0) == THROTTLE_BACKOFF
+    assert limiter.blocked_for(200 + THROTTLE_BACKOFF / 2) == THROTTLE_BACKOFF / 2
+    assert limiter.throttled(300, 0) == THROTTLE_BACKOFF * 2
+    assert limiter.throttled(400, MAX_THROTTLE_BACKOFF * 2) == MAX_THROTTLE_BACKOFF * 2
+    limiter.succeeded()
+    assert limiter.throttled(5000, 0) == THROTTLE_BACKOFF
+    assert limiter.blocked_for(6000) == 0
@@ -0,0 +1,126 @@
+"""Test SkyBellGen request scheduler."""
+
+import asyncio
+
+from aioskybellgen.exceptions import SkybellException
+import pytest
+
+from custom_components.skybellgen.ratelimit import SkybellThrottledException
+from custom_components.skybellgen.scheduler import (
+    RequestPriority,
+    SkybellRequestScheduler,
+)
+
+from .conftest import get_throttled_exception
+
+
+class _Requests:
+    """Requests that hold their slot until the release event is set."""
+
+    def __init__(self, scheduler: SkybellRequestScheduler) -> None:
+        """Initialize the requests of the scheduler."""
+        self.scheduler = scheduler
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+
+    async def async_request(
+        self, device_id: str | None, priority: RequestPriority, name: str
+    ) -> None:
+        """Run a request that waits for the release event."""
+        async with self.scheduler.async_slot(device_id, priority):
+            self.started.append(name)
+            await self.release.wait()
+
+
+async def test_scheduler_order(hass):
+    """Test the cap, the priority classes and the per-device order."""
+    scheduler = SkybellRequestScheduler(max_in_flight=2, max_background=1)
+    requests = _Requests(scheduler)
+    started, release = requests.started, requests.release
+
+    def request(device_id, priority, name):
+        return hass.async_create_task(requests.async_request(device_id, priority, name))
+
+    tasks = [
+        request("a", RequestPriority.BACKGROUND, "poll_a"),
+        request("b", RequestPriority.BACKGROUND, "poll_b"),
+        request("a", RequestPriority.INTERACTIVE, "write_a"),
+        request("c", RequestPriority.INTERACTIVE, "write_c"),
+        request("d", RequestPriority.INTERACTIVE, "write_d"),
+    ]
+    await asyncio.sleep(0)
+    # A single background poll runs and the interactive request of another
+    # device uses the free slot. The write of device a waits behind its poll.
+    assert started == ["poll_a", "write_c"]
+    assert scheduler.in_flight == 2
+    assert scheduler.pending == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    # The interactive requests run ahead of the waiting poll
+    assert started == ["poll_a", "write_c", "write_a", "write_d", "poll_b"]
+    assert scheduler.in_flight == 0
+    assert scheduler.pending == 0
+
+
+async def test_scheduler_cancel(hass):
+    """Test a cancelled request gives up its place or its slot."""
+    scheduler = SkybellRequestScheduler(max_in_flight=1)
+    requests = _Requests(scheduler)
+    started, release = requests.started, requests.release
+
+    running = hass.async_create_task(
+        requests.async_request(None, RequestPriority.BACKGROUND, "hub")
+    )
+    waiting = hass.async_create_task(
+        requests.async_request("a", RequestPriority.INTERACTIVE, "a")
+    )
+    await asyncio.sleep(0)
+    assert started == ["hub"]
+
+    # Cancel a request that is waiting for a slot
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.pending == 0
+
+    # Cancel a request after it was granted the slot but before it ran
+    release.set()
+    await running
+    async with scheduler.async_slot(None):
+        granted = hass.async_create_task(
+            requests.async_request("b", RequestPriority.INTERACTIVE, "b")
+        )
+        await asyncio.sleep(0)
+        assert scheduler.pending == 1
+    granted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await granted
+    assert started == ["hub"]
+    assert scheduler.in_flight == 0
+
+
+async def test_scheduler_throttle(hass, mocker):
+    """Test the requests are paced and deferred while throttled."""
+    scheduler = SkybellRequestScheduler()
+    sleep = mocker.patch("custom_components.skybellgen.scheduler.asyncio.sleep")
+    mocker.patch.object(scheduler.limiter, "reserve", return_value=0.5)
+    async with scheduler.async_slot("a"):
+        pass
+    sleep.assert_called_once_with(0.5)
+
+    # Other errors are passed through
+    with pytest.raises(SkybellException) as exc_info:
+        async with scheduler.async_slot("a"):
+            raise SkybellException
+    assert not isinstance(exc_info.value, SkybellThrottledException)
+
+    # A throttled request blocks the requests of the entry
+    with pytest.raises(SkybellThrottledException) as exc_info:
+        async with scheduler.async_slot("a", RequestPriority.INTERACTIVE):
+            raise get_throttled_exception("60")
+    assert exc_info.value.retry_after >= 60
+    with pytest.raises(SkybellThrottledException):
+        async with scheduler.async_slot("b"):
+            pytest.fail("Unexpected request")  # pragma no cover
+    assert scheduler.in_flight == 0
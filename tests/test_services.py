@@ -1,15 +1,34 @@
 """Test SkyBellGen services."""
 
+# pylint: disable=protected-access
+
+from unittest.mock import AsyncMock, Mock, PropertyMock, call
+
+from aioskybellgen import SkybellDevice
+from aioskybellgen.exceptions import SkybellException
+from aioskybellgen.helpers import const as CONST
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.skybellgen import SkybellData
 from custom_components.skybellgen.const import (
     DOMAIN,
+    SERVICE_APPLY_SETTINGS,
     SERVICE_CONF_INTERFACE,
+    SERVICE_CONF_SETTINGS,
     SERVICE_START_LOCAL_EVENT_SERVER,
     SERVICE_STOP_LOCAL_EVENT_SERVER,
 )
+from custom_components.skybellgen.coordinator import SkybellDeviceDataUpdateCoordinator
+
+from .conftest import async_init_integration, get_throttled_exception, get_two_devices
 
-from .conftest import async_init_integration
+# The driver's setting call, which the conftest bypasses for the entity tests
+ASYNC_SET_SETTING = SkybellDevice.async_set_setting
 
 
 async def test_local_server(hass, remove_platforms, bypass_get_devices, mocker):
@@ -46,3 +65,218 @@ async def test_local_server(hass, remove_platforms, bypass_get_devices, mocker):
         None,
         blocking=True,
     )
+
+
+async def test_apply_settings(hass, remove_platforms, mocker):
+    """Test the settings are applied to the devices."""
+    devices = get_two_devices()
+    mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=devices,
+    )
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    device_registry = dr.async_get(hass)
+    device_ids = [
+        device_registry.async_get_device(identifiers={(DOMAIN, device.device_id)}).id
+        for device in devices
+    ]
+    request = mocker.patch.object(
+        SkybellDevice,
+        "_async_settings_request",
+        return_value={CONST.INDOOR_CHIME: False},
+    )
+    mocker.patch.object(SkybellDevice, "async_set_setting", ASYNC_SET_SETTING)
+    update = mocker.patch.object(SkybellDevice, "async_update")
+    confirm = mocker.patch.object(
+        SkybellDeviceDataUpdateCoordinator, "async_confirm_fields"
+    )
+
+    # Each setting is sent to each device and only its fields are confirmed
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        {
+            ATTR_DEVICE_ID: device_ids,
+            SERVICE_CONF_SETTINGS: {
+                CONST.INDOOR_CHIME: False,
+                CONST.NORMAL_LED: False,
+            },
+        },
+        blocking=True,
+    )
+    assert [args.kwargs["json"] for args in request.call_args_list] == [
+        {CONST.INDOOR_CHIME: False},
+        {CONST.LED_COLOR: ""},
+    ] * 2
+    update.assert_not_called()
+    confirm.assert_awaited_with({CONST.INDOOR_CHIME, "normal_led_is_on", "led_color"})
+    for device in devices:
+        assert device.indoor_chime is False
+
+    # Changing the name or basic motion requires a full update of the device
+    request.reset_mock()
+    request.return_value = {CONST.SETTINGS: {}}
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        {
+            ATTR_DEVICE_ID: device_ids[0],
+            SERVICE_CONF_SETTINGS: {
+                CONST.NAME: "Back door",
+                CONST.NORMAL_LED: True,
+                CONST.BASIC_MOTION_NOTIFY: False,
+                CONST.BASIC_MOTION_HBD_NOTIFY: False,
+            },
+        },
+        blocking=True,
+    )
+    bodies = [args.kwargs["json"] for args in request.call_args_list]
+    assert bodies[0] == {CONST.DEVICE_NAME: "Back door"}
+    assert bodies[1][CONST.LED_COLOR]
+    assert bodies[2][CONST.BASIC_MOTION][CONST.BASIC_MOTION_NOTIFY] is False
+    assert bodies[3][CONST.BASIC_MOTION][CONST.BASIC_MOTION_HBD_NOTIFY] is False
+    assert bodies[3][CONST.BASIC_MOTION][CONST.BASIC_MOTION_FD_NOTIFY] is True
+    assert update.call_args_list == [call(get_devices=True)] * 3
+    confirm.assert_awaited_with(
+        {
+            CONST.NAME,
+            "normal_led_is_on",
+            "led_color",
+            "basic_motion_notify",
+            "basic_motion_hbd_notify",
+        }
+    )
+
+    # Invalid settings are rejected by the driver before a request is sent
+    request.reset_mock()
+    devices[1]._device_json[CONST.SETTINGS].pop(CONST.TIMEZONE_INFO)
+    for settings in (
+        {CONST.NORMAL_LED: "on"},
+        {CONST.LOCATION_LAT: "north"},
+        {CONST.LOCATION_LAT: 1.0},
+        {CONST.INDOOR_CHIME: "on"},
+    ):
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_APPLY_SETTINGS,
+                {ATTR_DEVICE_ID: device_ids[1], SERVICE_CONF_SETTINGS: settings},
+                blocking=True,
+            )
+    request.assert_not_called()
+
+    # A shared device is read-only
+    readonly = mocker.patch.object(
+        SkybellDevice, "is_readonly", new_callable=PropertyMock, return_value=True
+    )
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY_SETTINGS,
+            {
+                ATTR_DEVICE_ID: device_ids,
+                SERVICE_CONF_SETTINGS: {CONST.INDOOR_CHIME: True},
+            },
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "invalid_permissions"
+    request.assert_not_called()
+    readonly.return_value = False
+
+    # Throttled requests are reported
+    request.side_effect = get_throttled_exception("60")
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY_SETTINGS,
+            {
+                ATTR_DEVICE_ID: device_ids,
+                SERVICE_CONF_SETTINGS: {CONST.INDOOR_CHIME: True},
+            },
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "rate_limited"
+    request.side_effect = None
+    request.reset_mock()
+
+    # Unknown devices are rejected
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY_SETTINGS,
+            {
+                ATTR_DEVICE_ID: "unknown_device",
+                SERVICE_CONF_SETTINGS: {CONST.INDOOR_CHIME: True},
+            },
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "invalid_device"
+    request.assert_not_called()
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_apply_settings_entries(hass, remove_platforms, mocker):
+    """Test the settings are applied to the hub config entries concurrently."""
+    devices = get_two_devices()
+    mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=devices,
+    )
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    device_registry = dr.async_get(hass)
+    device_ids = [
+        device_registry.async_get_device(identifiers={(DOMAIN, device.device_id)}).id
+        for device in devices
+    ]
+
+    # Move the second device to another hub config entry
+    other_entry = MockConfigEntry(domain=DOMAIN, entry_id="other", unique_id="other")
+    other_entry.add_to_hass(hass)
+    other_entry.mock_state(hass, ConfigEntryState.LOADED)
+    other_entry.runtime_data = SkybellData(hub_coordinator=Mock())
+    apply_other = other_entry.runtime_data.hub_coordinator.async_apply_settings = (
+        AsyncMock(side_effect=SkybellException("boom"))
+    )
+    device_registry.async_update_device(
+        device_ids[1],
+        add_config_entry_id=other_entry.entry_id,
+        remove_config_entry_id=config_entry.entry_id,
+    )
+    mocker.patch.object(SkybellDevice, "async_set_setting", ASYNC_SET_SETTING)
+    request = mocker.patch.object(
+        SkybellDevice,
+        "_async_settings_request",
+        return_value={CONST.INDOOR_CHIME: True},
+    )
+    service_data = {
+        ATTR_DEVICE_ID: device_ids,
+        SERVICE_CONF_SETTINGS: {CONST.INDOOR_CHIME: True},
+    }
+
+    # The error of a single failed entry is raised as is
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_APPLY_SETTINGS, service_data, blocking=True
+        )
+    assert exc_info.value.translation_key == "invalid_setting"
+    request.assert_called_once()
+    assert devices[0].indoor_chime is True
+    apply_other.assert_awaited_once_with(
+        {CONST.INDOOR_CHIME: True}, {devices[1].device_id}
+    )
+
+    # The errors of several failed entries are aggregated
+    request.side_effect = get_throttled_exception("60")
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_APPLY_SETTINGS, service_data, blocking=True
+        )
+    assert exc_info.value.translation_key == "apply_settings_failed"
+    assert apply_other.await_count == 2
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
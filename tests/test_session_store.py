@@ -0,0 +1,154 @@
+"""Test SkyBellGen persisted session."""
+
+# pylint: disable=protected-access
+
+from datetime import datetime, timezone
+import os
+from unittest.mock import Mock
+
+from aioskybellgen import SkybellDevice
+import aioskybellgen.helpers.const as CONST
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.skybellgen.const import CONF_WARM_START
+from custom_components.skybellgen.coordinator import (
+    SkybellDeviceDataUpdateCoordinator,
+    SkybellHubDataUpdateCoordinator,
+)
+from custom_components.skybellgen.session_store import (
+    SkybellSession,
+    SkybellSessionStore,
+    legacy_cache_path,
+)
+
+from .conftest import async_init_integration, get_one_device, get_two_devices
+from .const import DEVICE_ID, USER_ID
+
+
+async def test_session_store(hass, hass_storage, mocker):
+    """Test the auth tokens and device state are stored apart."""
+    expiration = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    legacy_path = legacy_cache_path(hass, USER_ID)
+    with open(legacy_path, "wb") as file:
+        file.write(b"pickle")
+    store = SkybellSessionStore(hass, USER_ID)
+    await store.async_load()
+    assert not store.auth and not store.devices
+    assert not os.path.exists(legacy_path)
+
+    # The API saves its auth tokens to the store
+    api = SkybellSession(store, username="user", password="pass", session=Mock())
+    await api.async_update_cache(
+        {CONST.AUTHENTICATION_RESULT: {"token": "a", CONST.EXPIRATION_DATE: expiration}}
+    )
+    auth_key = f"skybellgen.{USER_ID}.auth"
+    assert hass_storage[auth_key]["data"]["token"] == "a"
+
+    # Unchanged device state isn't saved again
+    devices = get_two_devices()
+    delay_save = mocker.spy(store._devices_store, "async_delay_save")
+    store.async_save_devices(devices)
+    store.async_save_devices(devices)
+    delay_save.assert_called_once()
+    await store.async_flush()
+    devices_key = f"skybellgen.{USER_ID}.devices"
+    assert set(hass_storage[devices_key]["data"]) == {
+        device.device_id for device in devices
+    }
+
+    # The tokens and device state are loaded by the next session
+    store = SkybellSessionStore(hass, USER_ID)
+    await store.async_load()
+    assert store.auth[CONST.EXPIRATION_DATE] == expiration
+    assert store.devices.keys() == hass_storage[devices_key]["data"].keys()
+    api = SkybellSession(store, username="user", password="pass", session=Mock())
+    assert api.cache(CONST.AUTHENTICATION_RESULT)["token"] == "a"
+
+    # Deleting the cache only removes the auth tokens
+    await api.async_delete_cache()
+    assert not api.cache(CONST.AUTHENTICATION_RESULT)
+    assert auth_key not in hass_storage
+    assert devices_key in hass_storage
+
+    await store.async_remove()
+    assert devices_key not in hass_storage
+
+
+async def test_session_survives_reload(
+    hass, hass_storage, remove_platforms, bypass_get_devices
+):
+    """Test the device state is kept on reload and removed with the entry."""
+    entry = await async_init_integration(hass)
+    assert entry.state is ConfigEntryState.LOADED
+    devices_key = f"skybellgen.{entry.unique_id}.devices"
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert devices_key in hass_storage
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    assert devices_key not in hass_storage
+
+
+def store_devices(hass_storage) -> None:
+    """Persist the devices of a previous session."""
+    device_json = get_two_devices()[0]._device_json
+    hass_storage[f"skybellgen.{USER_ID}.devices"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"skybellgen.{USER_ID}.devices",
+        "data": {DEVICE_ID: device_json},
+    }
+
+
+async def test_warm_start(hass, hass_storage, remove_platforms, mocker):
+    """Test the setup uses the persisted devices and reconciles them later."""
+    get_devices = mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=get_one_device(),
+    )
+    store_devices(hass_storage)
+    update = mocker.patch.object(SkybellDevice, "async_update")
+    reconcile = mocker.patch.object(SkybellHubDataUpdateCoordinator, "async_reconcile")
+
+    # The setup doesn't wait on the cloud
+    entry = await async_init_integration(hass, {CONF_WARM_START: True})
+    assert entry.state is ConfigEntryState.LOADED
+    reconcile.assert_called_once()
+    hub = entry.runtime_data.hub_coordinator
+    dc = next(
+        coordinator
+        for coordinator in entry.runtime_data.device_coordinators
+        if isinstance(coordinator, SkybellDeviceDataUpdateCoordinator)
+    )
+    assert hub.stale and dc.stale
+    assert dc.device.device_id == DEVICE_ID
+    get_devices.assert_not_awaited()
+    update.assert_not_awaited()
+
+    # The devices are reconciled with the cloud
+    mocker.stop(reconcile)
+    await hub.async_reconcile()
+    assert not hub.stale and not dc.stale
+    get_devices.assert_awaited()
+    update.assert_awaited()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_warm_start_disabled(hass, hass_storage, remove_platforms, mocker):
+    """Test the setup retrieves the devices unless the warm start is enabled."""
+    get_devices = mocker.patch(
+        "custom_components.skybellgen.Skybell.async_get_devices",
+        return_value=get_one_device(),
+    )
+    store_devices(hass_storage)
+    mocker.patch.object(SkybellDevice, "async_update")
+
+    entry = await async_init_integration(hass)
+    assert entry.state is ConfigEntryState.LOADED
+    assert not entry.runtime_data.hub_coordinator.stale
+    get_devices.assert_awaited()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -1,17 +1,23 @@
 """Test SkyBellGen switch."""
 
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.components.switch import (
     DOMAIN as SWITCH_DOMAIN,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import ATTR_ENTITY_ID, STATE_ON, Platform
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, Platform
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 import homeassistant.helpers.entity_registry as er
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.skybellgen.const import SETTING_CONFIRM_DELAY
 
-from .conftest import async_init_integration
+from .conftest import async_init_integration, get_throttled_exception
 
 SWITCH = Platform.SWITCH
 
@@ -99,3 +105,52 @@ async def test_switch_acl(
         assert await hass.services.async_call(
             SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: entity_id}, blocking=True
         )
+
+
+async def test_switch_optimistic(
+    hass, remove_platforms, bypass_get_devices, mocker, freezer: FrozenDateTimeFactory
+):
+    """Test the setting changes are optimistic and confirmed by one refresh."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    update = mocker.patch(
+        "custom_components.skybellgen.coordinator.SkybellDevice.async_update"
+    )
+
+    # Turn off two switches, the states change before the device is refreshed
+    entity_ids = [TEST_ENTITY, "switch.frontdoor_detect_button_pressed"]
+    for entity_id in entity_ids:
+        assert hass.states.get(entity_id).state == STATE_ON
+        await hass.services.async_call(
+            SWITCH_DOMAIN, SERVICE_TURN_OFF, {ATTR_ENTITY_ID: entity_id}, blocking=True
+        )
+        assert hass.states.get(entity_id).state == STATE_OFF
+    update.assert_not_called()
+
+    # A single refresh confirms the changes after the debounce window. The
+    # device didn't change so the states are rolled back.
+    freezer.tick(timedelta(seconds=SETTING_CONFIRM_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    update.assert_called_once()
+    for entity_id in entity_ids:
+        assert hass.states.get(entity_id).state == STATE_ON
+
+
+async def test_switch_throttled(hass, remove_platforms, bypass_get_devices, mocker):
+    """Test a throttled setting change is reported."""
+    config_entry = await async_init_integration(hass)
+    assert config_entry.state is ConfigEntryState.LOADED
+    mocker.patch(
+        "custom_components.skybellgen.coordinator.SkybellDevice.async_set_setting",
+        side_effect=get_throttled_exception("60"),
+    )
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            SWITCH_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: TEST_ENTITY},
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "rate_limited"
+    assert hass.states.get(TEST_ENTITY).state == STATE_ON
@@ -0,0 +1,62 @@
+"""Test SkyBellGen resized camera images."""
+
+# pylint: disable=protected-access
+
+import asyncio
+import hashlib
+import io
+
+from PIL import Image
+
+from custom_components.skybellgen import thumbnail
+from custom_components.skybellgen.thumbnail import SkybellThumbnailCache
+
+
+def get_image(width: int = 100, height: int = 80, color: str = "green") -> bytes:
+    """Return a JPEG image of the size."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(output, format="JPEG")
+    return output.getvalue()
+
+
+async def test_thumbnails(hass, mocker):
+    """Test the resized images are cached by image and size."""
+    resize = mocker.patch.object(
+        thumbnail, "resize_image", wraps=thumbnail.resize_image
+    )
+    thumbnails = SkybellThumbnailCache(hass, max_size=2)
+    image = get_image()
+
+    # Concurrent requests share the resize
+    resized, again = await asyncio.gather(
+        thumbnails.async_resize("dev", image, 50, 50),
+        thumbnails.async_resize("dev", image, 50, 50),
+    )
+    assert resized is again
+    assert Image.open(io.BytesIO(resized)).size == (50, 40)
+    assert resize.call_count == 1
+
+    # A cached image isn't resized again
+    assert await thumbnails.async_resize("dev", image, 50, 50) is resized
+    assert resize.call_count == 1
+
+    # An image that fits the size isn't re-encoded
+    assert await thumbnails.async_resize("dev", image, 200, 200) is image
+
+    # A changed image is resized again and the least recently used is evicted
+    other = get_image(200, 160, "blue")
+    assert await thumbnails.async_resize("dev", other, 50, 50) != resized
+    assert resize.call_count == 3
+    assert len(thumbnails._images) == 2
+    await thumbnails.async_resize("dev", image, 50, 50)
+    assert resize.call_count == 4
+
+    # The hash of the image is used when it is known
+    image_hash = hashlib.sha256(image).hexdigest()
+    assert await thumbnails.async_resize("dev", image, 50, 50, image_hash) is not None
+    assert resize.call_count == 4
+
+    # An image that can't be decoded is served as is
+    assert await thumbnails.async_resize("dev", b"not an image", 50, 50) == (
+        b"not an image"
+    )
@@ -0,0 +1,82 @@
+"""Test SkyBellGen shared activity transcodes."""
+
+# pylint: disable=protected-access
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from custom_components.skybellgen.const import MAX_TRANSCODE_BACKLOG
+from custom_components.skybellgen.transcode import SkybellSharedTranscode
+
+
+def get_stream(opened: bool = True) -> tuple[Mock, asyncio.StreamReader]:
+    """Return a stream like a haffmpeg CameraMjpeg with its output."""
+    output = asyncio.StreamReader()
+    stream = Mock()
+    stream.open_camera = AsyncMock(return_value=opened)
+    stream.get_reader = AsyncMock(return_value=output)
+    stream.close = AsyncMock()
+    return stream, output
+
+
+async def test_shared_transcode(hass):
+    """Test the transcode is fanned out to its clients."""
+    stream, output = get_stream()
+    transcode = SkybellSharedTranscode(hass, "video", stream, "url", "-r 210")
+
+    # Clients share one transcode
+    first = transcode.subscribe()
+    second = transcode.subscribe()
+    assert transcode.clients == 2
+    output.feed_data(b"frame")
+    assert await first.read(10) == b"frame"
+    assert await second.read(10) == b"frame"
+    stream.open_camera.assert_awaited_once_with("url", extra_cmd="-r 210")
+
+    # A client that leaves doesn't stop the transcode
+    transcode.unsubscribe(second)
+    output.feed_data(b"next")
+    assert await first.read() == b"next"
+    assert transcode.active
+
+    # The end of the transcode ends the clients
+    output.feed_eof()
+    assert await first.read() == b""
+    await hass.async_block_till_done()
+    assert not transcode.active
+    assert transcode.clients == 0
+    stream.close.assert_awaited_once()
+
+    # A client of an ended transcode is ended
+    assert await transcode.subscribe().read() == b""
+
+
+async def test_shared_transcode_stop(hass):
+    """Test the transcode stops after its last client and drops slow clients."""
+    stream, output = get_stream()
+    transcode = SkybellSharedTranscode(hass, "video", stream, "url", "")
+
+    slow = transcode.subscribe()
+    fast = transcode.subscribe()
+    for _ in range(MAX_TRANSCODE_BACKLOG + 1):
+        output.feed_data(b"frame")
+        await fast.read()
+    assert transcode.clients == 1
+    assert await slow.read() == b""
+
+    transcode.unsubscribe(fast)
+    assert not transcode.active
+    await hass.async_block_till_done()
+    stream.close.assert_awaited_once()
+
+
+async def test_shared_transcode_failed(hass):
+    """Test the clients are ended when the transcode fails to start."""
+    stream, _ = get_stream(opened=False)
+    transcode = SkybellSharedTranscode(hass, "video", stream, "", "")
+
+    reader = transcode.subscribe()
+    assert await reader.read() == b""
+    await hass.async_block_till_done()
+    stream.get_reader.assert_not_awaited()
+    stream.close.assert_awaited_once()